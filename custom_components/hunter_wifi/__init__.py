@@ -2,25 +2,79 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
+from .api import HunterApiError, HunterCapabilities, HunterClient
 from .const import (
     CONF_DEVICE_NAME,
+    CONF_ET_ENTITY,
+    CONF_FIRE_AND_FORGET,
     CONF_HOST,
+    CONF_MAX_RUNNING_ZONES,
+    CONF_PROGRAM_COUNT,
     CONF_PROGRAMS,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_STOP_TIMEOUT,
+    CONF_ZONE_COUNT,
     CONF_ZONES,
+    DATA_ORCHESTRATOR,
+    DATA_SCHEDULE,
+    DATA_WATCHDOG,
     DEFAULT_DEVICE_NAME,
-    DEFAULT_ZONE_DURATION_MINUTES,
+    DEFAULT_FIRE_AND_FORGET,
+    DEFAULT_MAX_RUNNING_ZONES,
+    DEFAULT_PROGRAM_COUNT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STOP_TIMEOUT,
+    DEFAULT_ZONE_COUNT,
     DOMAIN,
 )
+from .coordinator import HunterStatusCoordinator
+from .entity import HunterDeviceMeta, HunterEntity
+from .health import HunterHealth, HunterHealthWatchdog
+from .journal import HunterCommandJournal
+from .orchestrator import HunterHydraulicOrchestrator
+from .programs import HunterProgramCache
+from .push import HunterPushListener
+from .resilience import CircuitState
+from .results import HunterCommandResults
+from .runstate import HunterRunState
+from .scaling import HunterDurationScaler
+from .schedule import HunterScheduleIndex
+from .scheduler import HunterCommandScheduler
+from .sequence import HunterSequenceRunner
+from .services import async_setup_services
+from .water import HunterWaterMeter
+from .zone_settings import HunterZoneSettings
+
+LOGGER = logging.getLogger(__name__)
+
+PLATFORMS = ["binary_sensor", "button", "calendar", "number", "sensor"]
+# Platforms holding only per-zone entities, skipped while no zone is selected.
+ZONE_PLATFORMS = frozenset({"number"})
 
-PLATFORMS = ["button", "number"]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def _platforms(zones: list[int]) -> list[str]:
+    """Return platforms that have entities for the selected zones."""
+    if zones:
+        return PLATFORMS
+    return [platform for platform in PLATFORMS if platform not in ZONE_PLATFORMS]
 
 
 def _normalize_int_list(raw_values: Iterable[int] | None) -> list[int]:
@@ -30,6 +84,15 @@ def _normalize_int_list(raw_values: Iterable[int] | None) -> list[int]:
     return sorted({int(value) for value in raw_values})
 
 
+async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
+    """Set up Hunter WiFi services and state shared by all controllers."""
+    hass.data[DATA_ORCHESTRATOR] = HunterHydraulicOrchestrator(hass)
+    hass.data[DATA_SCHEDULE] = HunterScheduleIndex()
+    hass.data[DATA_WATCHDOG] = HunterHealthWatchdog(hass)
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Hunter WiFi from config entry."""
     device_name = entry.options.get(
@@ -44,27 +107,270 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.options.get(CONF_PROGRAMS, entry.data.get(CONF_PROGRAMS, []))
     )
 
+    client = HunterClient(host)
+    capabilities = _cached_capabilities(entry)
+    zones, programs = _supported(capabilities, zones, programs)
+    scheduler = HunterCommandScheduler(
+        client,
+        stop_timeout=entry.options.get(CONF_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT),
+        rate_limit=entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        rate_burst=entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+    )
+    coordinator = HunterStatusCoordinator(hass, entry, client)
+    run_state = HunterRunState(hass)
+    results = HunterCommandResults(hass, entry.entry_id)
+    orchestrator: HunterHydraulicOrchestrator = hass.data[DATA_ORCHESTRATOR]
+    sequence = HunterSequenceRunner(hass, entry, orchestrator)
+    journal = HunterCommandJournal(hass, entry, orchestrator, run_state)
+    await journal.async_load()
+    settings = HunterZoneSettings(hass, entry.entry_id)
+    await settings.async_load()
+    programs_cache = HunterProgramCache(
+        hass, entry.entry_id, client, hass.data[DATA_SCHEDULE]
+    )
+    await programs_cache.async_load()
+    meter = HunterWaterMeter(
+        hass,
+        entry.entry_id,
+        run_state,
+        settings,
+        DEFAULT_ZONE_COUNT if capabilities is None else capabilities.zones,
+    )
+    await meter.async_load()
+    health = HunterHealth(hass, entry.entry_id, device_name, client)
+    scaler = HunterDurationScaler(hass, settings, entry.options.get(CONF_ET_ENTITY))
+    platforms = _platforms(zones)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "meta": HunterDeviceMeta.from_entry(entry.entry_id, device_name, host),
+        "reload_options": _reload_options(entry),
+        "entities": [],
+        "entity_adders": [],
         CONF_DEVICE_NAME: device_name,
         CONF_HOST: host,
         CONF_ZONES: zones,
         CONF_PROGRAMS: programs,
-        "zone_durations": dict.fromkeys(zones, DEFAULT_ZONE_DURATION_MINUTES),
+        "capabilities": capabilities,
+        CONF_FIRE_AND_FORGET: entry.options.get(
+            CONF_FIRE_AND_FORGET, DEFAULT_FIRE_AND_FORGET
+        ),
+        "zone_settings": settings,
+        "duration_scaler": scaler,
+        "client": client,
+        "scheduler": scheduler,
+        "coordinator": coordinator,
+        "run_state": run_state,
+        "results": results,
+        "sequence": sequence,
+        "journal": journal,
+        "programs": programs_cache,
+        "water": meter,
+        "health": health,
+        "platforms": platforms,
     }
+    for handler in (run_state, results, journal, sequence):
+        entry.async_on_unload(scheduler.add_listener(handler.async_handle_command))
+    entry.async_on_unload(scheduler.add_skip_listener(results.async_handle_skipped))
+    entry.async_on_unload(run_state.async_shutdown)
+    entry.async_on_unload(scaler.async_start())
+    entry.async_on_unload(programs_cache.async_start())
+    entry.async_on_unload(meter.async_start())
+    entry.async_on_unload(hass.data[DATA_WATCHDOG].async_register(health))
+    entry.async_on_unload(
+        orchestrator.async_register(
+            entry,
+            run_state,
+            scheduler,
+            entry.options.get(CONF_MAX_RUNNING_ZONES, DEFAULT_MAX_RUNNING_ZONES),
+        )
+    )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    @callback
+    def _async_reconcile_run_state() -> None:
+        if coordinator.last_update_success and coordinator.data is not None:
+            run_state.async_reconcile(coordinator.data)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_reconcile_run_state))
+    entry.async_create_background_task(
+        hass, scheduler.async_run(), f"{DOMAIN} {host} command scheduler"
+    )
+    push = HunterPushListener(
+        host, coordinator.async_push_status, coordinator.async_set_push_connected
+    )
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    entry.async_create_background_task(
+        hass, _async_start_entry(hass, entry, push), f"{DOMAIN} {host} startup"
+    )
+
+    @callback
+    def _async_breaker_changed() -> None:
+        # The breaker only closes again after the controller was unreachable.
+        if client.breaker.state is CircuitState.CLOSED:
+            journal.async_reconcile(restore=False)
+            sequence.async_handle_reconnect()
+
+    entry.async_on_unload(client.breaker.add_listener(_async_breaker_changed))
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_start_entry(
+    hass: HomeAssistant, entry: ConfigEntry, push: HunterPushListener
+) -> None:
+    """
+    Talk to the controller for the first time after setup.
+
+    Network I/O stays off the setup path so a slow or unreachable controller
+    does not hold up Home Assistant startup. Older firmware may not expose
+    status; entities then stay unavailable.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if entry_data["capabilities"] is None:
+        await _async_detect_capabilities(hass, entry, entry_data)
+    coordinator: HunterStatusCoordinator = entry_data["coordinator"]
+    journal: HunterCommandJournal = entry_data["journal"]
+    await coordinator.async_refresh()
+    await entry_data["sequence"].async_resume()
+    # Without a status report the journal is the best knowledge of runs.
+    journal.async_reconcile(restore=not coordinator.last_update_success)
+    await entry_data["programs"].async_refresh()
+    # Opened after the first poll, the controller serves one request at a time.
+    entry.async_create_background_task(
+        hass, push.async_run(), f"{DOMAIN} {push.host} push listener"
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Hunter WiFi config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry_data["platforms"]
+    )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["client"].async_close()
     return unload_ok
 
 
+def _cached_capabilities(entry: ConfigEntry) -> HunterCapabilities | None:
+    """Return capabilities detected by an earlier setup, None when unknown."""
+    if CONF_ZONE_COUNT not in entry.data:
+        return None
+    return HunterCapabilities(
+        entry.data[CONF_ZONE_COUNT],
+        entry.data.get(CONF_PROGRAM_COUNT, DEFAULT_PROGRAM_COUNT),
+        reported=True,
+    )
+
+
+def _supported(
+    capabilities: HunterCapabilities | None, zones: list[int], programs: list[int]
+) -> tuple[list[int], list[int]]:
+    """Drop zones and programs the controller lacks, keeping all while unknown."""
+    if capabilities is None:
+        return zones, programs
+    return (
+        [zone for zone in zones if zone <= capabilities.zones],
+        [program for program in programs if program <= capabilities.programs],
+    )
+
+
+async def _async_detect_capabilities(
+    hass: HomeAssistant, entry: ConfigEntry, entry_data: dict[str, Any]
+) -> None:
+    """
+    Detect and cache capabilities of a controller set up without them.
+
+    Caching updates the entry, and the update listener then drops selected
+    zones and programs the controller lacks. A failed detection keeps the
+    selection untouched and is retried on the next setup.
+    """
+    client: HunterClient = entry_data["client"]
+    try:
+        capabilities = await client.async_get_capabilities()
+    except HunterApiError as err:
+        LOGGER.debug("Capability detection for %s failed: %s", client.host, err)
+        return
+    entry_data["capabilities"] = capabilities
+    hass.config_entries.async_update_entry(
+        entry,
+        data={
+            **entry.data,
+            CONF_ZONE_COUNT: capabilities.zones,
+            CONF_PROGRAM_COUNT: capabilities.programs,
+        },
+    )
+
+
+def _reload_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Return settings whose change requires a full entry reload."""
+    options = {
+        key: value
+        for key, value in entry.options.items()
+        if key not in (CONF_ZONES, CONF_PROGRAMS)
+    }
+    options[CONF_DEVICE_NAME] = entry.options.get(
+        CONF_DEVICE_NAME,
+        entry.data.get(CONF_DEVICE_NAME, DEFAULT_DEVICE_NAME),
+    )
+    options[CONF_HOST] = entry.options.get(CONF_HOST, entry.data[CONF_HOST])
+    return options
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload integration when options are updated."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply updated options, reloading only when zones/programs are not enough."""
+    entry_data = hass.data[DOMAIN].get(entry.entry_id)
+    if entry_data is None or _reload_options(entry) != entry_data["reload_options"]:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    zones, programs = _supported(
+        entry_data["capabilities"],
+        _normalize_int_list(
+            entry.options.get(CONF_ZONES, entry.data.get(CONF_ZONES, []))
+        ),
+        _normalize_int_list(
+            entry.options.get(CONF_PROGRAMS, entry.data.get(CONF_PROGRAMS, []))
+        ),
+    )
+    _async_apply_selection(hass, entry_data, zones, programs)
+    # A skipped platform is set up once it has entities; it then adds the
+    # entities of all selected zones itself. Loaded platforms stay loaded.
+    loaded: list[str] = entry_data["platforms"]
+    if missing := [
+        platform for platform in _platforms(zones) if platform not in loaded
+    ]:
+        entry_data["platforms"] = [*loaded, *missing]
+        await hass.config_entries.async_forward_entry_setups(entry, missing)
+
+
+@callback
+def _async_apply_selection(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    zones: list[int],
+    programs: list[int],
+) -> None:
+    """Add and remove only the entities of changed zones and programs."""
+    old_zones = set(entry_data[CONF_ZONES])
+    old_programs = set(entry_data[CONF_PROGRAMS])
+    removed_zones = old_zones - set(zones)
+    removed_programs = old_programs - set(programs)
+
+    registry = er.async_get(hass)
+    kept: list[HunterEntity] = []
+    for entity in entry_data["entities"]:
+        if entity.zone in removed_zones or entity.program in removed_programs:
+            if entity.entity_id and registry.async_get(entity.entity_id):
+                registry.async_remove(entity.entity_id)
+        else:
+            kept.append(entity)
+    entry_data["entities"] = kept
+
+    entry_data[CONF_ZONES] = zones
+    entry_data[CONF_PROGRAMS] = programs
+
+    added_zones = [zone for zone in zones if zone not in old_zones]
+    added_programs = [program for program in programs if program not in old_programs]
+    if added_zones or added_programs:
+        for async_add in entry_data["entity_adders"]:
+            async_add(added_zones, added_programs)
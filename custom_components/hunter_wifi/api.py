@@ -0,0 +1,494 @@
+"""HTTP client for the Hunter WiFi controller API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import time as dt_time
+from datetime import timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .const import (
+    DEFAULT_PROGRAM_COUNT,
+    DEFAULT_STOP_TIMEOUT,
+    DEFAULT_ZONE_COUNT,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    REQUEST_TIMEOUT,
+    RETRY_ATTEMPTS,
+    STOP_ALL_BUDGET_SHARE,
+    STOP_ALL_MAX_BUDGET,
+)
+from .metrics import HunterMetrics, RequestSample
+from .resilience import CircuitBreaker, backoff_delay
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+def _command_type(path: str) -> str:
+    """Return command type label for API path, e.g. ``start_zone``."""
+    parts = path.strip("/").split("/")
+    return "_".join(parts[1:3]) if parts[0] == "api" else parts[0]
+
+
+class HunterApiError(Exception):
+    """Raised when a request to the Hunter controller fails."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize error with optional HTTP status."""
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def retryable(self) -> bool:
+        """Return True for transport and server errors worth retrying."""
+        return self.status is None or self.status >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+class HunterCircuitOpenError(HunterApiError):
+    """Raised without contacting the controller while its breaker is open."""
+
+
+@dataclass(slots=True)
+class StopZonesResult:
+    """Outcome of stopping several zones at once."""
+
+    succeeded: list[int] = field(default_factory=list)
+    failed: dict[int, str] = field(default_factory=dict)
+    stop_all_used: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Return True when every zone was stopped."""
+        return not self.failed
+
+
+class HunterStopZonesError(HunterApiError):
+    """Reported to command listeners when some zones could not be stopped."""
+
+    def __init__(self, result: StopZonesResult) -> None:
+        """Initialize error from the partial stop result."""
+        super().__init__(f"Failed to stop zones: {result.failed}")
+        self.result = result
+
+
+@dataclass(slots=True)
+class HunterStatus:
+    """Controller run state reported by the status endpoint."""
+
+    active_zone: int | None = None
+    remaining: int | None = None
+    active_program: int | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Return True when a zone or program is running."""
+        return self.active_zone is not None or self.active_program is not None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HunterStatus:
+        """
+        Parse status payload.
+
+        Expected shape is ``{"zone": 2, "remaining": 180, "program": null}``
+        where ``remaining`` is in seconds and idle fields are null or 0.
+        """
+
+        def _optional_int(key: str) -> int | None:
+            value = data.get(key)
+            if value in (None, "", 0, False):
+                return None
+            return int(value)
+
+        return cls(
+            active_zone=_optional_int("zone"),
+            remaining=_optional_int("remaining"),
+            active_program=_optional_int("program"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HunterCapabilities:
+    """Zone and program counts supported by a controller."""
+
+    zones: int = DEFAULT_ZONE_COUNT
+    programs: int = DEFAULT_PROGRAM_COUNT
+    reported: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HunterCapabilities:
+        """
+        Parse capabilities payload.
+
+        Expected shape is ``{"zones": 16, "programs": 4}``.
+        """
+        return cls(
+            zones=int(data["zones"]), programs=int(data["programs"]), reported=True
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HunterProgram:
+    """Stored watering schedule of a controller program."""
+
+    program: int
+    start_times: tuple[dt_time, ...]
+    # Weekdays with Monday as 0; a program without days runs daily.
+    days: frozenset[int] = frozenset()
+    # (zone, minutes) in run order.
+    zones: tuple[tuple[int, int], ...] = ()
+
+    @property
+    def duration(self) -> timedelta:
+        """Return run time of one program cycle."""
+        return timedelta(minutes=sum(minutes for _, minutes in self.zones))
+
+    def runs_on(self, weekday: int) -> bool:
+        """Return True when the program runs on weekday."""
+        return not self.days or weekday in self.days
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HunterProgram:
+        """
+        Parse program payload.
+
+        Expected shape is ``{"id": 1, "start_times": ["06:00"], "days": [0, 3],
+        "zones": [{"zone": 1, "duration": 10}]}`` with durations in minutes.
+        """
+        return cls(
+            program=int(data["id"]),
+            start_times=tuple(
+                sorted(dt_time.fromisoformat(value) for value in data["start_times"])
+            ),
+            days=frozenset(int(day) % 7 for day in data.get("days") or ()),
+            zones=tuple(
+                (int(item["zone"]), int(item["duration"]))
+                for item in data.get("zones") or ()
+            ),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return payload in the shape parsed by from_dict."""
+        return {
+            "id": self.program,
+            "start_times": [value.isoformat("minutes") for value in self.start_times],
+            "days": sorted(self.days),
+            "zones": [
+                {"zone": zone, "duration": minutes} for zone, minutes in self.zones
+            ],
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class HunterResponse:
+    """Status, entity tag and body of a controller response."""
+
+    status: int
+    etag: str | None
+    body: bytes
+
+
+class HunterClient:
+    """
+    Async client bound to a single Hunter controller host.
+
+    The ESP based controllers handle one request at a time, so the client owns
+    a dedicated connector limited to a single keep-alive connection. Requests
+    issued concurrently queue on that connection instead of opening new sockets.
+    """
+
+    def __init__(self, host: str, request_timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize client for controller host."""
+        self._host = host
+        self._base_url = f"http://{host}"
+        self._timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self._session: aiohttp.ClientSession | None = None
+        self._stop_all_supported: bool | None = None
+        self._breaker = CircuitBreaker()
+        self._metrics = HunterMetrics()
+        self._busy = 0
+        self._answered_at: float | None = None
+
+    @property
+    def host(self) -> str:
+        """Return controller host."""
+        return self._host
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Return circuit breaker guarding this host."""
+        return self._breaker
+
+    @property
+    def metrics(self) -> HunterMetrics:
+        """Return request metrics for this host."""
+        return self._metrics
+
+    @property
+    def busy(self) -> bool:
+        """Return True while a request waits for or uses the connection."""
+        return self._busy > 0
+
+    @property
+    def answered_at(self) -> float | None:
+        """Return monotonic time of the controller's last answer below 500."""
+        return self._answered_at
+
+    @property
+    def base_url(self) -> str:
+        """Return controller base URL."""
+        return self._base_url
+
+    async def async_start_zone(self, zone: int, minutes: int) -> None:
+        """Start a zone for the given number of minutes."""
+        await self.async_request(
+            f"/api/start/zone/{zone}", {"time": minutes}, retries=0
+        )
+
+    async def async_stop_zone(self, zone: int) -> None:
+        """Stop a zone."""
+        await self.async_request(f"/api/stop/zone/{zone}")
+
+    async def async_start_program(self, program: int) -> None:
+        """Start a program."""
+        await self.async_request(f"/api/start/program/{program}", retries=0)
+
+    async def async_get_status(self) -> HunterStatus:
+        """Fetch current controller run state."""
+        body = await self.async_request("/api/status")
+        try:
+            return HunterStatus.from_dict(json.loads(body))
+        except (ValueError, TypeError, AttributeError) as err:
+            msg = f"Invalid status payload from {self._host}: {body[:64]!r}"
+            raise HunterApiError(msg) from err
+
+    async def async_get_capabilities(self) -> HunterCapabilities:
+        """
+        Fetch supported zone and program counts.
+
+        Firmware without the capabilities endpoint gets the classic limits.
+        """
+        try:
+            body = await self.async_request("/api/capabilities")
+        except HunterApiError as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                return HunterCapabilities()
+            raise
+        try:
+            return HunterCapabilities.from_dict(json.loads(body))
+        except (ValueError, TypeError, KeyError, AttributeError) as err:
+            msg = f"Invalid capabilities payload from {self._host}: {body[:64]!r}"
+            raise HunterApiError(msg) from err
+
+    async def async_get_programs(
+        self, etag: str | None = None
+    ) -> tuple[list[HunterProgram], str | None] | None:
+        """
+        Fetch program schedules and their entity tag.
+
+        With ``etag`` the request is conditional and None is returned while
+        the programs are unchanged. Firmware without the programs endpoint
+        reports no programs.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        try:
+            response = await self.async_fetch("/api/programs", headers=headers)
+        except HunterApiError as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                return [], None
+            raise
+        if response.status == HTTPStatus.NOT_MODIFIED:
+            return None
+        try:
+            programs = [
+                HunterProgram.from_dict(item)
+                for item in json.loads(response.body)["programs"]
+            ]
+        except (ValueError, TypeError, KeyError, AttributeError) as err:
+            msg = f"Invalid programs payload from {self._host}: {response.body[:64]!r}"
+            raise HunterApiError(msg) from err
+        return programs, response.etag
+
+    async def async_stop_zones(
+        self,
+        zones: Iterable[int],
+        deadline: float = DEFAULT_STOP_TIMEOUT,
+    ) -> StopZonesResult:
+        """
+        Stop zones as fast as the controller allows.
+
+        Firmware exposing a device-side stop-all endpoint is stopped in a single
+        round-trip. That attempt gets only a slice of ``deadline``, so the rest
+        is left for stopping the zones one by one when it fails. The session
+        carries one request at a time, so per-zone stops are sent in order and
+        anything unfinished after ``deadline`` seconds is reported as failed.
+        """
+        zones = list(zones)
+        result = StopZonesResult()
+        if not zones:
+            return result
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        if self._stop_all_supported is not False:
+            try:
+                async with asyncio.timeout(
+                    min(deadline * STOP_ALL_BUDGET_SHARE, STOP_ALL_MAX_BUDGET)
+                ):
+                    await self.async_request("/api/stop/all", retries=0)
+            except HunterApiError as err:
+                if err.status == HTTPStatus.NOT_FOUND:
+                    self._stop_all_supported = False
+            except TimeoutError:
+                pass
+            else:
+                self._stop_all_supported = True
+                result.succeeded = zones
+                result.stop_all_used = True
+                return result
+
+        for index, zone in enumerate(zones):
+            if (remaining := expires_at - loop.time()) <= 0:
+                result.failed.update(dict.fromkeys(zones[index:], "deadline exceeded"))
+                break
+            try:
+                async with asyncio.timeout(remaining):
+                    await self.async_stop_zone(zone)
+            except TimeoutError:
+                result.failed[zone] = "deadline exceeded"
+            except HunterApiError as err:
+                result.failed[zone] = str(err)
+            else:
+                result.succeeded.append(zone)
+        return result
+
+    async def async_request(
+        self,
+        path: str,
+        params: Mapping[str, int | str] | None = None,
+        retries: int = RETRY_ATTEMPTS,
+    ) -> bytes:
+        """Perform GET request against controller and return response body."""
+        return (await self.async_fetch(path, params, retries)).body
+
+    async def async_fetch(
+        self,
+        path: str,
+        params: Mapping[str, int | str] | None = None,
+        retries: int = RETRY_ATTEMPTS,
+        headers: Mapping[str, str] | None = None,
+    ) -> HunterResponse:
+        """
+        Perform GET request against controller and return the response.
+
+        Transport and server errors are retried up to ``retries`` times with
+        jittered exponential backoff. Starts pass no retries: a timeout does
+        not prove the controller ignored them, and a repeated start would
+        restart a running program. While the circuit breaker is open the
+        request fails immediately with HunterCircuitOpenError.
+        """
+        command = _command_type(path)
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                response = await self._async_request_once(path, params, headers)
+            except HunterCircuitOpenError:
+                self._metrics.rejected += 1
+                raise
+            except HunterApiError as err:
+                if attempt >= retries or not err.retryable:
+                    self._record(command, started, err.status, attempt, 0)
+                    raise
+            else:
+                self._record(
+                    command, started, response.status, attempt, len(response.body)
+                )
+                return response
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    def _record(
+        self, command: str, started: float, status: int | None, retries: int, size: int
+    ) -> None:
+        """Record instrumented request."""
+        self._metrics.record(
+            RequestSample(
+                command=command,
+                started_at=started,
+                finished_at=time.monotonic(),
+                status=status,
+                retries=retries,
+                size=size,
+                ok=status is not None and status < HTTPStatus.BAD_REQUEST,
+            )
+        )
+
+    async def _async_request_once(
+        self,
+        path: str,
+        params: Mapping[str, int | str] | None,
+        headers: Mapping[str, str] | None = None,
+    ) -> HunterResponse:
+        """Perform a single GET request guarded by the circuit breaker."""
+        url = f"{self._base_url}{path}"
+        if not self._breaker.allow_request():
+            msg = f"Controller {self._host} is unreachable, circuit breaker is open"
+            raise HunterCircuitOpenError(msg)
+
+        session = self._get_session()
+        self._busy += 1
+        try:
+            async with session.get(url, params=params, headers=headers) as response:
+                response.raise_for_status()
+                # Reading the body lets the connection return to the pool.
+                result = HunterResponse(
+                    response.status, response.headers.get("ETag"), await response.read()
+                )
+        except aiohttp.ClientResponseError as err:
+            if err.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+                self._answered_at = time.monotonic()
+            msg = f"Request to {url} failed with status {err.status}"
+            raise HunterApiError(msg, err.status) from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            self._breaker.record_failure()
+            msg = f"Request to {url} failed: {err!r}"
+            raise HunterApiError(msg) from err
+        except BaseException:
+            self._breaker.release()
+            raise
+        finally:
+            self._busy -= 1
+        self._breaker.record_success()
+        self._answered_at = time.monotonic()
+        return result
+
+    async def async_close(self) -> None:
+        """Close the underlying session and connector."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return session, creating the pooled connector on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=1,
+                limit_per_host=1,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
+        return self._session
@@ -0,0 +1,134 @@
+"""Binary sensor entities for Hunter WiFi."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import EntityCategory
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import CONF_ZONES, DOMAIN
+from .entity import HunterDeviceMeta, HunterEntity
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .coordinator import HunterStatusCoordinator
+    from .health import HunterHealth
+    from .runstate import HunterRunState
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up controller status binary sensors."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    meta: HunterDeviceMeta = entry_data["meta"]
+    coordinator: HunterStatusCoordinator = entry_data["coordinator"]
+    run_state: HunterRunState = entry_data["run_state"]
+
+    @callback
+    def _async_add(zones: list[int], _programs: list[int]) -> None:
+        entities = [
+            HunterZoneRunningBinarySensor(meta, run_state, zone) for zone in zones
+        ]
+        entry_data["entities"].extend(entities)
+        async_add_entities(entities)
+
+    async_add_entities(
+        [
+            HunterWateringBinarySensor(meta, coordinator),
+            HunterConnectivityBinarySensor(meta, entry_data["health"]),
+        ]
+    )
+    _async_add(entry_data[CONF_ZONES], [])
+    entry_data["entity_adders"].append(_async_add)
+
+
+class HunterWateringBinarySensor(
+    CoordinatorEntity["HunterStatusCoordinator"], HunterEntity, BinarySensorEntity
+):
+    """Reports whether the controller is currently watering."""
+
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _attr_icon = "mdi:sprinkler-variant"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, coordinator: HunterStatusCoordinator
+    ) -> None:
+        """Initialize watering binary sensor."""
+        CoordinatorEntity.__init__(self, coordinator)
+        HunterEntity.__init__(self, meta, "watering", "Watering")
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True when a zone or program is running."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.is_running
+
+
+class HunterZoneRunningBinarySensor(HunterEntity, BinarySensorEntity):
+    """Reports whether a zone runs according to the local run-state model."""
+
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _attr_icon = "mdi:sprinkler"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, run_state: HunterRunState, zone: int
+    ) -> None:
+        """Initialize zone running binary sensor."""
+        super().__init__(meta, f"zone_{zone}_running", f"Zone {zone} Running", zone)
+        self._run_state = run_state
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to run-state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._run_state.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def is_on(self) -> bool:
+        """Return True while the zone is expected to run."""
+        return self._run_state.get(self.zone) is not None
+
+
+class HunterConnectivityBinarySensor(HunterEntity, BinarySensorEntity):
+    """Reports whether the controller answered the last health check."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, meta: HunterDeviceMeta, health: HunterHealth) -> None:
+        """Initialize connectivity binary sensor."""
+        super().__init__(meta, "connectivity", "Connectivity")
+        self._health = health
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to health check results."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._health.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True while the controller answers."""
+        return self._health.reachable
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return failure streak of the health checks."""
+        failing_since = self._health.failing_since
+        return {
+            "consecutive_failures": self._health.failures,
+            "failing_since": failing_since.isoformat() if failing_since else None,
+        }
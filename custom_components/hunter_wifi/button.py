@@ -3,188 +3,208 @@
 from __future__ import annotations
 
 import logging
-from asyncio import timeout
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-import aiohttp
 from homeassistant.components.button import ButtonEntity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.util import slugify
-
-from .const import CONF_DEVICE_NAME, CONF_HOST, CONF_PROGRAMS, CONF_ZONES, DOMAIN
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .api import HunterApiError
+from .const import (
+    CONF_FIRE_AND_FORGET,
+    CONF_PROGRAMS,
+    CONF_ZONES,
+    DATA_ORCHESTRATOR,
+    DOMAIN,
+)
+from .entity import HunterDeviceMeta, HunterEntity
+from .scheduler import HunterCommand
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .api import StopZonesResult
+    from .coordinator import HunterStatusCoordinator
+    from .orchestrator import HunterHydraulicOrchestrator
+    from .scaling import HunterDurationScaler
+
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class HunterButtonDescription:
+    """Static description of an action button."""
+
+    key: str
+    name: str
+    action: str
+    icon: str
+    zone: int | None = None
+    program: int | None = None
+
+
+@cache
+def _zone_descriptions(zone: int) -> tuple[HunterButtonDescription, ...]:
+    """Return start/stop descriptions for zone, shared across entries."""
+    return (
+        HunterButtonDescription(
+            key=f"start_zone_{zone}",
+            name=f"Start Zone {zone}",
+            action="start_zone",
+            icon="mdi:play-circle-outline",
+            zone=zone,
+        ),
+        HunterButtonDescription(
+            key=f"stop_zone_{zone}",
+            name=f"Stop Zone {zone}",
+            action="stop_zone",
+            icon="mdi:stop-circle-outline",
+            zone=zone,
+        ),
+    )
+
+
+@cache
+def _program_description(program: int) -> HunterButtonDescription:
+    """Return start description for program, shared across entries."""
+    return HunterButtonDescription(
+        key=f"start_program_{program}",
+        name=f"Start Program {program}",
+        action="start_program",
+        icon="mdi:play-circle-outline",
+        program=program,
+    )
+
+
+STOP_ALL_DESCRIPTION = HunterButtonDescription(
+    key="stop_all_zones",
+    name="Stop All Zones",
+    action="stop_all_zones",
+    icon="mdi:stop-circle-outline",
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up Hunter buttons for configured zones and programs."""
     entry_data = hass.data[DOMAIN][entry.entry_id]
-    device_name: str = entry_data[CONF_DEVICE_NAME]
-    host: str = entry_data[CONF_HOST]
-    zones: list[int] = entry_data[CONF_ZONES]
-    programs: list[int] = entry_data[CONF_PROGRAMS]
-    slug = slugify(device_name)
-
-    entities: list[HunterActionButton] = []
-    for zone in zones:
-        entities.append(
-            HunterActionButton(
-                hass,
-                entry,
-                device_name,
-                slug,
-                host,
-                "start_zone",
-                zone=zone,
-            )
-        )
-        entities.append(
-            HunterActionButton(
-                hass,
-                entry,
-                device_name,
-                slug,
-                host,
-                "stop_zone",
-                zone=zone,
-            )
-        )
-    entities.extend(
-        [
-            HunterActionButton(
-                hass,
-                entry,
-                device_name,
-                slug,
-                host,
-                "start_program",
-                program=program,
-            )
-            for program in programs
+    meta: HunterDeviceMeta = entry_data["meta"]
+
+    @callback
+    def _async_add(zones: list[int], programs: list[int]) -> None:
+        descriptions = [
+            description for zone in zones for description in _zone_descriptions(zone)
         ]
-    )
-    entities.append(
-        HunterActionButton(
-            hass,
-            entry,
-            device_name,
-            slug,
-            host,
-            "stop_all_zones",
-            zones=zones,
-        )
-    )
+        descriptions.extend(_program_description(program) for program in programs)
+        entities = [
+            HunterActionButton(meta, description) for description in descriptions
+        ]
+        entry_data["entities"].extend(entities)
+        async_add_entities(entities)
 
-    async_add_entities(entities)
+    _async_add(entry_data[CONF_ZONES], entry_data[CONF_PROGRAMS])
+    async_add_entities([HunterActionButton(meta, STOP_ALL_DESCRIPTION)])
+    entry_data["entity_adders"].append(_async_add)
 
 
-class HunterActionButton(ButtonEntity):
+class HunterActionButton(HunterEntity, ButtonEntity):
     """Stateless action button for Hunter API."""
 
-    _attr_should_poll = False
-    _attr_has_entity_name = True
-
     def __init__(
-        self,
-        hass: HomeAssistant,
-        config_entry: ConfigEntry,
-        device_name: str,
-        slug: str,
-        host: str,
-        action: str,
-        zone: int | None = None,
-        program: int | None = None,
-        zones: list[int] | None = None,
+        self, meta: HunterDeviceMeta, description: HunterButtonDescription
     ) -> None:
         """Initialize Hunter action button."""
-        self.hass = hass
-        self.config_entry = config_entry
-        self._device_name = device_name
-        self._slug = slug
-        self._host = host
-        self._action = action
-        self._zone = zone
-        self._program = program
-        self._zones = zones or []
-
-        if action == "stop_all_zones":
-            self._attr_unique_id = f"{action}_{config_entry.entry_id}"
-            self._attr_name = "Stop All Zones"
-            self._attr_suggested_object_id = f"{self._slug}_{action}"
-        elif zone is not None:
-            self._attr_unique_id = f"{action}_{zone}_{config_entry.entry_id}"
-            action_label = "Start" if action == "start_zone" else "Stop"
-            self._attr_name = f"{action_label} Zone {zone}"
-            self._attr_suggested_object_id = f"{self._slug}_{action}_{zone}"
-        else:
-            self._attr_unique_id = f"{action}_{program}_{config_entry.entry_id}"
-            self._attr_name = f"Start Program {program}"
-            self._attr_suggested_object_id = f"{self._slug}_{action}_{program}"
-
-        if action.startswith("start"):
-            self._attr_icon = "mdi:play-circle-outline"
-        else:
-            self._attr_icon = "mdi:stop-circle-outline"
+        super().__init__(
+            meta,
+            description.key,
+            description.name,
+            zone=description.zone,
+            program=description.program,
+        )
+        self._description = description
+        self._attr_icon = description.icon
 
     async def async_press(self) -> None:
         """Trigger start/stop action via Hunter HTTP API."""
-        session = async_get_clientsession(self.hass)
-        if self._action == "stop_all_zones":
-            await self._async_stop_all_zones(session)
+        entry_data = self.hass.data[DOMAIN][self._meta.entry_id]
+        command = self._build_command(entry_data)
+        if entry_data[CONF_FIRE_AND_FORGET]:
+            # The outcome is published as an event and on the last-command
+            # sensor once the per-host scheduler has sent the command. The task
+            # belongs to the entry, so unloading it cancels a pending dispatch.
+            entry = self.hass.config_entries.async_get_known_entry(self._meta.entry_id)
+            entry.async_create_background_task(
+                self.hass,
+                self._async_dispatch_detached(entry_data, command),
+                f"{DOMAIN} {self._meta.host} {command.action}",
+            )
             return
 
-        url = "unknown"
+        action = self._description.action
         try:
-            url = self._build_url()
-            async with timeout(10):
-                async with session.get(url) as response:
-                    response.raise_for_status()
-        except (aiohttp.ClientError, TimeoutError, ValueError):
-            LOGGER.exception("Failed Hunter request for %s", url)
-
-    async def _async_stop_all_zones(self, session: aiohttp.ClientSession) -> None:
-        """Stop all configured zones one by one."""
-        for zone in self._zones:
-            url = f"http://{self._host}/api/stop/zone/{zone}"
-            try:
-                async with timeout(10):
-                    async with session.get(url) as response:
-                        response.raise_for_status()
-            except (aiohttp.ClientError, TimeoutError):
-                LOGGER.exception("Failed Hunter request for %s", url)
-
-    def _build_url(self) -> str:
-        """Build API URL for current action."""
-        if self._zone is not None:
-            if self._action == "start_zone":
-                entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-                zone_durations: dict[int, int] = entry_data["zone_durations"]
-                duration = int(zone_durations.get(self._zone, 5))
-                return (
-                    f"http://{self._host}/api/start/zone/{self._zone}?time={duration}"
-                )
-            return f"http://{self._host}/api/stop/zone/{self._zone}"
-
-        if self._action == "start_program":
-            return f"http://{self._host}/api/start/program/{self._program}"
-        msg = f"Unsupported action requested: {self._action}"
-        raise ValueError(msg)
+            result = await self._async_dispatch(entry_data, command)
+        except HunterApiError as err:
+            msg = f"Hunter {action} request to {self._meta.host} failed: {err}"
+            raise HomeAssistantError(msg) from err
+
+        if result is not None and result.failed:
+            msg = (
+                f"Failed to stop zones on {self._meta.host}: {result.failed} "
+                f"(stopped: {result.succeeded})"
+            )
+            raise HomeAssistantError(msg)
+
+    async def _async_dispatch(
+        self, entry_data: dict[str, Any], command: HunterCommand
+    ) -> StopZonesResult | None:
+        """Submit command and refresh controller status afterwards."""
+        orchestrator: HunterHydraulicOrchestrator = self.hass.data[DATA_ORCHESTRATOR]
+        outcome = await orchestrator.async_submit(self._meta.entry_id, command)
+        coordinator: HunterStatusCoordinator = entry_data["coordinator"]
+        await coordinator.async_request_refresh()
+        return None if outcome is None else outcome.result
+
+    async def _async_dispatch_detached(
+        self, entry_data: dict[str, Any], command: HunterCommand
+    ) -> None:
+        """Submit command without a caller waiting for the outcome."""
+        try:
+            result = await self._async_dispatch(entry_data, command)
+        except HunterApiError as err:
+            LOGGER.warning(
+                "Hunter %s request to %s failed: %s",
+                command.action,
+                self._meta.host,
+                err,
+            )
+            return
+        if result is not None and result.failed:
+            LOGGER.warning(
+                "Failed to stop zones on %s: %s (stopped: %s)",
+                self._meta.host,
+                result.failed,
+                result.succeeded,
+            )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return parent device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self._device_name,
-            manufacturer="Hunter",
-            model="WiFi Controller",
-            configuration_url=f"http://{self._host}",
-        )
+    def _build_command(self, entry_data: dict[str, Any]) -> HunterCommand:
+        """Build scheduler command for current action."""
+        action = self._description.action
+        if action == "stop_all_zones":
+            return HunterCommand(action, zones=tuple(entry_data[CONF_ZONES]))
+        if action == "start_zone" and self.zone is not None:
+            scaler: HunterDurationScaler = entry_data["duration_scaler"]
+            if not (minutes := scaler.duration(self.zone)):
+                msg = f"Zone {self.zone} needs no water at the current ET value"
+                raise HomeAssistantError(msg)
+            return HunterCommand(action, self.zone, minutes)
+        if action == "stop_zone":
+            return HunterCommand(action, self.zone)
+        if action == "start_program":
+            return HunterCommand(action, self.program)
+        msg = f"Unsupported action requested: {action}"
+        raise ValueError(msg)
@@ -0,0 +1,93 @@
+"""Calendar entities for Hunter WiFi."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SCHEDULE, DOMAIN
+from .entity import HunterDeviceMeta, HunterEntity
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .programs import HunterProgramCache
+    from .schedule import HunterScheduleIndex, ScheduledRun
+
+# Programs repeat weekly, so a week and a day always holds the next run.
+EVENT_LOOKAHEAD = timedelta(days=8)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the program calendar."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    meta: HunterDeviceMeta = entry_data["meta"]
+    async_add_entities(
+        [HunterProgramCalendar(meta, entry_data["programs"], hass.data[DATA_SCHEDULE])]
+    )
+
+
+def _event(run: ScheduledRun) -> CalendarEvent:
+    """Return calendar event for a program run."""
+    return CalendarEvent(
+        start=run.start,
+        end=run.end,
+        summary=f"Program {run.program.program}",
+        description=", ".join(
+            f"Zone {zone}: {minutes} min" for zone, minutes in run.program.zones
+        ),
+        uid=f"{run.entry_id}_{run.program.program}_{run.start.isoformat()}",
+    )
+
+
+class HunterProgramCalendar(HunterEntity, CalendarEntity):
+    """Program runs of the controller, expanded from the cached schedules."""
+
+    _attr_icon = "mdi:calendar-clock"
+
+    def __init__(
+        self,
+        meta: HunterDeviceMeta,
+        programs: HunterProgramCache,
+        index: HunterScheduleIndex,
+    ) -> None:
+        """Initialize program calendar."""
+        super().__init__(meta, "programs", "Programs")
+        self._programs = programs
+        self._index = index
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to program changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._programs.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next program run."""
+        now = dt_util.now()
+        runs = self._index.runs(self._meta.entry_id, now, now + EVENT_LOOKAHEAD)
+        return _event(runs[0]) if runs else None
+
+    async def async_get_events(
+        self, _hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return program runs between start_date and end_date."""
+        runs = self._index.runs(
+            self._meta.entry_id,
+            dt_util.as_local(start_date),
+            dt_util.as_local(end_date),
+        )
+        return [_event(run) for run in runs]
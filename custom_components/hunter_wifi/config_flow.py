@@ -7,55 +7,86 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .api import HunterCapabilities
 from .const import (
     CONF_DEVICE_NAME,
     CONF_HOST,
+    CONF_NETWORK,
+    CONF_PROGRAM_COUNT,
     CONF_PROGRAMS,
+    CONF_ZONE_COUNT,
     CONF_ZONES,
     DEFAULT_DEVICE_NAME,
     DOMAIN,
-    MAX_PROGRAM,
-    MAX_ZONE,
 )
+from .discovery import async_probe, async_scan, hosts_from_network
 from .options_flow import HunterWifiOptionsFlow
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
+    from homeassistant.helpers.service_info.dhcp import DhcpServiceInfo
+    from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 
-def _selected_from_input(
-    user_input: dict[str, Any], prefix: str, max_value: int
-) -> list[int]:
-    """Convert checkbox values to list of selected numeric ids."""
-    return [
-        value
-        for value in range(1, max_value + 1)
-        if user_input.get(f"{prefix}_{value}", False)
-    ]
+def _id_selector(count: int, label: str) -> selector.SelectSelector:
+    """Return multi-select of ids ``1..count``."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                selector.SelectOptionDict(value=str(value), label=f"{label} {value}")
+                for value in range(1, count + 1)
+            ],
+            multiple=True,
+            mode=selector.SelectSelectorMode.LIST,
+        )
+    )
+
+
+def _selected_from_input(user_input: dict[str, Any], key: str, count: int) -> list[int]:
+    """Convert multi-select values to sorted list of valid numeric ids."""
+    return sorted(
+        {int(value) for value in user_input.get(key, []) if 1 <= int(value) <= count}
+    )
 
 
 def _build_schema(defaults: dict[str, Any] | None = None) -> vol.Schema:
-    """Build config flow schema."""
+    """Build controller address schema."""
     data = defaults or {}
-    schema: dict[vol.Marker, object] = {
-        vol.Required(
-            CONF_DEVICE_NAME,
-            default=data.get(CONF_DEVICE_NAME, DEFAULT_DEVICE_NAME),
-        ): str,
-        vol.Required(CONF_HOST, default=data.get(CONF_HOST, "")): str,
-    }
-    for zone in range(1, MAX_ZONE + 1):
-        schema[vol.Optional(f"zone_{zone}", default=data.get(f"zone_{zone}", True))] = (
-            bool
-        )
-    for program in range(1, MAX_PROGRAM + 1):
-        schema[
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_DEVICE_NAME,
+                default=data.get(CONF_DEVICE_NAME, DEFAULT_DEVICE_NAME),
+            ): str,
+            vol.Required(CONF_HOST, default=data.get(CONF_HOST, "")): str,
+        }
+    )
+
+
+def _build_selection_schema(capabilities: HunterCapabilities) -> vol.Schema:
+    """Build zone/program selection schema sized to the controller."""
+    return vol.Schema(
+        {
             vol.Optional(
-                f"program_{program}", default=data.get(f"program_{program}", True)
-            )
-        ] = bool
-    return vol.Schema(schema)
+                CONF_ZONES,
+                default=[str(zone) for zone in range(1, capabilities.zones + 1)],
+            ): _id_selector(capabilities.zones, "Zone"),
+            vol.Optional(
+                CONF_PROGRAMS,
+                default=[
+                    str(program) for program in range(1, capabilities.programs + 1)
+                ],
+            ): _id_selector(capabilities.programs, "Program"),
+        }
+    )
+
+
+def _describe(host: str, capabilities: HunterCapabilities) -> str:
+    """Return selector label for a discovered controller."""
+    return f"{host} ({capabilities.zones} zones, {capabilities.programs} programs)"
 
 
 class HunterWifiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -64,6 +95,13 @@ class HunterWifiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    def __init__(self) -> None:
+        """Initialize flow."""
+        self._host: str | None = None
+        self._device_name = DEFAULT_DEVICE_NAME
+        self._capabilities = HunterCapabilities()
+        self._discovered: dict[str, HunterCapabilities] = {}
+
     @staticmethod
     def async_get_options_flow(
         config_entry: config_entries.ConfigEntry,
@@ -72,9 +110,98 @@ class HunterWifiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return HunterWifiOptionsFlow(config_entry)
 
     async def async_step_user(
+        self, _user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user scan the network or enter an address."""
+        return self.async_show_menu(step_id="user", menu_options=["scan", "manual"])
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Probe every address of a network for controllers."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                hosts = hosts_from_network(user_input[CONF_NETWORK])
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                configured = self._async_current_ids()
+                found = await async_scan(
+                    async_get_clientsession(self.hass),
+                    (host for host in hosts if host not in configured),
+                )
+                if found:
+                    self._discovered = found
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_NETWORK,
+                        default=(user_input or {}).get(CONF_NETWORK, ""),
+                    ): str
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Choose one of the discovered controllers."""
+        if user_input is not None:
+            self._host = user_input[CONF_HOST]
+            return await self.async_step_manual()
+
+        options = [
+            selector.SelectOptionDict(value=host, label=_describe(host, found))
+            for host, found in sorted(
+                self._discovered.items(),
+                key=lambda item: ipaddress.ip_address(item[0]),
+            )
+        ]
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): selector.SelectSelector(
+                        selector.SelectSelectorConfig(options=options)
+                    )
+                }
+            ),
+        )
+
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> FlowResult:
+        """Handle a controller announced over mDNS."""
+        return await self._async_step_discovered(discovery_info.host)
+
+    async def async_step_dhcp(self, discovery_info: DhcpServiceInfo) -> FlowResult:
+        """Handle a controller seen by DHCP."""
+        return await self._async_step_discovered(discovery_info.ip)
+
+    async def _async_step_discovered(self, host: str) -> FlowResult:
+        """Confirm a discovery hint by probing the host."""
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        if (
+            found := await async_probe(async_get_clientsession(self.hass), host)
+        ) is None:
+            return self.async_abort(reason="not_hunter_controller")
+        self._host = host
+        self._discovered = {host: found}
+        self.context["title_placeholders"] = {"name": _describe(host, found)}
+        return await self.async_step_manual()
+
+    async def async_step_manual(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle initial config step."""
+        """Handle controller name and address."""
         errors: dict[str, str] = {}
         if user_input is not None:
             device_name = user_input[CONF_DEVICE_NAME].strip()
@@ -86,27 +213,64 @@ class HunterWifiConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not device_name:
                 errors[CONF_DEVICE_NAME] = "required"
 
-            zones = _selected_from_input(user_input, "zone", MAX_ZONE)
-            programs = _selected_from_input(user_input, "program", MAX_PROGRAM)
-
-            if not zones and not programs:
-                errors["base"] = "select_at_least_one"
+            capabilities = self._discovered.get(host)
+            if not errors and capabilities is None:
+                capabilities = await async_probe(
+                    async_get_clientsession(self.hass), host
+                )
+                if capabilities is None:
+                    errors[CONF_HOST] = "cannot_connect"
 
-            if not errors:
+            if not errors and capabilities is not None:
                 await self.async_set_unique_id(host)
                 self._abort_if_unique_id_configured()
+                self._device_name = device_name
+                self._host = host
+                self._capabilities = capabilities
+                return await self.async_step_select()
+        elif self._host is not None:
+            user_input = {CONF_HOST: self._host}
+
+        return self.async_show_form(
+            step_id="manual",
+            data_schema=_build_schema(user_input),
+            errors=errors,
+        )
+
+    async def async_step_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select zones and programs offered by the controller."""
+        errors: dict[str, str] = {}
+        capabilities = self._capabilities
+        if user_input is not None and self._host is not None:
+            zones = _selected_from_input(user_input, CONF_ZONES, capabilities.zones)
+            programs = _selected_from_input(
+                user_input, CONF_PROGRAMS, capabilities.programs
+            )
+            if not zones and not programs:
+                errors["base"] = "select_at_least_one"
+            else:
                 return self.async_create_entry(
-                    title=device_name,
+                    title=self._device_name,
                     data={
-                        CONF_DEVICE_NAME: device_name,
-                        CONF_HOST: host,
+                        CONF_DEVICE_NAME: self._device_name,
+                        CONF_HOST: self._host,
                         CONF_ZONES: zones,
                         CONF_PROGRAMS: programs,
+                        CONF_ZONE_COUNT: capabilities.zones,
+                        CONF_PROGRAM_COUNT: capabilities.programs,
                     },
                 )
 
         return self.async_show_form(
-            step_id="user",
-            data_schema=_build_schema(user_input),
+            step_id="select",
+            data_schema=self.add_suggested_values_to_schema(
+                _build_selection_schema(capabilities), user_input
+            ),
             errors=errors,
+            description_placeholders={
+                "zones": str(capabilities.zones),
+                "programs": str(capabilities.programs),
+            },
         )
@@ -1,5 +1,6 @@
 """Constants for Hunter WiFi irrigation integration."""
 
+from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final = "hunter_wifi"
@@ -9,14 +10,99 @@ CONF_HOST: Final = "host"
 CONF_DEVICE_NAME: Final = "device_name"
 CONF_ZONES: Final = "zones"
 CONF_PROGRAMS: Final = "programs"
+CONF_NETWORK: Final = "network"
+CONF_ZONE_COUNT: Final = "zone_count"
+CONF_PROGRAM_COUNT: Final = "program_count"
+CONF_STOP_TIMEOUT: Final = "stop_timeout"
+CONF_MAX_RUNNING_ZONES: Final = "max_running_zones"
+CONF_FIRE_AND_FORGET: Final = "fire_and_forget"
+CONF_ET_ENTITY: Final = "et_entity"
+CONF_RATE_LIMIT: Final = "rate_limit"
+CONF_RATE_BURST: Final = "rate_burst"
 
 ATTR_ZONE: Final = "zone"
 ATTR_PROGRAM: Final = "program"
 ATTR_TIME: Final = "time"
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+ATTR_ZONES: Final = "zones"
+ATTR_DURATIONS: Final = "durations"
+ATTR_DURATION: Final = "duration"
+ATTR_ITEMS: Final = "items"
+
+SERVICE_RUN_SEQUENCE: Final = "run_sequence"
+SERVICE_START_ZONES: Final = "start_zones"
+SERVICE_STOP_ZONES: Final = "stop_zones"
+
+EVENT_COMMAND_RESULT: Final = f"{DOMAIN}_command_result"
+
+STORAGE_VERSION: Final = 1
+ZONE_SETTINGS_SAVE_DELAY: Final = 10
+JOURNAL_SAVE_DELAY: Final = 5
+JOURNAL_SIZE: Final = 200
+WATER_SAVE_DELAY: Final = 60
+
+DATA_ORCHESTRATOR: Final = f"{DOMAIN}_orchestrator"
+DATA_SCHEDULE: Final = f"{DOMAIN}_schedule"
+DATA_WATCHDOG: Final = f"{DOMAIN}_watchdog"
 
 DEFAULT_ZONE_DURATION_MINUTES: Final = 5
+MIN_ZONE_DURATION_MINUTES: Final = 1
+MAX_ZONE_DURATION_MINUTES: Final = 240
+DEFAULT_CROP_COEFFICIENT: Final = 1.0
+DEFAULT_PRECIPITATION_RATE: Final = 25.0
+# Daily ET for which the configured zone durations apply unscaled.
+REFERENCE_ET: Final = 5.0
+DEFAULT_FLOW_RATE: Final = 10.0
 DEFAULT_DEVICE_NAME: Final = "Hunter WiFi"
-MIN_ZONE = 1
-MAX_ZONE = 8
-MIN_PROGRAM = 1
-MAX_PROGRAM = 3
+DEFAULT_ZONE_COUNT: Final = 8
+DEFAULT_PROGRAM_COUNT: Final = 3
+
+REQUEST_TIMEOUT: Final = 10
+KEEPALIVE_TIMEOUT: Final = 30
+DNS_CACHE_TTL: Final = 300
+
+DISCOVERY_TIMEOUT: Final = 2.0
+DISCOVERY_CONCURRENCY: Final = 32
+DISCOVERY_MAX_HOSTS: Final = 1024
+
+DEFAULT_STOP_TIMEOUT: Final = 15
+STOP_ALL_BUDGET_SHARE: Final = 0.25
+STOP_ALL_MAX_BUDGET: Final = 2.0
+MAX_STOP_TIMEOUT: Final = 120
+DEFAULT_MAX_RUNNING_ZONES: Final = 0
+DEFAULT_FIRE_AND_FORGET: Final = False
+MAX_RUNNING_ZONES: Final = 64
+
+COMMAND_COALESCE_WINDOW: Final = 1.0
+DEFAULT_RATE_LIMIT: Final = 5.0
+DEFAULT_RATE_BURST: Final = 2
+MAX_RATE_LIMIT: Final = 50
+MAX_RATE_BURST: Final = 20
+
+ACTIVE_POLL_INTERVAL: Final = timedelta(seconds=2)
+IDLE_POLL_INTERVAL: Final = timedelta(minutes=5)
+PUSH_POLL_INTERVAL: Final = timedelta(minutes=30)
+PROGRAM_REFRESH_INTERVAL: Final = timedelta(hours=1)
+WATER_ACCRUAL_INTERVAL: Final = timedelta(minutes=1)
+
+PUSH_READ_TIMEOUT: Final = 90
+PUSH_RECONNECT_BASE: Final = 1.0
+PUSH_RECONNECT_MAX: Final = 300.0
+PUSH_UNSUPPORTED_RETRY: Final = 3600.0
+PUSH_REJECTED_LIMIT: Final = 3
+
+RETRY_ATTEMPTS: Final = 2
+RETRY_BACKOFF_BASE: Final = 0.5
+RETRY_BACKOFF_MAX: Final = 4.0
+BREAKER_FAILURE_THRESHOLD: Final = 3
+BREAKER_RESET_TIMEOUT: Final = 30.0
+
+HEALTH_CHECK_INTERVAL: Final = 60.0
+HEALTH_CHECK_JITTER: Final = 0.2
+HEALTH_PROBE_TIMEOUT: Final = 5.0
+HEALTH_RTT_SAMPLES: Final = 30
+HEALTH_ISSUE_AFTER: Final = timedelta(minutes=10)
+ISSUE_CONTROLLER_UNREACHABLE: Final = "controller_unreachable"
+
+METRICS_RING_SIZE: Final = 256
+METRICS_RECENT_SIZE: Final = 20
@@ -0,0 +1,87 @@
+"""Status polling coordinator for Hunter WiFi."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import HunterApiError, HunterStatus
+from .const import (
+    ACTIVE_POLL_INTERVAL,
+    DOMAIN,
+    IDLE_POLL_INTERVAL,
+    PUSH_POLL_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import HunterClient
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HunterStatusCoordinator(DataUpdateCoordinator[HunterStatus]):
+    """
+    Poll controller status once per cycle for all entities of an entry.
+
+    The interval adapts to the controller state: fast while a zone or program
+    is running, slow while the controller is idle. While the controller pushes
+    its status only a rare safety poll remains.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, client: HunterClient
+    ) -> None:
+        """Initialize coordinator for controller client."""
+        super().__init__(
+            hass,
+            LOGGER,
+            config_entry=entry,
+            name=f"{DOMAIN} {client.host}",
+            update_interval=IDLE_POLL_INTERVAL,
+        )
+        self._client = client
+        self._push_connected = False
+
+    @property
+    def push_connected(self) -> bool:
+        """Return True while status is pushed by the controller."""
+        return self._push_connected
+
+    @callback
+    def async_set_push_connected(self, connected: bool) -> None:
+        """Switch between push updates and polling."""
+        self._push_connected = connected
+        self.update_interval = self._next_interval(self.data)
+        self._schedule_refresh()
+
+    @callback
+    def async_push_status(self, status: HunterStatus) -> None:
+        """Publish status pushed by the controller."""
+        self.update_interval = self._next_interval(status)
+        self.async_set_updated_data(status)
+
+    def _next_interval(self, status: HunterStatus | None) -> timedelta:
+        """Return polling interval for status."""
+        if self._push_connected:
+            return PUSH_POLL_INTERVAL
+        if status is not None and status.is_running:
+            return ACTIVE_POLL_INTERVAL
+        return IDLE_POLL_INTERVAL
+
+    async def _async_update_data(self) -> HunterStatus:
+        """Fetch status and pick the next polling interval."""
+        try:
+            status = await self._client.async_get_status()
+        except HunterApiError as err:
+            raise UpdateFailed(str(err)) from err
+
+        self.update_interval = self._next_interval(status)
+        return status
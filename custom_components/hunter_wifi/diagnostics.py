@@ -0,0 +1,68 @@
+"""Diagnostics support for Hunter WiFi."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import CONF_HOST, CONF_ZONES, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .api import HunterClient
+    from .coordinator import HunterStatusCoordinator
+    from .scheduler import HunterCommandScheduler
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client: HunterClient = entry_data["client"]
+    scheduler: HunterCommandScheduler = entry_data["scheduler"]
+    coordinator: HunterStatusCoordinator = entry_data["coordinator"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "circuit_breaker": {
+            "state": client.breaker.state.value,
+            "consecutive_failures": client.breaker.failures,
+        },
+        "capabilities": (
+            None
+            if (capabilities := entry_data["capabilities"]) is None
+            else asdict(capabilities)
+        ),
+        "push_connected": coordinator.push_connected,
+        "health": {
+            "reachable": entry_data["health"].reachable,
+            "consecutive_failures": entry_data["health"].failures,
+            "round_trip_time": entry_data["health"].rtt_percentiles(),
+        },
+        "command_queue_depth": scheduler.queue_depth,
+        "status": asdict(coordinator.data) if coordinator.data else None,
+        "requests": client.metrics.as_dict(),
+        "programs": {
+            "etag": entry_data["programs"].etag,
+            "programs": [
+                program.as_dict() for program in entry_data["programs"].programs
+            ],
+        },
+        "water": {
+            "total": entry_data["water"].total,
+            "zones": {
+                zone: entry_data["water"].zone_total(zone)
+                for zone in entry_data[CONF_ZONES]
+            },
+        },
+        "journal": [entry.as_dict() for entry in entry_data["journal"].entries[-20:]],
+    }
@@ -0,0 +1,78 @@
+"""Controller discovery for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .api import HunterCapabilities
+from .const import DISCOVERY_CONCURRENCY, DISCOVERY_MAX_HOSTS, DISCOVERY_TIMEOUT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def hosts_from_network(network: str) -> list[str]:
+    """Return host addresses of a CIDR network, e.g. ``192.168.1.0/24``."""
+    parsed = ipaddress.ip_network(network.strip(), strict=False)
+    if parsed.num_addresses > DISCOVERY_MAX_HOSTS:
+        msg = f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses"
+        raise ValueError(msg)
+    if parsed.num_addresses == 1:
+        return [str(parsed.network_address)]
+    return [str(host) for host in parsed.hosts()]
+
+
+async def _async_get_json(session: aiohttp.ClientSession, url: str) -> object | None:
+    """Return decoded JSON body of url, None on 404."""
+    async with session.get(url) as response:
+        if response.status == HTTPStatus.NOT_FOUND:
+            return None
+        response.raise_for_status()
+        return json.loads(await response.read())
+
+
+async def async_probe(
+    session: aiohttp.ClientSession,
+    host: str,
+    probe_timeout: float = DISCOVERY_TIMEOUT,
+) -> HunterCapabilities | None:
+    """
+    Return capabilities when a Hunter controller answers at host.
+
+    The capabilities endpoint is preferred; firmware without it is recognised
+    by a valid status payload and gets the classic zone and program limits.
+    """
+    try:
+        async with asyncio.timeout(probe_timeout):
+            data = await _async_get_json(session, f"http://{host}/api/capabilities")
+            if isinstance(data, dict):
+                return HunterCapabilities.from_dict(data)
+            data = await _async_get_json(session, f"http://{host}/api/status")
+    except (aiohttp.ClientError, TimeoutError, ValueError, TypeError, KeyError):
+        return None
+    if isinstance(data, dict):
+        return HunterCapabilities()
+    return None
+
+
+async def async_scan(
+    session: aiohttp.ClientSession,
+    hosts: Iterable[str],
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    probe_timeout: float = DISCOVERY_TIMEOUT,
+) -> dict[str, HunterCapabilities]:
+    """Probe hosts concurrently and return the controllers that answered."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _probe(host: str) -> tuple[str, HunterCapabilities | None]:
+        async with semaphore:
+            return host, await async_probe(session, host, probe_timeout)
+
+    results = await asyncio.gather(*(_probe(host) for host in dict.fromkeys(hosts)))
+    return {host: found for host, found in results if found is not None}
@@ -0,0 +1,67 @@
+"""Base entity for Hunter WiFi."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+
+@dataclass(frozen=True, slots=True)
+class HunterDeviceMeta:
+    """Metadata computed once per entry and shared by all of its entities."""
+
+    entry_id: str
+    device_name: str
+    slug: str
+    host: str
+    device_info: DeviceInfo
+
+    @classmethod
+    def from_entry(cls, entry_id: str, device_name: str, host: str) -> HunterDeviceMeta:
+        """Build metadata for controller entry."""
+        return cls(
+            entry_id=entry_id,
+            device_name=device_name,
+            slug=slugify(device_name),
+            host=host,
+            device_info=DeviceInfo(
+                identifiers={(DOMAIN, entry_id)},
+                name=device_name,
+                manufacturer="Hunter",
+                model="WiFi Controller",
+                configuration_url=f"http://{host}",
+            ),
+        )
+
+
+class HunterEntity(Entity):
+    """
+    Common base for Hunter WiFi entities.
+
+    Ids, suggested object id and device info are derived from the shared
+    entry metadata and a per-entity key once, at construction time.
+    """
+
+    _attr_should_poll = False
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        meta: HunterDeviceMeta,
+        key: str,
+        name: str,
+        zone: int | None = None,
+        program: int | None = None,
+    ) -> None:
+        """Initialize entity from shared metadata."""
+        self._meta = meta
+        self.zone = zone
+        self.program = program
+        self._attr_name = name
+        self._attr_unique_id = f"{key}_{meta.entry_id}"
+        self._attr_suggested_object_id = f"{meta.slug}_{key}"
+        self._attr_device_info = meta.device_info
@@ -0,0 +1,258 @@
+"""Controller health checks for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .api import HunterApiError
+from .const import (
+    DOMAIN,
+    HEALTH_CHECK_INTERVAL,
+    HEALTH_CHECK_JITTER,
+    HEALTH_ISSUE_AFTER,
+    HEALTH_PROBE_TIMEOUT,
+    HEALTH_RTT_SAMPLES,
+    ISSUE_CONTROLLER_UNREACHABLE,
+)
+from .metrics import LatencyRing
+from .resilience import jittered
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .api import HunterClient
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HunterHealth:
+    """
+    Reachability and round-trip time of one controller.
+
+    A probe is a status request without retries over the client's pooled
+    connection, so it also serves as the circuit breaker's trial request.
+    Any HTTP answer below 500 counts as reachable. The connection carries one
+    request at a time, so a probe may wait behind polls and commands. An
+    unanswered probe counts as answered when the controller answered another
+    request while it waited, and is inconclusive when it waited behind other
+    requests that got no answer either; neither moves the failure clock.
+    After failing for HEALTH_ISSUE_AFTER a repair issue is raised; it is
+    removed once the controller answers again.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, name: str, client: HunterClient
+    ) -> None:
+        """Initialize health state for entry."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._name = name
+        self._client = client
+        self._rtts = LatencyRing(HEALTH_RTT_SAMPLES)
+        self._reachable: bool | None = None
+        self._rtt: float | None = None
+        self._failures = 0
+        self._failing_since: datetime | None = None
+        self._issue_raised = False
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def entry_id(self) -> str:
+        """Return config entry id."""
+        return self._entry_id
+
+    @property
+    def reachable(self) -> bool | None:
+        """Return whether the last probe was answered, None before the first."""
+        return self._reachable
+
+    @property
+    def rtt(self) -> float | None:
+        """Return round-trip time of the last answered probe in milliseconds."""
+        return self._rtt
+
+    @property
+    def failures(self) -> int:
+        """Return number of consecutive failed probes."""
+        return self._failures
+
+    @property
+    def failing_since(self) -> datetime | None:
+        """Return when the current run of failed probes began."""
+        return self._failing_since
+
+    def rtt_percentiles(self) -> dict[str, float | None]:
+        """Return p50/p95/p99 over recent probes in milliseconds."""
+        return self._rtts.percentiles()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked after every probe."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    async def async_probe(self) -> None:
+        """Probe the controller once."""
+        started = time.monotonic()
+        contended = self._client.busy
+        try:
+            async with asyncio.timeout(HEALTH_PROBE_TIMEOUT):
+                await self._client.async_fetch("/api/status", retries=0)
+        except HunterApiError as err:
+            if err.status is None or err.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                self._async_unanswered(started, contended, str(err))
+            else:
+                self._async_answered(time.monotonic() - started)
+        except TimeoutError:
+            self._async_unanswered(
+                started, contended, f"no answer within {HEALTH_PROBE_TIMEOUT} s"
+            )
+        else:
+            self._async_answered(time.monotonic() - started)
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_clear_issue(self) -> None:
+        """Remove the repair issue, e.g. when the entry is unloaded."""
+        if self._issue_raised:
+            ir.async_delete_issue(self._hass, DOMAIN, self._issue_id)
+            self._issue_raised = False
+
+    @property
+    def _issue_id(self) -> str:
+        """Return repair issue id of this controller."""
+        return f"{ISSUE_CONTROLLER_UNREACHABLE}_{self._entry_id}"
+
+    @callback
+    def _async_answered(self, seconds: float) -> None:
+        """Record an answered probe."""
+        self._rtts.add(seconds)
+        self._rtt = round(seconds * 1000, 1)
+        self._async_alive()
+
+    @callback
+    def _async_unanswered(self, started: float, contended: bool, reason: str) -> None:
+        """Record a probe without answer unless other traffic decides it."""
+        answered_at = self._client.answered_at
+        if answered_at is not None and answered_at > started:
+            self._async_alive()
+        elif contended:
+            LOGGER.debug(
+                "Health check of %s inconclusive behind other requests: %s",
+                self._client.host,
+                reason,
+            )
+        else:
+            self._async_failed(reason)
+
+    @callback
+    def _async_alive(self) -> None:
+        """Record that the controller is reachable."""
+        self._reachable = True
+        self._failures = 0
+        self._failing_since = None
+        if self._issue_raised:
+            LOGGER.info("Controller %s is reachable again", self._client.host)
+            self.async_clear_issue()
+
+    @callback
+    def _async_failed(self, reason: str) -> None:
+        """Record a failed probe and raise a repair issue once it persists."""
+        now = dt_util.utcnow()
+        self._reachable = False
+        self._failures += 1
+        if self._failing_since is None:
+            self._failing_since = now
+            LOGGER.debug("Health check of %s failed: %s", self._client.host, reason)
+        if not self._issue_raised and now - self._failing_since >= HEALTH_ISSUE_AFTER:
+            LOGGER.warning(
+                "Controller %s unreachable since %s: %s",
+                self._client.host,
+                self._failing_since,
+                reason,
+            )
+            ir.async_create_issue(
+                self._hass,
+                DOMAIN,
+                self._issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=ISSUE_CONTROLLER_UNREACHABLE,
+                translation_placeholders={
+                    "name": self._name,
+                    "host": self._client.host,
+                },
+            )
+            self._issue_raised = True
+
+
+class HunterHealthWatchdog:
+    """
+    Probe every registered controller in the background.
+
+    All controllers are probed concurrently, so an unreachable one does not
+    delay the others, and the interval is jittered so that probes do not
+    line up with the polling of the status coordinators.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize watchdog without controllers."""
+        self._hass = hass
+        self._checks: dict[str, HunterHealth] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, health: HunterHealth) -> CALLBACK_TYPE:
+        """Start probing a controller; return a remover."""
+        self._checks[health.entry_id] = health
+        if self._unsub_timer is None:
+            self._async_schedule()
+
+        @callback
+        def _remove() -> None:
+            self._checks.pop(health.entry_id, None)
+            health.async_clear_issue()
+            if not self._checks and self._unsub_timer is not None:
+                self._unsub_timer()
+                self._unsub_timer = None
+
+        return _remove
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule the next round of probes."""
+        self._unsub_timer = async_call_later(
+            self._hass,
+            jittered(HEALTH_CHECK_INTERVAL, HEALTH_CHECK_JITTER),
+            HassJob(self._async_tick, cancel_on_shutdown=True),
+        )
+
+    @callback
+    def _async_tick(self, _now: datetime) -> None:
+        """Probe all controllers and schedule the next round."""
+        self._hass.async_create_background_task(
+            self._async_probe_all(), f"{DOMAIN} health check"
+        )
+        self._async_schedule()
+
+    async def _async_probe_all(self) -> None:
+        """Probe all controllers concurrently."""
+        await asyncio.gather(
+            *(health.async_probe() for health in list(self._checks.values()))
+        )
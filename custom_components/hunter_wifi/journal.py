@@ -0,0 +1,177 @@
+"""Persistent command journal for Hunter WiFi."""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HunterApiError, HunterStopZonesError
+from .const import DOMAIN, JOURNAL_SAVE_DELAY, JOURNAL_SIZE, STORAGE_VERSION
+from .scheduler import HunterCommand
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .orchestrator import HunterHydraulicOrchestrator
+    from .runstate import HunterRunState
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """Command sent to the controller and its outcome."""
+
+    at: datetime
+    command: HunterCommand
+    error: str | None = None
+    failed: tuple[int, ...] = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return serializable entry."""
+        return {
+            "at": self.at.isoformat(),
+            "action": self.command.action,
+            "target": self.command.target,
+            "duration": self.command.duration,
+            "zones": list(self.command.zones),
+            "error": self.error,
+            "failed": list(self.failed),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> JournalEntry | None:
+        """Parse stored entry, None when it is unreadable."""
+        if (at := dt_util.parse_datetime(data.get("at", ""))) is None:
+            return None
+        command = HunterCommand(
+            data["action"],
+            data.get("target"),
+            data.get("duration"),
+            tuple(data.get("zones", ())),
+        )
+        return cls(at, command, data.get("error"), tuple(data.get("failed", ())))
+
+
+class HunterCommandJournal:
+    """
+    Append-only, size-capped history of commands sent to one controller.
+
+    Entries are written back with a debounced save. After a restart or once
+    the controller is reachable again the journal tells which zones should
+    still run and which should have finished, so overdue zones get a stop
+    and running ones are restored without a status poll.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        orchestrator: HunterHydraulicOrchestrator,
+        run_state: HunterRunState,
+        size: int = JOURNAL_SIZE,
+    ) -> None:
+        """Initialize journal for entry."""
+        self._hass = hass
+        self._entry = entry
+        self._orchestrator = orchestrator
+        self._run_state = run_state
+        self._store: Store[list[dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.journal"
+        )
+        self._entries: deque[JournalEntry] = deque(maxlen=size)
+
+    @property
+    def entries(self) -> list[JournalEntry]:
+        """Return journal entries, oldest first."""
+        return list(self._entries)
+
+    async def async_load(self) -> None:
+        """Load persisted journal."""
+        for data in await self._store.async_load() or []:
+            if (entry := JournalEntry.from_dict(data)) is not None:
+                self._entries.append(entry)
+
+    @callback
+    def async_handle_command(
+        self, command: HunterCommand, error: BaseException | None
+    ) -> None:
+        """Append a command the scheduler has sent."""
+        failed: tuple[int, ...] = ()
+        if isinstance(error, HunterStopZonesError):
+            failed = tuple(sorted(error.result.failed))
+        self._entries.append(
+            JournalEntry(
+                dt_util.utcnow(),
+                command,
+                None if error is None else str(error),
+                failed,
+            )
+        )
+        self._store.async_delay_save(self._data_to_save, JOURNAL_SAVE_DELAY)
+
+    def open_runs(self) -> dict[int, tuple[datetime, datetime]]:
+        """Return (started_at, ends_at) of zones started and not stopped since."""
+        runs: dict[int, tuple[datetime, datetime]] = {}
+        for entry in self._entries:
+            command = entry.command
+            if entry.failed:
+                # Zones a partly failed stop did not reach stay open, due at
+                # the time of the stop, so reconciling stops them again.
+                runs = {
+                    zone: (started_at, min(ends_at, entry.at))
+                    for zone, (started_at, ends_at) in runs.items()
+                    if zone in entry.failed
+                }
+                continue
+            if entry.error is not None:
+                continue
+            if command.action == "stop_all_zones":
+                runs.clear()
+            elif command.action == "start_zone" and command.target is not None:
+                ends_at = entry.at + timedelta(minutes=command.duration or 0)
+                runs[command.target] = (entry.at, ends_at)
+            elif command.action == "stop_zone" and command.target is not None:
+                runs.pop(command.target, None)
+        return runs
+
+    @callback
+    def async_reconcile(self, restore: bool = True) -> None:
+        """Stop zones that should have finished and optionally restore the rest."""
+        now = dt_util.utcnow()
+        overdue: list[int] = []
+        for zone, (started_at, ends_at) in self.open_runs().items():
+            if ends_at <= now:
+                overdue.append(zone)
+            elif restore and self._run_state.get(zone) is None:
+                self._run_state.async_restore(zone, started_at, ends_at)
+        if overdue:
+            self._entry.async_create_background_task(
+                self._hass,
+                self._async_stop_overdue(overdue),
+                f"{DOMAIN} {self._entry.entry_id} journal reconcile",
+            )
+
+    async def _async_stop_overdue(self, zones: list[int]) -> None:
+        """Send a stop for every zone whose run should have ended."""
+        for zone in zones:
+            LOGGER.info("Stopping zone %s whose journaled run is overdue", zone)
+            try:
+                await self._orchestrator.async_submit(
+                    self._entry.entry_id, HunterCommand("stop_zone", zone)
+                )
+            except HunterApiError as err:
+                # The run stays open in the journal and is retried on reconnect.
+                LOGGER.warning("Failed to stop overdue zone %s: %s", zone, err)
+
+    def _data_to_save(self) -> list[dict[str, Any]]:
+        """Return serializable journal."""
+        return [entry.as_dict() for entry in self._entries]
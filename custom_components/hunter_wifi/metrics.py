@@ -0,0 +1,159 @@
+"""Request instrumentation for Hunter WiFi."""
+
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from .const import METRICS_RECENT_SIZE, METRICS_RING_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class RequestSample:
+    """Single instrumented controller request."""
+
+    command: str
+    started_at: float
+    finished_at: float
+    status: int | None
+    retries: int
+    size: int
+    ok: bool
+
+    @property
+    def duration(self) -> float:
+        """Return request duration in seconds."""
+        return self.finished_at - self.started_at
+
+
+class LatencyRing:
+    """Fixed-size ring buffer of request durations in seconds."""
+
+    __slots__ = ("_count", "_cursor", "_values")
+
+    def __init__(self, size: int = METRICS_RING_SIZE) -> None:
+        """Initialize ring with capacity ``size``."""
+        self._values = array("d", bytes(8 * size))
+        self._cursor = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return number of stored durations."""
+        return self._count
+
+    def add(self, value: float) -> None:
+        """Store duration, overwriting the oldest one when full."""
+        self._values[self._cursor] = value
+        self._cursor = (self._cursor + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def percentiles(self) -> dict[str, float | None]:
+        """Return p50/p95/p99 in milliseconds using nearest rank."""
+        if not self._count:
+            return {"p50": None, "p95": None, "p99": None}
+        ordered = sorted(self._values[: self._count])
+        return {
+            name: round(ordered[max(0, math.ceil(q * self._count) - 1)] * 1000, 1)
+            for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        }
+
+
+@dataclass(slots=True)
+class _Counters:
+    """Request counters for one command type."""
+
+    requests: int = 0
+    failures: int = 0
+    retries: int = 0
+    bytes: int = 0
+
+
+class HunterMetrics:
+    """
+    Latency histograms and counters for one controller host.
+
+    Durations are kept in fixed-size rings per host and per command type, so
+    memory stays constant no matter how long Home Assistant runs. The time
+    commands wait in the scheduler queue is kept the same way.
+    """
+
+    def __init__(self, size: int = METRICS_RING_SIZE) -> None:
+        """Initialize empty metrics."""
+        self._size = size
+        self._host = LatencyRing(size)
+        self._commands: dict[str, LatencyRing] = {}
+        self._counters: dict[str, _Counters] = {}
+        self._recent: deque[RequestSample] = deque(maxlen=METRICS_RECENT_SIZE)
+        self._queue_wait = LatencyRing(size)
+        self.max_queue_depth = 0
+        self.rejected = 0
+
+    @property
+    def last(self) -> RequestSample | None:
+        """Return most recent sample."""
+        return self._recent[-1] if self._recent else None
+
+    def record(self, sample: RequestSample) -> None:
+        """Record a finished request."""
+        self._host.add(sample.duration)
+        if (ring := self._commands.get(sample.command)) is None:
+            ring = self._commands[sample.command] = LatencyRing(self._size)
+        ring.add(sample.duration)
+        counters = self._counters.setdefault(sample.command, _Counters())
+        counters.requests += 1
+        counters.retries += sample.retries
+        counters.bytes += sample.size
+        if not sample.ok:
+            counters.failures += 1
+        self._recent.append(sample)
+
+    def record_queue_wait(self, wait: float, depth: int) -> None:
+        """Record time a command spent queued and the queue depth it saw."""
+        self._queue_wait.add(wait)
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def queue_wait_percentiles(self) -> dict[str, float | None]:
+        """Return queue wait percentiles in milliseconds."""
+        return self._queue_wait.percentiles()
+
+    def percentiles(self, command: str | None = None) -> dict[str, float | None]:
+        """Return latency percentiles for host or one command type."""
+        ring = self._host if command is None else self._commands.get(command)
+        if ring is None:
+            return LatencyRing(1).percentiles()
+        return ring.percentiles()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return snapshot suitable for diagnostics."""
+        offset = time.time() - time.monotonic()
+        return {
+            "host": self.percentiles(),
+            "rejected_by_breaker": self.rejected,
+            "queue": {
+                "wait_ms": self._queue_wait.percentiles(),
+                "max_depth": self.max_queue_depth,
+            },
+            "commands": {
+                command: {
+                    **asdict(self._counters[command]),
+                    "latency_ms": ring.percentiles(),
+                }
+                for command, ring in self._commands.items()
+            },
+            "recent": [
+                {
+                    "command": sample.command,
+                    "started_at": round(sample.started_at + offset, 3),
+                    "duration_ms": round(sample.duration * 1000, 1),
+                    "status": sample.status,
+                    "retries": sample.retries,
+                    "bytes": sample.size,
+                    "ok": sample.ok,
+                }
+                for sample in self._recent
+            ],
+        }
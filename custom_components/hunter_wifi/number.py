@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import RestoreNumber
-from homeassistant.const import UnitOfTime
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.util import slugify
+from homeassistant.const import EntityCategory, UnitOfTime, UnitOfVolumeFlowRate
+from homeassistant.core import callback
 
 from .const import (
-    CONF_DEVICE_NAME,
-    CONF_HOST,
     CONF_ZONES,
+    DEFAULT_CROP_COEFFICIENT,
+    DEFAULT_FLOW_RATE,
+    DEFAULT_PRECIPITATION_RATE,
     DEFAULT_ZONE_DURATION_MINUTES,
     DOMAIN,
+    MAX_ZONE_DURATION_MINUTES,
+    MIN_ZONE_DURATION_MINUTES,
+)
+from .entity import HunterDeviceMeta, HunterEntity
+from .zone_settings import (
+    SETTING_CROP_COEFFICIENT,
+    SETTING_DURATION,
+    SETTING_FLOW_RATE,
+    SETTING_PRECIPITATION_RATE,
 )
 
 if TYPE_CHECKING:
@@ -22,87 +32,153 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .zone_settings import HunterZoneSettings
+
+
+@dataclass(frozen=True, slots=True)
+class HunterZoneSettingDescription:
+    """Static description of an editable per-zone setting."""
+
+    setting: str
+    name: str
+    icon: str
+    min_value: float
+    max_value: float
+    step: float
+    default: float
+    unit: str | None = None
+    entity_category: EntityCategory | None = None
+
+
+ZONE_SETTING_DESCRIPTIONS = (
+    HunterZoneSettingDescription(
+        setting=SETTING_DURATION,
+        name="Duration",
+        icon="mdi:timer-outline",
+        min_value=MIN_ZONE_DURATION_MINUTES,
+        max_value=MAX_ZONE_DURATION_MINUTES,
+        step=1,
+        default=DEFAULT_ZONE_DURATION_MINUTES,
+        unit=UnitOfTime.MINUTES,
+    ),
+    HunterZoneSettingDescription(
+        setting=SETTING_CROP_COEFFICIENT,
+        name="Crop Coefficient",
+        icon="mdi:sprout-outline",
+        min_value=0.1,
+        max_value=2.0,
+        step=0.05,
+        default=DEFAULT_CROP_COEFFICIENT,
+        entity_category=EntityCategory.CONFIG,
+    ),
+    HunterZoneSettingDescription(
+        setting=SETTING_PRECIPITATION_RATE,
+        name="Precipitation Rate",
+        icon="mdi:weather-pouring",
+        min_value=1,
+        max_value=200,
+        step=0.5,
+        default=DEFAULT_PRECIPITATION_RATE,
+        unit="mm/h",
+        entity_category=EntityCategory.CONFIG,
+    ),
+    HunterZoneSettingDescription(
+        setting=SETTING_FLOW_RATE,
+        name="Flow Rate",
+        icon="mdi:water-pump",
+        min_value=0,
+        max_value=500,
+        step=0.1,
+        default=DEFAULT_FLOW_RATE,
+        unit=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+        entity_category=EntityCategory.CONFIG,
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up per-zone watering duration entities."""
+    """Set up per-zone setting entities."""
     entry_data = hass.data[DOMAIN][entry.entry_id]
-    device_name: str = entry_data[CONF_DEVICE_NAME]
-    host: str = entry_data[CONF_HOST]
-    zones: list[int] = entry_data[CONF_ZONES]
-    slug = slugify(device_name)
-    async_add_entities(
-        [
-            HunterZoneDurationNumber(hass, entry, device_name, slug, host, zone)
+    meta: HunterDeviceMeta = entry_data["meta"]
+    settings: HunterZoneSettings = entry_data["zone_settings"]
+
+    @callback
+    def _async_add(zones: list[int], _programs: list[int]) -> None:
+        entities = [
+            HunterZoneSettingNumber(meta, settings, zone, description)
             for zone in zones
+            for description in ZONE_SETTING_DESCRIPTIONS
         ]
-    )
+        entry_data["entities"].extend(entities)
+        async_add_entities(entities)
 
+    _async_add(entry_data[CONF_ZONES], [])
+    entry_data["entity_adders"].append(_async_add)
 
-class HunterZoneDurationNumber(RestoreNumber):
-    """Editable zone duration used for /start/zone time parameter."""
 
-    _attr_has_entity_name = True
+class HunterZoneSettingNumber(HunterEntity, RestoreNumber):
+    """Editable per-zone setting such as the /start/zone time parameter."""
+
     _attr_mode = "box"
-    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
-    _attr_native_min_value = 1
-    _attr_native_max_value = 240
-    _attr_native_step = 1
-    _attr_icon = "mdi:timer-outline"
 
     def __init__(
         self,
-        hass: HomeAssistant,
-        config_entry: ConfigEntry,
-        device_name: str,
-        slug: str,
-        host: str,
+        meta: HunterDeviceMeta,
+        settings: HunterZoneSettings,
         zone: int,
+        description: HunterZoneSettingDescription,
     ) -> None:
-        """Initialize zone duration entity."""
-        self.hass = hass
-        self.config_entry = config_entry
-        self._device_name = device_name
-        self._slug = slug
-        self._host = host
+        """Initialize zone setting entity."""
+        super().__init__(
+            meta,
+            f"zone_{zone}_{description.setting}",
+            f"Zone {zone} {description.name}",
+            zone=zone,
+        )
+        self._settings = settings
         self._zone = zone
-        self._attr_name = f"Zone {zone} Duration"
-        self._attr_unique_id = f"zone_{zone}_duration_{config_entry.entry_id}"
-        self._attr_suggested_object_id = f"{self._slug}_zone_{zone}_duration"
-        self._attr_native_value = float(DEFAULT_ZONE_DURATION_MINUTES)
+        self._description = description
+        self._attr_icon = description.icon
+        self._attr_native_min_value = description.min_value
+        self._attr_native_max_value = description.max_value
+        self._attr_native_step = description.step
+        self._attr_native_unit_of_measurement = description.unit
+        self._attr_entity_category = description.entity_category
+
+    @property
+    def native_value(self) -> float:
+        """Return value from the settings table."""
+        return float(
+            self._settings.get(
+                self._zone, self._description.setting, self._description.default
+            )
+        )
 
     async def async_added_to_hass(self) -> None:
-        """Restore previous value if available."""
+        """Subscribe to settings and migrate a previously restored value."""
         await super().async_added_to_hass()
-        if (last_number_data := await self.async_get_last_number_data()) is not None:
-            self._attr_native_value = last_number_data.native_value
-
-        self._update_runtime_duration()
-
-    async def async_set_native_value(self, value: float) -> None:
-        """Set zone watering duration in minutes."""
-        self._attr_native_value = value
-        self._update_runtime_duration()
-        self.async_write_ha_state()
-
-    def _update_runtime_duration(self) -> None:
-        """Sync the runtime zone duration map used by start buttons."""
-        entry_data = self.hass.data[DOMAIN][self.config_entry.entry_id]
-        zone_durations: dict[int, int] = entry_data["zone_durations"]
-        zone_durations[self._zone] = int(
-            self.native_value or DEFAULT_ZONE_DURATION_MINUTES
+        setting = self._description.setting
+        if (
+            not self._settings.has(self._zone, setting)
+            and (last_number_data := await self.async_get_last_number_data())
+            is not None
+            and last_number_data.native_value is not None
+        ):
+            self._settings.async_set(self._zone, setting, last_number_data.native_value)
+        self.async_on_remove(
+            self._settings.async_add_listener(self._async_settings_changed)
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return parent device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.config_entry.entry_id)},
-            name=self._device_name,
-            manufacturer="Hunter",
-            model="WiFi Controller",
-            configuration_url=f"http://{self._host}",
-        )
+    async def async_set_native_value(self, value: float) -> None:
+        """Store new setting value."""
+        self._settings.async_set(self._zone, self._description.setting, value)
+
+    @callback
+    def _async_settings_changed(self, zone: int) -> None:
+        """Write state when this zone's settings change."""
+        if zone == self._zone:
+            self.async_write_ha_state()
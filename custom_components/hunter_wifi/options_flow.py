@@ -7,51 +7,113 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.helpers import selector
 
 from .const import (
     CONF_DEVICE_NAME,
+    CONF_ET_ENTITY,
+    CONF_FIRE_AND_FORGET,
     CONF_HOST,
+    CONF_MAX_RUNNING_ZONES,
+    CONF_PROGRAM_COUNT,
     CONF_PROGRAMS,
+    CONF_RATE_BURST,
+    CONF_RATE_LIMIT,
+    CONF_STOP_TIMEOUT,
+    CONF_ZONE_COUNT,
     CONF_ZONES,
     DEFAULT_DEVICE_NAME,
-    MAX_PROGRAM,
-    MAX_ZONE,
+    DEFAULT_FIRE_AND_FORGET,
+    DEFAULT_MAX_RUNNING_ZONES,
+    DEFAULT_PROGRAM_COUNT,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STOP_TIMEOUT,
+    DEFAULT_ZONE_COUNT,
+    MAX_RATE_BURST,
+    MAX_RATE_LIMIT,
+    MAX_RUNNING_ZONES,
+    MAX_STOP_TIMEOUT,
 )
 
 if TYPE_CHECKING:
     from homeassistant.data_entry_flow import FlowResult
 
 
-def _selected_from_input(
-    user_input: dict[str, Any], prefix: str, max_value: int
-) -> list[int]:
-    """Convert checkbox values to list of selected numeric ids."""
-    return [
-        value
-        for value in range(1, max_value + 1)
-        if user_input.get(f"{prefix}_{value}", False)
-    ]
+def _id_selector(count: int, label: str) -> selector.SelectSelector:
+    """Return multi-select of ids ``1..count``."""
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=[
+                selector.SelectOptionDict(value=str(value), label=f"{label} {value}")
+                for value in range(1, count + 1)
+            ],
+            multiple=True,
+            mode=selector.SelectSelectorMode.LIST,
+        )
+    )
 
 
-def _build_schema(defaults: dict[str, Any]) -> vol.Schema:
-    """Build options flow schema."""
+def _selected_from_input(user_input: dict[str, Any], key: str, count: int) -> list[int]:
+    """Convert multi-select values to sorted list of valid numeric ids."""
+    return sorted(
+        {int(value) for value in user_input.get(key, []) if 1 <= int(value) <= count}
+    )
+
+
+def _build_schema(
+    defaults: dict[str, Any], zone_count: int, program_count: int
+) -> vol.Schema:
+    """Build options flow schema sized to the controller."""
     schema: dict[vol.Marker, object] = {
         vol.Required(
             CONF_DEVICE_NAME,
             default=defaults.get(CONF_DEVICE_NAME, DEFAULT_DEVICE_NAME),
         ): str,
         vol.Required(CONF_HOST, default=defaults[CONF_HOST]): str,
+        vol.Optional(CONF_ZONES, default=defaults.get(CONF_ZONES, [])): _id_selector(
+            zone_count, "Zone"
+        ),
+        vol.Optional(
+            CONF_PROGRAMS, default=defaults.get(CONF_PROGRAMS, [])
+        ): _id_selector(program_count, "Program"),
     }
-    for zone in range(1, MAX_ZONE + 1):
-        schema[
-            vol.Optional(f"zone_{zone}", default=defaults.get(f"zone_{zone}", False))
-        ] = bool
-    for program in range(1, MAX_PROGRAM + 1):
-        schema[
-            vol.Optional(
-                f"program_{program}", default=defaults.get(f"program_{program}", False)
-            )
-        ] = bool
+    schema[
+        vol.Optional(
+            CONF_STOP_TIMEOUT,
+            default=defaults.get(CONF_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT),
+        )
+    ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_STOP_TIMEOUT))
+    schema[
+        vol.Optional(
+            CONF_MAX_RUNNING_ZONES,
+            default=defaults.get(CONF_MAX_RUNNING_ZONES, DEFAULT_MAX_RUNNING_ZONES),
+        )
+    ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_RUNNING_ZONES))
+    schema[
+        vol.Optional(
+            CONF_RATE_LIMIT,
+            default=defaults.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        )
+    ] = vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_RATE_LIMIT))
+    schema[
+        vol.Optional(
+            CONF_RATE_BURST,
+            default=defaults.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+        )
+    ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_RATE_BURST))
+    schema[
+        vol.Optional(
+            CONF_FIRE_AND_FORGET,
+            default=defaults.get(CONF_FIRE_AND_FORGET, DEFAULT_FIRE_AND_FORGET),
+        )
+    ] = bool
+    schema[
+        vol.Optional(
+            CONF_ET_ENTITY,
+            description={"suggested_value": defaults.get(CONF_ET_ENTITY)},
+        )
+    ] = selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor"))
     return vol.Schema(schema)
 
 
@@ -68,6 +130,10 @@ class HunterWifiOptionsFlow(config_entries.OptionsFlow):
         """Manage options."""
         errors: dict[str, str] = {}
         defaults = _defaults_from_entry(self.config_entry)
+        zone_count = self.config_entry.data.get(CONF_ZONE_COUNT, DEFAULT_ZONE_COUNT)
+        program_count = self.config_entry.data.get(
+            CONF_PROGRAM_COUNT, DEFAULT_PROGRAM_COUNT
+        )
 
         if user_input is not None:
             device_name = user_input[CONF_DEVICE_NAME].strip()
@@ -79,12 +145,22 @@ class HunterWifiOptionsFlow(config_entries.OptionsFlow):
             if not device_name:
                 errors[CONF_DEVICE_NAME] = "required"
 
-            zones = _selected_from_input(user_input, "zone", MAX_ZONE)
-            programs = _selected_from_input(user_input, "program", MAX_PROGRAM)
+            zones = _selected_from_input(user_input, CONF_ZONES, zone_count)
+            programs = _selected_from_input(user_input, CONF_PROGRAMS, program_count)
             if not zones and not programs:
                 errors["base"] = "select_at_least_one"
 
             if not errors:
+                if host != defaults[CONF_HOST]:
+                    # Another controller: detect its capabilities on reload.
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry,
+                        data={
+                            key: value
+                            for key, value in self.config_entry.data.items()
+                            if key not in (CONF_ZONE_COUNT, CONF_PROGRAM_COUNT)
+                        },
+                    )
                 return self.async_create_entry(
                     title="",
                     data={
@@ -92,19 +168,25 @@ class HunterWifiOptionsFlow(config_entries.OptionsFlow):
                         CONF_HOST: host,
                         CONF_ZONES: zones,
                         CONF_PROGRAMS: programs,
+                        CONF_STOP_TIMEOUT: user_input[CONF_STOP_TIMEOUT],
+                        CONF_MAX_RUNNING_ZONES: user_input[CONF_MAX_RUNNING_ZONES],
+                        CONF_RATE_LIMIT: user_input[CONF_RATE_LIMIT],
+                        CONF_RATE_BURST: user_input[CONF_RATE_BURST],
+                        CONF_FIRE_AND_FORGET: user_input[CONF_FIRE_AND_FORGET],
+                        CONF_ET_ENTITY: user_input.get(CONF_ET_ENTITY),
                     },
                 )
             defaults = user_input
 
         return self.async_show_form(
             step_id="init",
-            data_schema=_build_schema(defaults),
+            data_schema=_build_schema(defaults, zone_count, program_count),
             errors=errors,
         )
 
 
 def _defaults_from_entry(config_entry: config_entries.ConfigEntry) -> dict[str, Any]:
-    """Build checkbox defaults from config entry."""
+    """Build form defaults from config entry."""
     device_name = config_entry.options.get(
         CONF_DEVICE_NAME,
         config_entry.data.get(CONF_DEVICE_NAME, DEFAULT_DEVICE_NAME),
@@ -114,9 +196,22 @@ def _defaults_from_entry(config_entry: config_entries.ConfigEntry) -> dict[str,
     programs = config_entry.options.get(
         CONF_PROGRAMS, config_entry.data.get(CONF_PROGRAMS, [])
     )
-    defaults: dict[str, Any] = {CONF_DEVICE_NAME: device_name, CONF_HOST: host}
-    for zone in range(1, MAX_ZONE + 1):
-        defaults[f"zone_{zone}"] = zone in zones
-    for program in range(1, MAX_PROGRAM + 1):
-        defaults[f"program_{program}"] = program in programs
+    defaults: dict[str, Any] = {
+        CONF_DEVICE_NAME: device_name,
+        CONF_HOST: host,
+        CONF_STOP_TIMEOUT: config_entry.options.get(
+            CONF_STOP_TIMEOUT, DEFAULT_STOP_TIMEOUT
+        ),
+        CONF_MAX_RUNNING_ZONES: config_entry.options.get(
+            CONF_MAX_RUNNING_ZONES, DEFAULT_MAX_RUNNING_ZONES
+        ),
+        CONF_RATE_LIMIT: config_entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        CONF_RATE_BURST: config_entry.options.get(CONF_RATE_BURST, DEFAULT_RATE_BURST),
+        CONF_FIRE_AND_FORGET: config_entry.options.get(
+            CONF_FIRE_AND_FORGET, DEFAULT_FIRE_AND_FORGET
+        ),
+        CONF_ET_ENTITY: config_entry.options.get(CONF_ET_ENTITY),
+        CONF_ZONES: [str(zone) for zone in zones],
+        CONF_PROGRAMS: [str(program) for program in programs],
+    }
     return defaults
@@ -0,0 +1,208 @@
+"""Cross-controller zone orchestration for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .api import HunterApiError
+from .const import DOMAIN
+from .scheduler import CommandStatus, HunterCommandOutcome
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.config_entries import ConfigEntry
+
+    from .runstate import HunterRunState
+    from .scheduler import HunterCommand, HunterCommandScheduler
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class _EntryHandle:
+    """Per-entry objects the orchestrator needs."""
+
+    entry: ConfigEntry
+    run_state: HunterRunState
+    scheduler: HunterCommandScheduler
+    limit: int
+
+
+@dataclass(slots=True)
+class _WaitingStart:
+    """Zone start held back until hydraulic capacity frees up."""
+
+    entry_id: str
+    command: HunterCommand
+    future: asyncio.Future[HunterCommandOutcome] | None = None
+
+
+class HunterHydraulicOrchestrator:
+    """
+    Cap the number of zones running at once across all controllers.
+
+    Every config entry registers its run state and scheduler. Zone starts over
+    the cap are queued in arrival order and dispatched as soon as a running
+    zone stops or expires. The cap is the smallest non-zero limit configured
+    on any entry, since all controllers share the same water supply. A stop
+    discards queued starts it makes pointless.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize orchestrator."""
+        self._hass = hass
+        self._entries: dict[str, _EntryHandle] = {}
+        self._waiting: deque[_WaitingStart] = deque()
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> int | None:
+        """Return effective cap on running zones, None when unlimited."""
+        limits = [handle.limit for handle in self._entries.values() if handle.limit]
+        return min(limits) if limits else None
+
+    @property
+    def running(self) -> int:
+        """Return zones running or being started across all controllers."""
+        return self._in_flight + sum(
+            len(handle.run_state.runs) for handle in self._entries.values()
+        )
+
+    @property
+    def waiting(self) -> int:
+        """Return number of queued zone starts."""
+        return len(self._waiting)
+
+    @callback
+    def async_register(
+        self,
+        entry: ConfigEntry,
+        run_state: HunterRunState,
+        scheduler: HunterCommandScheduler,
+        limit: int,
+    ) -> CALLBACK_TYPE:
+        """Register entry and return callback that unregisters it."""
+        entry_id = entry.entry_id
+        self._entries[entry_id] = _EntryHandle(entry, run_state, scheduler, limit)
+        remove_listener = run_state.async_add_listener(self._async_drain)
+
+        @callback
+        def _unregister() -> None:
+            remove_listener()
+            self._entries.pop(entry_id, None)
+            self._discard_waiting(entry_id, lambda _command: True)
+            self._async_drain()
+
+        return _unregister
+
+    async def async_submit(
+        self, entry_id: str, command: HunterCommand, *, wait: bool = False
+    ) -> HunterCommandOutcome:
+        """
+        Send command, queueing zone starts while the cap is reached.
+
+        A queued start returns a ``queued`` outcome at once, unless ``wait`` is
+        set: then the call returns only after the start has been sent, or with
+        a ``dropped`` outcome when a stop discarded it meanwhile.
+        """
+        handle = self._entries[entry_id]
+        if command.action != "start_zone":
+            if command.action in ("stop_zone", "stop_all_zones"):
+                self._discard_waiting(entry_id, command.cancels)
+            return await handle.scheduler.async_submit(command)
+
+        already_running = (
+            command.target is not None
+            and handle.run_state.get(command.target) is not None
+        )
+        if not already_running and not self._has_capacity():
+            LOGGER.info(
+                "Queued %s: %s of %s zones already running",
+                command,
+                self.running,
+                self.limit,
+            )
+            if not wait:
+                self._waiting.append(_WaitingStart(entry_id, command))
+                return HunterCommandOutcome(CommandStatus.QUEUED)
+            future = asyncio.get_running_loop().create_future()
+            self._waiting.append(_WaitingStart(entry_id, command, future))
+            return await future
+        self._in_flight += 1
+        try:
+            return await handle.scheduler.async_submit(command)
+        finally:
+            self._async_release()
+
+    def _has_capacity(self) -> bool:
+        """Return True when another zone may start."""
+        limit = self.limit
+        return limit is None or self.running < limit
+
+    @callback
+    def _async_release(self) -> None:
+        """Free a slot reserved for a start once run state has recorded it."""
+        self._in_flight -= 1
+        self._async_drain()
+
+    async def _async_dispatch_waiting(
+        self, handle: _EntryHandle, waiting: _WaitingStart
+    ) -> None:
+        """Send a previously queued start and hand its outcome to the waiter."""
+        future = waiting.future
+        try:
+            outcome = await handle.scheduler.async_submit(waiting.command)
+        except Exception as err:
+            if future is None:
+                if not isinstance(err, HunterApiError):
+                    raise
+                LOGGER.exception("Failed to start queued %s", waiting.command)
+            elif not future.done():
+                future.set_exception(err)
+        else:
+            if future is not None and not future.done():
+                future.set_result(outcome)
+
+    @callback
+    def _async_drain(self) -> None:
+        """Dispatch queued starts while capacity is available."""
+        while self._waiting and self._has_capacity():
+            waiting = self._waiting.popleft()
+            if (handle := self._entries.get(waiting.entry_id)) is None:
+                continue
+            if waiting.future is not None and waiting.future.done():
+                # The waiting caller was cancelled meanwhile.
+                continue
+            # Reserve the slot now so the loop sees it before the task runs.
+            # The done callback frees it even if the task never gets to run.
+            self._in_flight += 1
+            task = handle.entry.async_create_background_task(
+                self._hass,
+                self._async_dispatch_waiting(handle, waiting),
+                f"{DOMAIN} {handle.entry.entry_id} queued {waiting.command.action}",
+            )
+            task.add_done_callback(lambda _task: self._async_release())
+
+    def _discard_waiting(
+        self, entry_id: str, matches: Callable[[HunterCommand], bool]
+    ) -> None:
+        """Drop queued starts of entry that match predicate."""
+        kept: deque[_WaitingStart] = deque()
+        handle = self._entries.get(entry_id)
+        for waiting in self._waiting:
+            if waiting.entry_id != entry_id or not matches(waiting.command):
+                kept.append(waiting)
+                continue
+            LOGGER.debug("Discarded queued %s", waiting.command)
+            if waiting.future is not None and not waiting.future.done():
+                waiting.future.set_result(HunterCommandOutcome(CommandStatus.DROPPED))
+            if handle is not None:
+                handle.scheduler.report_skipped(waiting.command, CommandStatus.DROPPED)
+        self._waiting = kept
@@ -0,0 +1,121 @@
+"""Cached program schedules for Hunter WiFi."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HunterApiError, HunterProgram
+from .const import DOMAIN, PROGRAM_REFRESH_INTERVAL, STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .api import HunterClient
+    from .schedule import HunterScheduleIndex
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HunterProgramCache:
+    """
+    Program schedules of one controller, fetched once and kept in storage.
+
+    Refreshes send the stored entity tag, so an unchanged schedule costs a
+    bodiless 304. Every change is fed to the shared next-run index, which
+    answers next-watering and calendar queries without controller traffic.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        client: HunterClient,
+        index: HunterScheduleIndex,
+    ) -> None:
+        """Initialize program cache for entry."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._client = client
+        self._index = index
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.programs"
+        )
+        self._programs: list[HunterProgram] = []
+        self._etag: str | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def programs(self) -> list[HunterProgram]:
+        """Return cached programs."""
+        return self._programs
+
+    @property
+    def etag(self) -> str | None:
+        """Return entity tag of the cached programs."""
+        return self._etag
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked when the programs change."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Re-validate the programs periodically; return a remover."""
+        unsub = async_track_time_interval(
+            self._hass, self.async_refresh, PROGRAM_REFRESH_INTERVAL
+        )
+
+        @callback
+        def _remove() -> None:
+            unsub()
+            self._index.remove(self._entry_id)
+
+        return _remove
+
+    async def async_load(self) -> None:
+        """Load programs stored by a previous run."""
+        data = await self._store.async_load() or {}
+        try:
+            programs = [
+                HunterProgram.from_dict(item) for item in data.get("programs", [])
+            ]
+        except (ValueError, TypeError, KeyError) as err:
+            LOGGER.debug("Ignoring unreadable stored programs: %s", err)
+            return
+        self._programs = programs
+        self._etag = data.get("etag")
+        self._index.set_programs(self._entry_id, programs, dt_util.now())
+
+    async def async_refresh(self, _now: datetime | None = None) -> None:
+        """Fetch programs unless the controller reports them unchanged."""
+        try:
+            fetched = await self._client.async_get_programs(self._etag)
+        except HunterApiError as err:
+            LOGGER.debug("Program refresh for %s failed: %s", self._client.host, err)
+            return
+        if fetched is None:
+            return
+        self._programs, self._etag = fetched
+        self._index.set_programs(self._entry_id, self._programs, dt_util.now())
+        await self._store.async_save(
+            {
+                "etag": self._etag,
+                "programs": [program.as_dict() for program in self._programs],
+            }
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -0,0 +1,147 @@
+"""Server-sent event listener for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .api import HunterStatus
+from .const import (
+    PUSH_READ_TIMEOUT,
+    PUSH_RECONNECT_BASE,
+    PUSH_RECONNECT_MAX,
+    PUSH_REJECTED_LIMIT,
+    PUSH_UNSUPPORTED_RETRY,
+    REQUEST_TIMEOUT,
+)
+from .resilience import backoff_delay
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PushUnsupportedError(Exception):
+    """Raised when the firmware does not offer an event stream."""
+
+
+class HunterPushListener:
+    """
+    Receive status changes pushed by the controller.
+
+    Firmware with push support streams status payloads from ``/api/events``
+    as server-sent events. The stream uses a second, long-lived connection of
+    its own. This does not break the one-request-at-a-time rule HunterClient
+    follows: that rule exists because the controller handles one request at
+    a time, and firmware that offers the stream serves it outside that
+    request handler. Sharing the command connection instead would block every
+    command behind the never-ending stream. While the stream is down the
+    listener reconnects with backoff; callers keep polling until
+    ``on_connected(True)`` is reported. A controller that refuses the second
+    connection PUSH_REJECTED_LIMIT times in a row, without the stream ever
+    opening, is treated like firmware without push: it is polled only and
+    the stream is retried after PUSH_UNSUPPORTED_RETRY seconds.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        on_status: Callable[[HunterStatus], None],
+        on_connected: Callable[[bool], None],
+    ) -> None:
+        """Initialize listener for controller host."""
+        self._host = host
+        self._url = f"http://{host}/api/events"
+        self._on_status = on_status
+        self._on_connected = on_connected
+        self._connected = False
+        self._attempt = 0
+        self._rejected = 0
+
+    @property
+    def host(self) -> str:
+        """Return controller host."""
+        return self._host
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the event stream is open."""
+        return self._connected
+
+    async def async_run(self) -> None:
+        """Listen until cancelled, reconnecting when the stream drops."""
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=REQUEST_TIMEOUT, sock_read=PUSH_READ_TIMEOUT
+        )
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            while True:
+                try:
+                    await self._async_listen(session)
+                except PushUnsupportedError:
+                    LOGGER.debug("%s offers no event stream, polling only", self._url)
+                    await asyncio.sleep(PUSH_UNSUPPORTED_RETRY)
+                    continue
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    LOGGER.debug("Event stream %s failed: %r", self._url, err)
+                    if not self._connected:
+                        self._rejected += 1
+                # Not reported on cancellation, the entry is unloading then.
+                self._set_connected(False)
+                if self._rejected >= PUSH_REJECTED_LIMIT:
+                    LOGGER.info(
+                        "%s refuses a second connection for the event stream, "
+                        "polling only",
+                        self._host,
+                    )
+                    self._rejected = 0
+                    self._attempt = 0
+                    await asyncio.sleep(PUSH_UNSUPPORTED_RETRY)
+                    continue
+                await asyncio.sleep(
+                    backoff_delay(
+                        self._attempt, PUSH_RECONNECT_BASE, PUSH_RECONNECT_MAX
+                    )
+                )
+                self._attempt += 1
+
+    async def _async_listen(self, session: aiohttp.ClientSession) -> None:
+        """Read one event stream until it ends."""
+        headers = {"Accept": "text/event-stream"}
+        async with session.get(self._url, headers=headers) as response:
+            if response.status == HTTPStatus.NOT_FOUND or (
+                response.ok and response.content_type != "text/event-stream"
+            ):
+                raise PushUnsupportedError
+            response.raise_for_status()
+            self._attempt = 0
+            self._rejected = 0
+            self._set_connected(True)
+            data: list[str] = []
+            async for raw in response.content:
+                line = raw.decode("utf-8", "replace").rstrip("\r\n")
+                if line.startswith("data:"):
+                    data.append(line[5:].lstrip())
+                elif not line and data:
+                    self._dispatch("\n".join(data))
+                    data.clear()
+
+    def _dispatch(self, payload: str) -> None:
+        """Parse event payload and hand the status to the callback."""
+        try:
+            status = HunterStatus.from_dict(json.loads(payload))
+        except (ValueError, TypeError, AttributeError):
+            LOGGER.debug("Ignoring invalid event from %s: %r", self._url, payload)
+            return
+        self._on_status(status)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Report stream state changes."""
+        if connected != self._connected:
+            self._connected = connected
+            self._on_connected(connected)
@@ -0,0 +1,167 @@
+"""Retry and circuit breaker helpers for Hunter WiFi."""
+
+from __future__ import annotations
+
+import random
+import time
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def backoff_delay(
+    attempt: int, base: float = RETRY_BACKOFF_BASE, maximum: float = RETRY_BACKOFF_MAX
+) -> float:
+    """Return full-jitter exponential backoff delay for retry attempt."""
+    ceiling = min(maximum, base * 2**attempt)
+    return random.uniform(0, ceiling)  # noqa: S311
+
+
+def jittered(interval: float, jitter: float) -> float:
+    """Return interval randomly stretched or shrunk by up to ``jitter``."""
+    return interval * random.uniform(1 - jitter, 1 + jitter)  # noqa: S311
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a controller is known to be unreachable.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects requests until ``reset_timeout`` seconds have passed. A single
+    trial request is then let through; its outcome closes or reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def state(self) -> CircuitState:
+        """Return current breaker state."""
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Return number of consecutive failures."""
+        return self._failures
+
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback invoked when the state changes."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def allow_request(self) -> bool:
+        """Return True when a request may be sent now."""
+        if self._state is CircuitState.CLOSED:
+            return True
+        if self._state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self._reset_timeout:
+                return False
+            self._set_state(CircuitState.HALF_OPEN)
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close breaker after a successful request."""
+        self._failures = 0
+        self._trial_in_flight = False
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Count failure and open breaker once the threshold is reached."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if (
+            self._state is CircuitState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            self._opened_at = self._clock()
+            self._set_state(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Free the trial slot of a request that ended without an outcome."""
+        self._trial_in_flight = False
+
+    def _set_state(self, state: CircuitState) -> None:
+        """Update state and notify listeners on change."""
+        if state is self._state:
+            return
+        self._state = state
+        for listener in list(self._listeners):
+            listener()
+
+
+class TokenBucket:
+    """
+    Limit how often commands are sent to a controller.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Callers that must
+    not wait may consume while the bucket is empty; the debt then delays the
+    following commands instead. A rate of 0 disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize full bucket."""
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self._burst)
+        self._updated_at = clock()
+
+    def delay(self) -> float:
+        """Return seconds until a token is available."""
+        if self._rate <= 0:
+            return 0.0
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self._rate)
+
+    def consume(self) -> None:
+        """Take one token, going into debt when the bucket is empty."""
+        if self._rate <= 0:
+            return
+        self._refill()
+        self._tokens -= 1
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
@@ -0,0 +1,106 @@
+"""Command outcome publishing for Hunter WiFi."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_CONFIG_ENTRY_ID, EVENT_COMMAND_RESULT
+from .scheduler import CommandStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .scheduler import HunterCommand
+
+
+@dataclass(frozen=True, slots=True)
+class HunterCommandResult:
+    """Outcome of one submitted command."""
+
+    command: HunterCommand
+    finished_at: datetime
+    error: str | None = None
+    status: CommandStatus = CommandStatus.SENT
+
+    @property
+    def success(self) -> bool:
+        """Return True when the controller accepted this or an identical command."""
+        return self.error is None and self.status is not CommandStatus.DROPPED
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return event payload and sensor attributes."""
+        return {
+            "action": self.command.action,
+            "target": self.command.target,
+            "duration": self.command.duration,
+            "status": "failed" if self.error is not None else str(self.status),
+            "success": self.success,
+            "error": self.error,
+            "finished_at": self.finished_at.isoformat(),
+        }
+
+
+class HunterCommandResults:
+    """
+    Publish the outcome of every executed command.
+
+    Each result is fired as a ``hunter_wifi_command_result`` event and kept as
+    the latest result for the last-command sensor, so callers that dispatched
+    without waiting still learn whether the controller accepted the command.
+    Commands the scheduler coalesced or dropped fire the event as well, with
+    their status, but never replace the latest result.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize publisher for entry."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._last: HunterCommandResult | None = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def last(self) -> HunterCommandResult | None:
+        """Return outcome of the most recent command."""
+        return self._last
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked when a new result is published."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def async_handle_command(
+        self, command: HunterCommand, error: BaseException | None
+    ) -> None:
+        """Publish the outcome of a command the scheduler has sent."""
+        self._last = HunterCommandResult(
+            command, dt_util.utcnow(), None if error is None else str(error)
+        )
+        self._hass.bus.async_fire(
+            EVENT_COMMAND_RESULT,
+            {ATTR_CONFIG_ENTRY_ID: self._entry_id, **self._last.as_dict()},
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_handle_skipped(
+        self, command: HunterCommand, status: CommandStatus
+    ) -> None:
+        """Publish a command the scheduler coalesced or dropped."""
+        result = HunterCommandResult(command, dt_util.utcnow(), status=status)
+        self._hass.bus.async_fire(
+            EVENT_COMMAND_RESULT,
+            {ATTR_CONFIG_ENTRY_ID: self._entry_id, **result.as_dict()},
+        )
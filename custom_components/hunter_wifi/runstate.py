@@ -0,0 +1,162 @@
+"""Optimistic local run-state tracking for Hunter WiFi."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .api import HunterStopZonesError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .api import HunterStatus
+    from .scheduler import HunterCommand
+
+
+@dataclass(slots=True)
+class ZoneRun:
+    """Zone run known from a command or a status report."""
+
+    zone: int
+    started_at: datetime
+    ends_at: datetime
+
+    def remaining(self, now: datetime) -> timedelta:
+        """Return time left until the run is expected to end."""
+        return max(self.ends_at - now, timedelta(0))
+
+
+class HunterRunState:
+    """
+    Track which zones run without asking the controller.
+
+    Runs are recorded when a start command is sent and expire with a timer at
+    their expected end. Poll results and stop commands reconcile the model.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize empty run state."""
+        self._hass = hass
+        self._runs: dict[int, ZoneRun] = {}
+        self._expiry: dict[int, CALLBACK_TYPE] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def runs(self) -> dict[int, ZoneRun]:
+        """Return active runs keyed by zone."""
+        return self._runs
+
+    def get(self, zone: int) -> ZoneRun | None:
+        """Return active run for zone."""
+        return self._runs.get(zone)
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked when run state changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    @callback
+    def async_handle_command(
+        self, command: HunterCommand, error: BaseException | None
+    ) -> None:
+        """Update run state from a command the scheduler has sent."""
+        if isinstance(error, HunterStopZonesError):
+            for zone in set(self._runs) - set(error.result.failed):
+                self._stop(zone)
+            self._notify()
+            return
+        if error is not None:
+            return
+        if command.action == "start_zone" and command.target is not None:
+            self._start(command.target, timedelta(minutes=command.duration or 0))
+        elif command.action == "stop_zone" and command.target is not None:
+            self._stop(command.target)
+        elif command.action == "stop_all_zones":
+            for zone in list(self._runs):
+                self._stop(zone)
+        else:
+            return
+        self._notify()
+
+    @callback
+    def async_reconcile(self, status: HunterStatus) -> None:
+        """Align the model with status reported by the controller."""
+        changed = False
+        for zone in list(self._runs):
+            if zone != status.active_zone:
+                self._stop(zone)
+                changed = True
+        if status.active_zone is not None:
+            remaining = timedelta(seconds=status.remaining or 0)
+            run = self._runs.get(status.active_zone)
+            ends_at = dt_util.utcnow() + remaining
+            if run is None or abs(run.ends_at - ends_at) > timedelta(seconds=5):
+                self._start(status.active_zone, remaining)
+                changed = True
+        if changed:
+            self._notify()
+
+    @callback
+    def async_restore(self, zone: int, started_at: datetime, ends_at: datetime) -> None:
+        """Record a run known from elsewhere, e.g. the command journal."""
+        self._start(zone, ends_at - dt_util.utcnow())
+        self._runs[zone].started_at = started_at
+        self._notify()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending expiry timers."""
+        for cancel in self._expiry.values():
+            cancel()
+        self._expiry.clear()
+
+    def _start(self, zone: int, duration: timedelta) -> None:
+        """Record run and schedule its expiry."""
+        self._cancel_expiry(zone)
+        now = dt_util.utcnow()
+        previous = self._runs.get(zone)
+        self._runs[zone] = ZoneRun(
+            zone=zone,
+            started_at=previous.started_at if previous else now,
+            ends_at=now + duration,
+        )
+        self._expiry[zone] = async_call_later(
+            self._hass,
+            duration,
+            HassJob(partial(self._expire, zone), cancel_on_shutdown=True),
+        )
+
+    def _stop(self, zone: int) -> None:
+        """Forget run for zone."""
+        self._cancel_expiry(zone)
+        self._runs.pop(zone, None)
+
+    def _cancel_expiry(self, zone: int) -> None:
+        """Cancel expiry timer for zone."""
+        if (cancel := self._expiry.pop(zone, None)) is not None:
+            cancel()
+
+    @callback
+    def _expire(self, zone: int, _now: datetime) -> None:
+        """Drop run whose expected end has passed."""
+        self._expiry.pop(zone, None)
+        if self._runs.pop(zone, None) is not None:
+            self._notify()
+
+    def _notify(self) -> None:
+        """Notify listeners about a change."""
+        for update_callback in list(self._listeners):
+            update_callback()
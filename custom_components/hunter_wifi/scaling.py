@@ -0,0 +1,140 @@
+"""Evapotranspiration based duration scaling for Hunter WiFi."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DEFAULT_CROP_COEFFICIENT,
+    DEFAULT_PRECIPITATION_RATE,
+    MAX_ZONE_DURATION_MINUTES,
+    MIN_ZONE_DURATION_MINUTES,
+    REFERENCE_ET,
+)
+from .zone_settings import SETTING_CROP_COEFFICIENT, SETTING_PRECIPITATION_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from homeassistant.core import Event, EventStateChangedData
+
+    from .zone_settings import HunterZoneSettings
+
+
+def _et_from_state(state: State | None) -> float | None:
+    """Return daily ET from a sensor state, None when not usable."""
+    if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        value = float(state.state)
+    except ValueError:
+        return None
+    return value if value >= 0 and math.isfinite(value) else None
+
+
+class HunterDurationScaler:
+    """
+    Scale zone run times by evapotranspiration.
+
+    A zone needs ``ET * crop coefficient`` of water per day, which its
+    sprinklers apply at the zone's precipitation rate. The configured duration
+    is the run time on a reference day, with ``REFERENCE_ET`` and the default
+    coefficient and rate, and is scaled by the zone's demand relative to that
+    day. A zone whose scaled run time is under the minimum gets 0 minutes and
+    is skipped. Durations are memoized per zone: an ET update clears the
+    table, a settings change only the affected zone, and a whole cycle is
+    filled in one pass. Without a usable ET value every zone keeps its fixed
+    duration.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        settings: HunterZoneSettings,
+        et_entity_id: str | None,
+    ) -> None:
+        """Initialize scaler reading ET from ``et_entity_id``."""
+        self._hass = hass
+        self._settings = settings
+        self._et_entity_id = et_entity_id
+        self._et: float | None = None
+        self._durations: dict[int, int] = {}
+
+    @property
+    def et(self) -> float | None:
+        """Return the ET value durations are based on."""
+        return self._et
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Track the ET sensor and zone settings; return a remover."""
+        removers = [self._settings.async_add_listener(self._async_zone_changed)]
+        if self._et_entity_id:
+            self._et = _et_from_state(self._hass.states.get(self._et_entity_id))
+            removers.append(
+                async_track_state_change_event(
+                    self._hass, self._et_entity_id, self._async_et_changed
+                )
+            )
+
+        @callback
+        def _remove() -> None:
+            for remove in removers:
+                remove()
+
+        return _remove
+
+    def duration(self, zone: int) -> int:
+        """Return run time of zone in minutes, 0 when it should be skipped."""
+        if (minutes := self._durations.get(zone)) is None:
+            minutes = self.durations((zone,))[0]
+        return minutes
+
+    def durations(self, zones: Iterable[int]) -> list[int]:
+        """Return run times of zones in minutes, computing missing ones at once."""
+        zones = list(zones)
+        if missing := [zone for zone in zones if zone not in self._durations]:
+            self._durations.update(zip(missing, self._compute(missing), strict=True))
+        return [self._durations[zone] for zone in zones]
+
+    def _compute(self, zones: list[int]) -> list[int]:
+        """Compute run times of zones for the current ET value."""
+        if self._et is None:
+            return [self._settings.duration(zone) for zone in zones]
+        get = self._settings.get
+        # Demand is depth per day over rate per hour, ET and rate sharing one
+        # length unit; the configured duration covers the reference demand.
+        reference = REFERENCE_ET * DEFAULT_CROP_COEFFICIENT / DEFAULT_PRECIPITATION_RATE
+        minutes = [
+            self._settings.duration(zone)
+            * self._et
+            * get(zone, SETTING_CROP_COEFFICIENT, DEFAULT_CROP_COEFFICIENT)
+            / get(zone, SETTING_PRECIPITATION_RATE, DEFAULT_PRECIPITATION_RATE)
+            / reference
+            for zone in zones
+        ]
+        # Rounding first keeps float noise from adding a minute.
+        return [
+            0
+            if value < MIN_ZONE_DURATION_MINUTES
+            else min(math.ceil(round(value, 6)), MAX_ZONE_DURATION_MINUTES)
+            for value in minutes
+        ]
+
+    @callback
+    def _async_zone_changed(self, zone: int) -> None:
+        """Invalidate the cached run time of a zone whose settings changed."""
+        self._durations.pop(zone, None)
+
+    @callback
+    def _async_et_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Invalidate all run times when the ET value changes."""
+        et = _et_from_state(event.data["new_state"])
+        if et != self._et:
+            self._et = et
+            self._durations.clear()
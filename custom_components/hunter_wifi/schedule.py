@@ -0,0 +1,114 @@
+"""Next-run index over controller program schedules."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import time
+
+    from .api import HunterProgram
+
+
+def next_start(program: HunterProgram, start_time: time, after: datetime) -> datetime:
+    """
+    Return the first start of program at start_time strictly after ``after``.
+
+    Start times are wall-clock times in the time zone of ``after``.
+    """
+    for offset in itertools.count():
+        day = after.date() + timedelta(days=offset)
+        if not program.runs_on(day.weekday()):
+            continue
+        start = datetime.combine(day, start_time, tzinfo=after.tzinfo)
+        if start > after:
+            return start
+    # itertools.count() never ends and every program runs on some weekday.
+    raise AssertionError
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduledRun:
+    """One cycle of a program."""
+
+    entry_id: str
+    program: HunterProgram
+    start: datetime
+
+    @property
+    def end(self) -> datetime:
+        """Return when the cycle finishes."""
+        return self.start + self.program.duration
+
+
+class HunterScheduleIndex:
+    """
+    Upcoming program starts of all controllers.
+
+    Each controller has a min-heap holding the next start of every program
+    start time. A query pops the starts that have passed and pushes their
+    following occurrence, so finding the next run costs O(log n) amortized
+    and never talks to a controller.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty index."""
+        self._programs: dict[str, dict[int, HunterProgram]] = {}
+        self._heaps: dict[str, list[tuple[datetime, int, int]]] = {}
+
+    def set_programs(
+        self, entry_id: str, programs: Iterable[HunterProgram], now: datetime
+    ) -> None:
+        """Replace the programs of a controller."""
+        by_id = {program.program: program for program in programs}
+        heap = [
+            (next_start(program, start_time, now), program.program, slot)
+            for program in by_id.values()
+            for slot, start_time in enumerate(program.start_times)
+        ]
+        heapq.heapify(heap)
+        self._programs[entry_id] = by_id
+        self._heaps[entry_id] = heap
+
+    def remove(self, entry_id: str) -> None:
+        """Forget a controller."""
+        self._programs.pop(entry_id, None)
+        self._heaps.pop(entry_id, None)
+
+    def next_run(self, entry_id: str | None, now: datetime) -> ScheduledRun | None:
+        """Return the next run after now of one controller, or of all with None."""
+        if entry_id is None:
+            runs = [self.next_run(entry, now) for entry in self._heaps]
+            return min(
+                (run for run in runs if run is not None),
+                key=lambda run: run.start,
+                default=None,
+            )
+        if not (heap := self._heaps.get(entry_id)):
+            return None
+        programs = self._programs[entry_id]
+        while heap[0][0] <= now:
+            _, program_id, slot = heap[0]
+            program = programs[program_id]
+            start = next_start(program, program.start_times[slot], now)
+            heapq.heapreplace(heap, (start, program_id, slot))
+        start, program_id, _ = heap[0]
+        return ScheduledRun(entry_id, programs[program_id], start)
+
+    def runs(self, entry_id: str, start: datetime, end: datetime) -> list[ScheduledRun]:
+        """Return runs of a controller overlapping [start, end), by start time."""
+        runs: list[ScheduledRun] = []
+        for program in self._programs.get(entry_id, {}).values():
+            duration = program.duration
+            for start_time in program.start_times:
+                at = next_start(program, start_time, start - duration)
+                while at < end:
+                    runs.append(ScheduledRun(entry_id, program, at))
+                    at = next_start(program, start_time, at)
+        runs.sort(key=lambda run: (run.start, run.program.program))
+        return runs
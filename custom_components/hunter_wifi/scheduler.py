@@ -0,0 +1,280 @@
+"""Per-controller command scheduler for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from .api import HunterStopZonesError
+from .const import (
+    COMMAND_COALESCE_WINDOW,
+    DEFAULT_RATE_BURST,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_STOP_TIMEOUT,
+    DEFAULT_ZONE_DURATION_MINUTES,
+)
+from .resilience import TokenBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .api import HunterClient, StopZonesResult
+    from .metrics import HunterMetrics
+
+LOGGER = logging.getLogger(__name__)
+
+STOP_ACTIONS = frozenset({"stop_zone", "stop_all_zones"})
+
+
+class CommandStatus(StrEnum):
+    """What became of a submitted command."""
+
+    SENT = "sent"
+    COALESCED = "coalesced"
+    DROPPED = "dropped"
+    # Held back by the hydraulic orchestrator until a running zone stops.
+    QUEUED = "queued"
+
+
+@dataclass(frozen=True, slots=True)
+class HunterCommand:
+    """Single command addressed to a Hunter controller."""
+
+    action: str
+    target: int | None = None
+    duration: int | None = None
+    zones: tuple[int, ...] = ()
+
+    def cancels(self, other: HunterCommand) -> bool:
+        """Return True when this stop command makes a queued start pointless."""
+        if self.action == "stop_all_zones":
+            return other.action in ("start_zone", "start_program")
+        return (
+            self.action == "stop_zone"
+            and other.action == "start_zone"
+            and other.target == self.target
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class HunterCommandOutcome:
+    """Outcome of a submitted command that did not fail."""
+
+    status: CommandStatus
+    result: StopZonesResult | None = None
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    """Command waiting for execution together with its outcome future."""
+
+    command: HunterCommand
+    future: asyncio.Future[HunterCommandOutcome]
+    queued_at: float
+
+
+class HunterCommandScheduler:
+    """
+    Serialize commands sent to one controller.
+
+    Identical commands that are queued, in flight or completed within the
+    coalescing window share a single request. A stop that arrives while the
+    matching start is still queued drops that start before it reaches the
+    controller.
+
+    Commands are paced by a token bucket. Stops skip ahead of queued starts
+    and never wait for a token, so they reach the controller first.
+
+    Commands that are coalesced or dropped never reach the controller; skip
+    listeners learn about them so every submission has a reported outcome.
+    """
+
+    def __init__(
+        self,
+        client: HunterClient,
+        coalesce_window: float = COMMAND_COALESCE_WINDOW,
+        stop_timeout: float = DEFAULT_STOP_TIMEOUT,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        rate_burst: int = DEFAULT_RATE_BURST,
+    ) -> None:
+        """Initialize scheduler for controller client."""
+        self._client = client
+        self._coalesce_window = coalesce_window
+        self._stop_timeout = stop_timeout
+        self._bucket = TokenBucket(rate_limit, rate_burst)
+        self._pending: list[_QueuedCommand] = []
+        self._active: _QueuedCommand | None = None
+        self._completed: dict[HunterCommand, float] = {}
+        self._wakeup = asyncio.Event()
+        self._listeners: list[
+            Callable[[HunterCommand, BaseException | None], None]
+        ] = []
+        self._skip_listeners: list[Callable[[HunterCommand, CommandStatus], None]] = []
+
+    @property
+    def metrics(self) -> HunterMetrics:
+        """Return metrics of the controller host."""
+        return self._client.metrics
+
+    @property
+    def queue_depth(self) -> int:
+        """Return number of commands waiting for execution."""
+        return len(self._pending)
+
+    def add_listener(
+        self, listener: Callable[[HunterCommand, BaseException | None], None]
+    ) -> Callable[[], None]:
+        """Register a callback invoked after each command has been executed."""
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def add_skip_listener(
+        self, listener: Callable[[HunterCommand, CommandStatus], None]
+    ) -> Callable[[], None]:
+        """Register a callback invoked for commands that were not sent."""
+        self._skip_listeners.append(listener)
+        return lambda: self._skip_listeners.remove(listener)
+
+    async def async_submit(self, command: HunterCommand) -> HunterCommandOutcome:
+        """Queue command and wait until it has been sent, coalesced or dropped."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self._completed = {
+            done: finished_at
+            for done, finished_at in self._completed.items()
+            if now - finished_at < self._coalesce_window
+        }
+        if command in self._completed:
+            LOGGER.debug("Coalesced %s with recently completed command", command)
+            self.report_skipped(command, CommandStatus.COALESCED)
+            return HunterCommandOutcome(CommandStatus.COALESCED)
+
+        for queued in (self._active, *self._pending):
+            if queued is not None and queued.command == command:
+                LOGGER.debug("Coalesced %s with queued command", command)
+                outcome = await asyncio.shield(queued.future)
+                if outcome.status is CommandStatus.SENT:
+                    outcome = replace(outcome, status=CommandStatus.COALESCED)
+                self.report_skipped(command, outcome.status)
+                return outcome
+
+        if command.action in STOP_ACTIONS:
+            self._drop_cancelled_starts(command)
+
+        # Any different command invalidates the window, so a start followed by
+        # a stop never coalesces the next stop with the one before the start.
+        self._completed.clear()
+        queued = _QueuedCommand(command, loop.create_future(), now)
+        self._pending.append(queued)
+        self._wakeup.set()
+        return await asyncio.shield(queued.future)
+
+    async def async_run(self) -> None:
+        """Process queued commands one at a time until cancelled."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                while self._pending:
+                    queued = self._next()
+                    is_stop = queued.command.action in STOP_ACTIONS
+                    if not is_stop and (delay := self._bucket.delay()) > 0:
+                        # Wake early when a stop arrives meanwhile.
+                        with contextlib.suppress(TimeoutError):
+                            async with asyncio.timeout(delay):
+                                await self._wakeup.wait()
+                        self._wakeup.clear()
+                        continue
+                    self._pending.remove(queued)
+                    self._bucket.consume()
+                    self.metrics.record_queue_wait(
+                        loop.time() - queued.queued_at, len(self._pending) + 1
+                    )
+                    self._active = queued
+                    command = queued.command
+                    try:
+                        result = await self._async_execute(command)
+                    except Exception as err:  # noqa: BLE001
+                        self._notify(command, err)
+                        if not queued.future.done():
+                            queued.future.set_exception(err)
+                    else:
+                        if result is not None and result.failed:
+                            # Listeners learn which zones still run; a retry
+                            # must not be coalesced with this attempt.
+                            self._notify(command, HunterStopZonesError(result))
+                        else:
+                            self._completed[command] = loop.time()
+                            self._notify(command, None)
+                        if not queued.future.done():
+                            queued.future.set_result(
+                                HunterCommandOutcome(CommandStatus.SENT, result)
+                            )
+                    self._active = None
+        finally:
+            for queued in (self._active, *self._pending):
+                if queued is not None:
+                    queued.future.cancel()
+            self._pending.clear()
+            self._active = None
+
+    def _next(self) -> _QueuedCommand:
+        """Return the oldest queued stop, else the oldest command."""
+        for queued in self._pending:
+            if queued.command.action in STOP_ACTIONS:
+                return queued
+        return self._pending[0]
+
+    def _notify(self, command: HunterCommand, error: BaseException | None) -> None:
+        """Inform listeners about an executed command."""
+        for listener in list(self._listeners):
+            try:
+                listener(command, error)
+            except Exception:
+                LOGGER.exception("Error in command listener for %s", command)
+
+    def report_skipped(self, command: HunterCommand, status: CommandStatus) -> None:
+        """Inform skip listeners about a command that was not sent."""
+        for listener in list(self._skip_listeners):
+            try:
+                listener(command, status)
+            except Exception:
+                LOGGER.exception("Error in skip listener for %s", command)
+
+    def _drop_cancelled_starts(self, stop: HunterCommand) -> None:
+        """Resolve and drop queued starts made obsolete by a stop command."""
+        kept: list[_QueuedCommand] = []
+        for queued in self._pending:
+            if stop.cancels(queued.command):
+                LOGGER.debug("Dropped %s superseded by %s", queued.command, stop)
+                queued.future.set_result(HunterCommandOutcome(CommandStatus.DROPPED))
+                self.report_skipped(queued.command, CommandStatus.DROPPED)
+            else:
+                kept.append(queued)
+        self._pending = kept
+
+    async def _async_execute(self, command: HunterCommand) -> StopZonesResult | None:
+        """Send a single command through the client."""
+        if command.action == "start_zone" and command.target is not None:
+            await self._client.async_start_zone(
+                command.target, command.duration or DEFAULT_ZONE_DURATION_MINUTES
+            )
+            return None
+        if command.action == "stop_zone" and command.target is not None:
+            await self._client.async_stop_zone(command.target)
+            return None
+        if command.action == "start_program" and command.target is not None:
+            await self._client.async_start_program(command.target)
+            return None
+        if command.action == "stop_all_zones":
+            return await self._client.async_stop_zones(
+                command.zones,
+                deadline=self._stop_timeout,
+            )
+        msg = f"Unsupported action requested: {command.action}"
+        raise ValueError(msg)
@@ -0,0 +1,461 @@
+"""Sensor entities for Hunter WiFi."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfTime, UnitOfVolume
+from homeassistant.core import callback
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_time_change,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_ZONES, DATA_SCHEDULE, DOMAIN
+from .entity import HunterDeviceMeta, HunterEntity
+from .resilience import CircuitState
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .api import HunterClient
+    from .coordinator import HunterStatusCoordinator
+    from .health import HunterHealth
+    from .metrics import HunterMetrics
+    from .programs import HunterProgramCache
+    from .resilience import CircuitBreaker
+    from .results import HunterCommandResults
+    from .runstate import HunterRunState
+    from .schedule import HunterScheduleIndex, ScheduledRun
+    from .scheduler import HunterCommandScheduler
+    from .water import HunterWaterMeter
+
+# Only the in-memory latency sensors poll; they never touch the network.
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up controller status sensors."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    meta: HunterDeviceMeta = entry_data["meta"]
+    coordinator: HunterStatusCoordinator = entry_data["coordinator"]
+    run_state: HunterRunState = entry_data["run_state"]
+    client: HunterClient = entry_data["client"]
+    meter: HunterWaterMeter = entry_data["water"]
+
+    @callback
+    def _async_add(zones: list[int], _programs: list[int]) -> None:
+        entities: list[HunterEntity] = [
+            HunterZoneEndSensor(meta, run_state, zone) for zone in zones
+        ]
+        entities.extend(HunterWaterSensor(meta, meter, zone=zone) for zone in zones)
+        entry_data["entities"].extend(entities)
+        async_add_entities(entities)
+
+    entities: list[SensorEntity] = [
+        HunterStatusSensor(meta, coordinator, kind)
+        for kind in ("active_zone", "remaining", "active_program")
+    ]
+    entities.append(
+        HunterNextWateringSensor(meta, entry_data["programs"], hass.data[DATA_SCHEDULE])
+    )
+    entities.append(HunterWaterSensor(meta, meter))
+    entities.append(HunterWaterTodaySensor(meta, meter))
+    entities.append(HunterCircuitBreakerSensor(meta, client.breaker))
+    entities.append(HunterRoundTripSensor(meta, entry_data["health"]))
+    entities.append(HunterLastCommandSensor(meta, entry_data["results"]))
+    entities.extend(
+        HunterLatencySensor(meta, client.metrics, percentile)
+        for percentile in ("p50", "p95", "p99")
+    )
+    entities.append(HunterQueueSensor(meta, entry_data["scheduler"]))
+    async_add_entities(entities)
+    _async_add(entry_data[CONF_ZONES], [])
+    entry_data["entity_adders"].append(_async_add)
+
+
+class HunterStatusSensor(
+    CoordinatorEntity["HunterStatusCoordinator"], HunterEntity, SensorEntity
+):
+    """Exposes one field of the polled controller status."""
+
+    def __init__(
+        self, meta: HunterDeviceMeta, coordinator: HunterStatusCoordinator, kind: str
+    ) -> None:
+        """Initialize status sensor."""
+        CoordinatorEntity.__init__(self, coordinator)
+        if kind == "remaining":
+            name = "Remaining Time"
+            self._attr_device_class = SensorDeviceClass.DURATION
+            self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+            self._attr_icon = "mdi:timer-sand"
+        elif kind == "active_zone":
+            name = "Active Zone"
+            self._attr_icon = "mdi:sprinkler"
+        else:
+            name = "Active Program"
+            self._attr_icon = "mdi:calendar-clock"
+        HunterEntity.__init__(self, meta, kind, name)
+        self._kind = kind
+
+    @property
+    def native_value(self) -> int | None:
+        """Return current status value."""
+        status = self.coordinator.data
+        if status is None:
+            return None
+        if self._kind == "remaining":
+            return status.remaining or 0
+        if self._kind == "active_zone":
+            return status.active_zone
+        return status.active_program
+
+
+class HunterZoneEndSensor(HunterEntity, SensorEntity):
+    """
+    Expected end of a zone run from the local run-state model.
+
+    A timestamp lets the frontend render the remaining time without state
+    updates every second and without any controller traffic.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, run_state: HunterRunState, zone: int
+    ) -> None:
+        """Initialize zone end sensor."""
+        super().__init__(meta, f"zone_{zone}_remaining", f"Zone {zone} Remaining", zone)
+        self._run_state = run_state
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to run-state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._run_state.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return expected end of the current run."""
+        if (run := self._run_state.get(self.zone)) is None:
+            return None
+        return run.ends_at
+
+
+class HunterNextWateringSensor(HunterEntity, SensorEntity):
+    """
+    Next program start of the controller from the cached schedules.
+
+    The value comes from the local next-run index and is refreshed when the
+    programs change and when the announced start passes.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:calendar-clock"
+
+    def __init__(
+        self,
+        meta: HunterDeviceMeta,
+        programs: HunterProgramCache,
+        index: HunterScheduleIndex,
+    ) -> None:
+        """Initialize next watering sensor."""
+        super().__init__(meta, "next_watering", "Next Watering")
+        self._programs = programs
+        self._index = index
+        self._run: ScheduledRun | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to program changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._programs.async_add_listener(self._async_update))
+        self.async_on_remove(self._async_cancel_timer)
+        self._async_update()
+
+    @callback
+    def _async_update(self, _now: datetime | None = None) -> None:
+        """Look up the next run and wake up once it has started."""
+        self._async_cancel_timer()
+        self._run = self._index.next_run(self._meta.entry_id, dt_util.now())
+        if self._run is not None:
+            self._unsub_timer = async_track_point_in_time(
+                self.hass, self._async_update, self._run.start
+            )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        """Cancel the pending rollover."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return start of the next program run."""
+        return None if self._run is None else self._run.start
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return program and zones of the next run."""
+        if (run := self._run) is None:
+            return {}
+        return {
+            "program": run.program.program,
+            "zones": [zone for zone, _ in run.program.zones],
+            "duration": int(run.program.duration.total_seconds() // 60),
+            "ends_at": run.end.isoformat(),
+        }
+
+
+class HunterWaterSensor(HunterEntity, SensorEntity):
+    """Lifetime water usage of a zone or, without a zone, of the controller."""
+
+    _attr_device_class = SensorDeviceClass.WATER
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_suggested_display_precision = 0
+    _attr_icon = "mdi:water"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, meter: HunterWaterMeter, zone: int | None = None
+    ) -> None:
+        """Initialize water usage sensor."""
+        if zone is None:
+            super().__init__(meta, "water_usage", "Water Usage")
+        else:
+            super().__init__(
+                meta, f"zone_{zone}_water_usage", f"Zone {zone} Water Usage", zone
+            )
+        self._meter = meter
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to meter updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._meter.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> float:
+        """Return litres used."""
+        if self.zone is None:
+            return round(self._meter.total, 2)
+        return round(self._meter.zone_total(self.zone), 2)
+
+
+class HunterWaterTodaySensor(HunterEntity, SensorEntity):
+    """Water usage of the controller since local midnight."""
+
+    _attr_device_class = SensorDeviceClass.WATER
+    # Falls back to zero at midnight, which total_increasing treats as a reset.
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_native_unit_of_measurement = UnitOfVolume.LITERS
+    _attr_suggested_display_precision = 0
+    _attr_icon = "mdi:water-outline"
+
+    def __init__(self, meta: HunterDeviceMeta, meter: HunterWaterMeter) -> None:
+        """Initialize daily water usage sensor."""
+        super().__init__(meta, "water_usage_today", "Water Usage Today")
+        self._meter = meter
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to meter updates and the day change."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._meter.async_add_listener(self.async_write_ha_state))
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass, self._async_new_day, hour=0, minute=0, second=0
+            )
+        )
+
+    @callback
+    def _async_new_day(self, _now: datetime) -> None:
+        """Start the new day at zero."""
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float:
+        """Return litres used today."""
+        return round(self._meter.day_total(dt_util.now()), 2)
+
+
+class HunterCircuitBreakerSensor(HunterEntity, SensorEntity):
+    """Diagnostic state of the circuit breaker guarding the controller host."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:electric-switch"
+
+    def __init__(self, meta: HunterDeviceMeta, breaker: CircuitBreaker) -> None:
+        """Initialize circuit breaker sensor."""
+        super().__init__(meta, "connection_state", "Connection State")
+        self._breaker = breaker
+        self._attr_options = [state.value for state in CircuitState]
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to breaker state changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._breaker.add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> str:
+        """Return breaker state."""
+        return self._breaker.state.value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return consecutive failure count."""
+        return {"consecutive_failures": self._breaker.failures}
+
+
+class HunterRoundTripSensor(HunterEntity, SensorEntity):
+    """Round-trip time of the controller's health checks."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:timer-sync-outline"
+
+    def __init__(self, meta: HunterDeviceMeta, health: HunterHealth) -> None:
+        """Initialize round-trip time sensor."""
+        super().__init__(meta, "round_trip_time", "Round-Trip Time")
+        self._health = health
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to health check results."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._health.async_add_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self) -> float | None:
+        """Return round-trip time of the last answered check."""
+        return self._health.rtt if self._health.reachable else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return round-trip time trend over recent checks."""
+        return self._health.rtt_percentiles()
+
+
+class HunterLastCommandSensor(HunterEntity, SensorEntity):
+    """Outcome of the most recent command sent to the controller."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:send-check-outline"
+
+    def __init__(self, meta: HunterDeviceMeta, results: HunterCommandResults) -> None:
+        """Initialize last command sensor."""
+        super().__init__(meta, "last_command", "Last Command")
+        self._results = results
+        self._attr_options = ["success", "failed"]
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to published command results."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._results.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """Return outcome of the last command."""
+        if (last := self._results.last) is None:
+            return None
+        return "success" if last.success else "failed"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return details of the last command."""
+        if (last := self._results.last) is None:
+            return {}
+        return last.as_dict()
+
+
+class HunterLatencySensor(HunterEntity, SensorEntity):
+    """Request latency percentile for the controller host."""
+
+    _attr_should_poll = True
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, metrics: HunterMetrics, percentile: str
+    ) -> None:
+        """Initialize latency sensor."""
+        super().__init__(
+            meta, f"latency_{percentile}", f"Request Latency {percentile.upper()}"
+        )
+        self._metrics = metrics
+        self._percentile = percentile
+
+    @property
+    def native_value(self) -> float | None:
+        """Return latency percentile in milliseconds."""
+        return self._metrics.percentiles()[self._percentile]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latest request outcome."""
+        if (last := self._metrics.last) is None:
+            return {}
+        return {
+            "last_command": last.command,
+            "last_status": last.status,
+            "last_retries": last.retries,
+        }
+
+
+class HunterQueueSensor(HunterEntity, SensorEntity):
+    """Number of commands waiting for the controller."""
+
+    _attr_should_poll = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:tray-full"
+
+    def __init__(
+        self, meta: HunterDeviceMeta, scheduler: HunterCommandScheduler
+    ) -> None:
+        """Initialize queue sensor."""
+        super().__init__(meta, "command_queue", "Command Queue")
+        self._scheduler = scheduler
+        self._metrics = scheduler.metrics
+
+    @property
+    def native_value(self) -> int:
+        """Return current queue depth."""
+        return self._scheduler.queue_depth
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return queue wait percentiles and the deepest queue seen."""
+        return {
+            **{
+                f"wait_{name}_ms": value
+                for name, value in self._metrics.queue_wait_percentiles().items()
+            },
+            "max_depth": self._metrics.max_queue_depth,
+        }
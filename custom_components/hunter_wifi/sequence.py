@@ -0,0 +1,188 @@
+"""Multi-zone sequence runner for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import HunterApiError, HunterStopZonesError
+from .const import DOMAIN, STORAGE_VERSION
+from .scheduler import CommandStatus, HunterCommand
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .orchestrator import HunterHydraulicOrchestrator
+
+LOGGER = logging.getLogger(__name__)
+
+# Starts delayed by less than this keep their precomputed slot.
+_SLOT_SHIFT = timedelta(seconds=30)
+
+
+class HunterSequenceRunner:
+    """
+    Run an ordered list of zones as one scheduled pipeline.
+
+    Slots are laid out from the sequence start, so every zone is started at
+    an absolute time and sleeping never accumulates drift. A start that waits
+    for hydraulic capacity shifts its slot and all later ones, so zones never
+    overlap or lose time. The sequence is persisted and resumed from the clock
+    after a restart.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        orchestrator: HunterHydraulicOrchestrator,
+    ) -> None:
+        """Initialize sequence runner for entry."""
+        self._hass = hass
+        self._entry = entry
+        self._orchestrator = orchestrator
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.sequence"
+        )
+        self._task: asyncio.Task[None] | None = None
+        self._started_at: datetime | None = None
+        self._steps: list[tuple[int, int]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """Return True while a sequence is in progress."""
+        return self._task is not None and not self._task.done()
+
+    async def async_start(self, steps: list[tuple[int, int]]) -> None:
+        """Start new sequence of (zone, minutes) steps, replacing a running one."""
+        self._cancel_task()
+        started_at = dt_util.utcnow()
+        await self._store.async_save(
+            {
+                "started_at": started_at.isoformat(),
+                "steps": [list(step) for step in steps],
+            }
+        )
+        self._spawn(started_at, steps)
+
+    async def async_resume(self) -> None:
+        """Resume a sequence persisted before a restart."""
+        if (data := await self._store.async_load()) is None:
+            return
+        started_at = dt_util.parse_datetime(data["started_at"])
+        steps = [(int(zone), int(minutes)) for zone, minutes in data["steps"]]
+        if started_at is None:
+            await self._store.async_remove()
+            return
+        total = timedelta(minutes=sum(minutes for _, minutes in steps))
+        if started_at + total <= dt_util.utcnow():
+            await self._store.async_remove()
+            return
+        LOGGER.info("Resuming zone sequence started at %s", started_at)
+        self._spawn(started_at, steps)
+
+    @callback
+    def async_handle_reconnect(self) -> None:
+        """
+        Restart the running sequence from the clock after an outage.
+
+        The zone whose slot is current is started again for the time left,
+        covering a start that failed or a controller that rebooted meanwhile.
+        """
+        if self.is_running and self._started_at is not None:
+            LOGGER.info("Controller reachable again, resuming zone sequence")
+            started_at, steps = self._started_at, self._steps
+            self._cancel_task()
+            self._spawn(started_at, steps)
+
+    async def async_cancel(self) -> None:
+        """Cancel running sequence and forget its progress."""
+        self._cancel_task()
+        await self._store.async_remove()
+
+    @callback
+    def async_handle_command(
+        self, command: HunterCommand, error: BaseException | None
+    ) -> None:
+        """Abort the sequence when all zones are stopped."""
+        stopped = error is None or isinstance(error, HunterStopZonesError)
+        if stopped and command.action == "stop_all_zones" and self.is_running:
+            LOGGER.info("Zone sequence cancelled by stop all zones")
+            self._entry.async_create_task(self._hass, self.async_cancel())
+
+    def _spawn(self, started_at: datetime, steps: list[tuple[int, int]]) -> None:
+        """Run sequence as entry background task."""
+        self._started_at = started_at
+        self._steps = steps
+        self._task = self._entry.async_create_background_task(
+            self._hass,
+            self._async_run(started_at, steps),
+            f"{DOMAIN} {self._entry.entry_id} zone sequence",
+        )
+
+    def _cancel_task(self) -> None:
+        """Cancel sequence task if running."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _async_run(
+        self, started_at: datetime, steps: list[tuple[int, int]]
+    ) -> None:
+        """Start each zone once the one before it has had its time."""
+        slot_start = started_at
+        for index, (zone, minutes) in enumerate(steps):
+            slot_end = slot_start + timedelta(minutes=minutes)
+            now = dt_util.utcnow()
+            if slot_end <= now:
+                slot_start = slot_end
+                continue
+            # Resumed steps run only for the time left of their slot.
+            left = math.ceil((slot_end - max(now, slot_start)).total_seconds() / 60)
+            try:
+                outcome = await self._orchestrator.async_submit(
+                    self._entry.entry_id,
+                    HunterCommand("start_zone", zone, left),
+                    wait=True,
+                )
+            except HunterApiError:
+                LOGGER.exception("Failed to start zone %s of sequence", zone)
+            else:
+                started = dt_util.utcnow()
+                if outcome.status is CommandStatus.DROPPED:
+                    LOGGER.info("Zone %s of sequence was stopped before it ran", zone)
+                    slot_end = started
+                elif started - max(now, slot_start) >= _SLOT_SHIFT:
+                    # The start waited for hydraulic capacity, so this zone and
+                    # everything after it move back instead of overlapping.
+                    slot_end = started + timedelta(minutes=left)
+                if slot_end != slot_start + timedelta(minutes=minutes):
+                    await self._async_save_progress(
+                        slot_end - timedelta(minutes=minutes), steps[index:]
+                    )
+            await asyncio.sleep(max(0.0, (slot_end - dt_util.utcnow()).total_seconds()))
+            slot_start = slot_end
+
+        await self._store.async_remove()
+        self._task = None
+
+    async def _async_save_progress(
+        self, started_at: datetime, steps: list[tuple[int, int]]
+    ) -> None:
+        """Persist a shifted schedule so resume and reconnect follow it."""
+        self._started_at = started_at
+        self._steps = steps
+        await self._store.async_save(
+            {
+                "started_at": started_at.isoformat(),
+                "steps": [list(step) for step in steps],
+            }
+        )
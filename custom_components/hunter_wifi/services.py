@@ -0,0 +1,261 @@
+"""Services for Hunter WiFi."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.core import SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_DURATIONS,
+    ATTR_ITEMS,
+    ATTR_ZONE,
+    ATTR_ZONES,
+    CONF_HOST,
+    CONF_ZONES,
+    DATA_ORCHESTRATOR,
+    DOMAIN,
+    MAX_ZONE_DURATION_MINUTES,
+    MIN_ZONE_DURATION_MINUTES,
+    SERVICE_RUN_SEQUENCE,
+    SERVICE_START_ZONES,
+    SERVICE_STOP_ZONES,
+)
+from .scheduler import CommandStatus, HunterCommand
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+    from .coordinator import HunterStatusCoordinator
+    from .orchestrator import HunterHydraulicOrchestrator
+    from .scaling import HunterDurationScaler
+    from .sequence import HunterSequenceRunner
+
+RUN_SEQUENCE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_ZONES): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(int), vol.Range(min=1))]
+        ),
+        vol.Optional(ATTR_DURATIONS): vol.All(
+            cv.ensure_list,
+            [
+                vol.All(
+                    vol.Coerce(int),
+                    vol.Range(
+                        min=MIN_ZONE_DURATION_MINUTES, max=MAX_ZONE_DURATION_MINUTES
+                    ),
+                )
+            ],
+        ),
+    }
+)
+
+START_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+                        vol.Required(ATTR_ZONE): vol.All(
+                            vol.Coerce(int), vol.Range(min=1)
+                        ),
+                        vol.Optional(ATTR_DURATION): vol.All(
+                            vol.Coerce(int),
+                            vol.Range(
+                                min=MIN_ZONE_DURATION_MINUTES,
+                                max=MAX_ZONE_DURATION_MINUTES,
+                            ),
+                        ),
+                    }
+                )
+            ],
+        )
+    }
+)
+STOP_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ITEMS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+                        vol.Optional(ATTR_ZONE): vol.All(
+                            vol.Coerce(int), vol.Range(min=1)
+                        ),
+                    }
+                )
+            ],
+        )
+    }
+)
+
+
+def _entry_data(hass: HomeAssistant, entry_id: str) -> dict[str, Any]:
+    """Return runtime data of a loaded entry or raise a validation error."""
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        msg = f"Hunter WiFi config entry {entry_id} is not loaded"
+        raise ServiceValidationError(msg)
+    return entry_data
+
+
+async def _async_run_sequence(call: ServiceCall) -> None:
+    """Run ordered zones on one controller."""
+    entry_data = _entry_data(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    configured: list[int] = entry_data[CONF_ZONES]
+    scaler: HunterDurationScaler = entry_data["duration_scaler"]
+    zones: list[int] = call.data.get(ATTR_ZONES, configured)
+    if unknown := sorted(set(zones) - set(configured)):
+        msg = f"Zones {unknown} are not configured for this controller"
+        raise ServiceValidationError(msg)
+
+    durations: list[int] | None = call.data.get(ATTR_DURATIONS)
+    if durations is not None and len(durations) != len(zones):
+        msg = "durations must have one value per zone"
+        raise ServiceValidationError(msg)
+    if durations is None:
+        durations = scaler.durations(zones)
+
+    # Zones the ET scaling gives no run time are left out.
+    steps = [step for step in zip(zones, durations, strict=True) if step[1]]
+    runner: HunterSequenceRunner = entry_data["sequence"]
+    await runner.async_start(steps)
+
+
+def _build_commands(
+    hass: HomeAssistant, items: list[dict[str, Any]], *, start: bool
+) -> list[tuple[str, str, HunterCommand]]:
+    """Validate bulk items and return (entry id, host, command) per item."""
+    commands: list[tuple[str, str, HunterCommand]] = []
+    for item in items:
+        entry_id = item[ATTR_CONFIG_ENTRY_ID]
+        entry_data = _entry_data(hass, entry_id)
+        configured: list[int] = entry_data[CONF_ZONES]
+        zone: int | None = item.get(ATTR_ZONE)
+        if zone is not None and zone not in configured:
+            msg = f"Zone {zone} is not configured for controller {entry_id}"
+            raise ServiceValidationError(msg)
+        if zone is None:
+            command = HunterCommand("stop_all_zones", zones=tuple(configured))
+        elif start:
+            scaler: HunterDurationScaler = entry_data["duration_scaler"]
+            duration = item.get(ATTR_DURATION) or scaler.duration(zone)
+            command = HunterCommand("start_zone", zone, duration)
+        else:
+            command = HunterCommand("stop_zone", zone)
+        commands.append((entry_id, entry_data[CONF_HOST], command))
+    return commands
+
+
+async def _async_run_bulk(
+    hass: HomeAssistant, commands: list[tuple[str, str, HunterCommand]]
+) -> ServiceResponse:
+    """
+    Send commands grouped by host.
+
+    Hosts are served in parallel and the commands of one host one after
+    another, in call order, followed by one status refresh per controller.
+    Every item gets its own result whose status is ``started`` or ``stopped``
+    when the command was sent, ``queued`` when the hydraulic cap holds a start
+    back, ``coalesced`` or ``dropped`` when the scheduler merged it with an
+    identical command or a stop superseded it, ``skipped`` for a start the ET
+    scaling gives no run time, and ``failed`` otherwise.
+    """
+    orchestrator: HunterHydraulicOrchestrator = hass.data[DATA_ORCHESTRATOR]
+    coordinators: dict[str, HunterStatusCoordinator] = {
+        entry_id: _entry_data(hass, entry_id)["coordinator"]
+        for entry_id, _, _ in commands
+    }
+    results: list[dict[str, Any]] = [{} for _ in commands]
+    by_host: defaultdict[str, list[int]] = defaultdict(list)
+    for index, (_, host, _) in enumerate(commands):
+        by_host[host].append(index)
+
+    async def _async_run_host(indexes: list[int]) -> None:
+        for index in indexes:
+            entry_id, _, command = commands[index]
+            result: dict[str, Any] = {
+                ATTR_CONFIG_ENTRY_ID: entry_id,
+                ATTR_ZONE: command.target,
+                "action": command.action,
+            }
+            if command.duration is not None:
+                result[ATTR_DURATION] = command.duration
+            result.update(await _async_submit_item(orchestrator, entry_id, command))
+            results[index] = result
+        for entry_id in dict.fromkeys(commands[index][0] for index in indexes):
+            await coordinators[entry_id].async_request_refresh()
+
+    await asyncio.gather(*(_async_run_host(indexes) for indexes in by_host.values()))
+    return {"results": results}
+
+
+async def _async_submit_item(
+    orchestrator: HunterHydraulicOrchestrator, entry_id: str, command: HunterCommand
+) -> dict[str, Any]:
+    """Submit one bulk item and return its status, success and error."""
+    if command.action == "start_zone" and not command.duration:
+        return {"status": "skipped", "success": True, "error": None}
+    try:
+        outcome = await orchestrator.async_submit(entry_id, command)
+    except Exception as err:  # noqa: BLE001
+        # One failing item must not take down the rest of the call.
+        return {"status": "failed", "success": False, "error": str(err)}
+    if outcome.result is not None and outcome.result.failed:
+        return {
+            "status": "failed",
+            "success": False,
+            "error": f"Failed to stop zones: {outcome.result.failed}",
+        }
+    if outcome.status is CommandStatus.SENT:
+        status = "started" if command.action == "start_zone" else "stopped"
+    else:
+        status = str(outcome.status)
+    return {
+        "status": status,
+        "success": outcome.status is not CommandStatus.DROPPED,
+        "error": None,
+    }
+
+
+async def _async_start_zones(call: ServiceCall) -> ServiceResponse:
+    """Start zones across controllers."""
+    commands = _build_commands(call.hass, call.data[ATTR_ITEMS], start=True)
+    return await _async_run_bulk(call.hass, commands)
+
+
+async def _async_stop_zones(call: ServiceCall) -> ServiceResponse:
+    """Stop zones across controllers."""
+    commands = _build_commands(call.hass, call.data[ATTR_ITEMS], start=False)
+    return await _async_run_bulk(call.hass, commands)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+    hass.services.async_register(
+        DOMAIN, SERVICE_RUN_SEQUENCE, _async_run_sequence, schema=RUN_SEQUENCE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_ZONES,
+        _async_start_zones,
+        schema=START_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_ZONES,
+        _async_stop_zones,
+        schema=STOP_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,191 @@
+"""Water usage accounting for Hunter WiFi."""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DEFAULT_FLOW_RATE,
+    DOMAIN,
+    STORAGE_VERSION,
+    WATER_ACCRUAL_INTERVAL,
+    WATER_SAVE_DELAY,
+)
+from .zone_settings import SETTING_FLOW_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from .runstate import HunterRunState
+    from .zone_settings import HunterZoneSettings
+
+
+class HunterWaterMeter:
+    """
+    Running water totals of one controller, in litres.
+
+    Usage is integrated from the run-state model, which commands and status
+    reports keep up to date, at each zone's flow rate. Every change and a
+    one-minute tick while zones run add only the time since the last accrual,
+    so totals never rescan history. Zone totals and daily controller totals
+    live in flat ``array`` buffers: index ``zone - 1`` and days since the
+    first recorded day. Each accrued slice counts towards the local day it
+    ends on.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        run_state: HunterRunState,
+        settings: HunterZoneSettings,
+        zone_count: int,
+    ) -> None:
+        """Initialize meter for entry."""
+        self._hass = hass
+        self._run_state = run_state
+        self._settings = settings
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.water"
+        )
+        self._zones = array("d", [0.0]) * zone_count
+        self._total = 0.0
+        self._first_day: int | None = None
+        self._days = array("d")
+        # Zone -> instant up to which usage has been counted.
+        self._accounted: dict[int, datetime] = {}
+        # Zone -> expected end of a run being counted.
+        self._open: dict[int, datetime] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def total(self) -> float:
+        """Return litres used by all zones."""
+        return self._total
+
+    def zone_total(self, zone: int) -> float:
+        """Return litres used by zone."""
+        return self._zones[zone - 1] if 0 < zone <= len(self._zones) else 0.0
+
+    def day_total(self, day: datetime) -> float:
+        """Return litres used on the local date of day."""
+        if self._first_day is None:
+            return 0.0
+        index = dt_util.as_local(day).date().toordinal() - self._first_day
+        return self._days[index] if 0 <= index < len(self._days) else 0.0
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Register a callback invoked when totals change."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(update_callback)
+
+        return _remove
+
+    async def async_load(self) -> None:
+        """Load stored totals."""
+        if (data := await self._store.async_load()) is None:
+            return
+        stored: list[float] = data["zones"]
+        if len(stored) > len(self._zones):
+            self._zones.extend([0.0] * (len(stored) - len(self._zones)))
+        for index, value in enumerate(stored):
+            self._zones[index] = value
+        self._total = data["total"]
+        self._first_day = data["first_day"]
+        self._days = array("d", data["days"])
+        self._accounted = {
+            int(zone): at
+            for zone, value in data["accounted"].items()
+            if (at := dt_util.parse_datetime(value)) is not None
+        }
+        self._open = {
+            int(zone): at
+            for zone, value in data["open"].items()
+            if (at := dt_util.parse_datetime(value)) is not None
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow run-state changes and tick while zones run; return a remover."""
+        removers = [
+            self._run_state.async_add_listener(self._async_accrue),
+            async_track_time_interval(
+                self._hass, self._async_accrue, WATER_ACCRUAL_INTERVAL
+            ),
+        ]
+
+        @callback
+        def _remove() -> None:
+            for remove in removers:
+                remove()
+            self._async_accrue()
+
+        return _remove
+
+    @callback
+    def _async_accrue(self, _now: datetime | None = None) -> None:
+        """Count usage of every run since its last accrual."""
+        now = dt_util.utcnow()
+        runs = self._run_state.runs
+        changed = False
+        for zone in [zone for zone in self._open if zone not in runs]:
+            changed |= self._add(zone, min(now, self._open.pop(zone)))
+        for zone, run in runs.items():
+            self._open[zone] = run.ends_at
+            since = self._accounted.get(zone)
+            if since is None or since < run.started_at:
+                self._accounted[zone] = run.started_at
+            changed |= self._add(zone, min(now, run.ends_at))
+        if changed:
+            self._store.async_delay_save(self._data_to_save, WATER_SAVE_DELAY)
+            for update_callback in list(self._listeners):
+                update_callback()
+
+    def _add(self, zone: int, until: datetime) -> bool:
+        """Count usage of zone up to until; return True when any was added."""
+        since = self._accounted.get(zone, until)
+        if until <= since:
+            return False
+        self._accounted[zone] = until
+        flow = self._settings.get(zone, SETTING_FLOW_RATE, DEFAULT_FLOW_RATE)
+        litres = (until - since).total_seconds() / 60 * flow
+        if litres <= 0:
+            return False
+        if zone > len(self._zones):
+            self._zones.extend([0.0] * (zone - len(self._zones)))
+        if zone > 0:
+            self._zones[zone - 1] += litres
+        self._total += litres
+        day = dt_util.as_local(until).date().toordinal()
+        if self._first_day is None:
+            self._first_day = day
+        index = day - self._first_day
+        if index >= len(self._days):
+            self._days.extend([0.0] * (index + 1 - len(self._days)))
+        if index >= 0:
+            self._days[index] += litres
+        return True
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return serializable totals."""
+        return {
+            "zones": self._zones.tolist(),
+            "total": self._total,
+            "first_day": self._first_day,
+            "days": self._days.tolist(),
+            "accounted": {
+                str(zone): at.isoformat() for zone, at in self._accounted.items()
+            },
+            "open": {str(zone): at.isoformat() for zone, at in self._open.items()},
+        }
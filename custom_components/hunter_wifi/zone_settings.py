@@ -0,0 +1,83 @@
+"""Persistent per-zone settings for Hunter WiFi."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DEFAULT_ZONE_DURATION_MINUTES,
+    DOMAIN,
+    STORAGE_VERSION,
+    ZONE_SETTINGS_SAVE_DELAY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SETTING_DURATION = "duration"
+SETTING_CROP_COEFFICIENT = "crop_coefficient"
+SETTING_PRECIPITATION_RATE = "precipitation_rate"
+SETTING_FLOW_RATE = "flow_rate"
+
+
+class HunterZoneSettings:
+    """
+    Authoritative per-zone settings table of one controller entry.
+
+    The whole table is read with a single storage load during entry setup,
+    before any entity exists, and changes are written back with a debounced
+    save. Start commands therefore always see the stored durations.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize settings table for entry."""
+        self._store: Store[dict[str, dict[str, float]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.zones"
+        )
+        self._zones: dict[int, dict[str, float]] = {}
+        self._listeners: list[Callable[[int], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the settings table."""
+        data = await self._store.async_load() or {}
+        self._zones = {int(zone): dict(values) for zone, values in data.items()}
+
+    def has(self, zone: int, key: str) -> bool:
+        """Return True when a value is stored for zone."""
+        return key in self._zones.get(zone, {})
+
+    def get(self, zone: int, key: str, default: float) -> float:
+        """Return stored value for zone or default."""
+        return self._zones.get(zone, {}).get(key, default)
+
+    def duration(self, zone: int) -> int:
+        """Return watering duration of zone in minutes."""
+        return int(self.get(zone, SETTING_DURATION, DEFAULT_ZONE_DURATION_MINUTES))
+
+    @callback
+    def async_set(self, zone: int, key: str, value: float) -> None:
+        """Store value for zone and schedule a debounced save."""
+        if self._zones.get(zone, {}).get(key) == value:
+            return
+        self._zones.setdefault(zone, {})[key] = value
+        self._store.async_delay_save(self._data_to_save, ZONE_SETTINGS_SAVE_DELAY)
+        for listener in list(self._listeners):
+            listener(zone)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[int], None]) -> CALLBACK_TYPE:
+        """Register callback invoked with the zone whose settings changed."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    def _data_to_save(self) -> dict[str, dict[str, float]]:
+        """Return serializable table."""
+        return {str(zone): values for zone, values in self._zones.items()}
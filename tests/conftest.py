@@ -0,0 +1,32 @@
+"""Fixtures for Hunter WiFi tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from .mock_controller import ControllerBehaviour, MockHunterController
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+
+@pytest.fixture
+async def controller_factory() -> AsyncIterator[
+    Callable[..., Awaitable[MockHunterController]]
+]:
+    """Return factory starting mock controllers that are closed after the test."""
+    controllers: list[MockHunterController] = []
+
+    async def _factory(**behaviour: float | bool | None) -> MockHunterController:
+        controller = MockHunterController(
+            ControllerBehaviour(**behaviour), seed=len(controllers)
+        )
+        await controller.start()
+        controllers.append(controller)
+        return controller
+
+    yield _factory
+    for controller in controllers:
+        await controller.close()
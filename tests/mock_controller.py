@@ -0,0 +1,247 @@
+"""Mock Hunter WiFi controller emulating the ESP HTTP API."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, field
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+
+@dataclass
+class ControllerBehaviour:
+    """Tunable network and firmware behaviour of the mock controller."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    loss: float = 0.0
+    max_concurrent_requests: int | None = 1
+    stop_all_supported: bool = False
+    stop_all_latency: float = 0.0
+    status_supported: bool = True
+    capabilities_supported: bool = True
+    push_supported: bool = False
+    push_rejected: bool = False
+    zones: int = 8
+    programs: int = 3
+    programs_supported: bool = True
+
+
+@dataclass
+class ControllerStats:
+    """Counters collected by the mock controller."""
+
+    requests: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    connections: set[int] = field(default_factory=set)
+    paths: list[str] = field(default_factory=list)
+
+
+class MockHunterController:
+    """
+    In-process aiohttp server speaking the Hunter WiFi API.
+
+    Supports configurable latency, packet loss (modelled as a dropped
+    connection), the ESP firmware's limit of one request at a time (extra
+    concurrent requests get 503) and reboot windows during which every
+    connection is dropped.
+    """
+
+    def __init__(
+        self, behaviour: ControllerBehaviour | None = None, seed: int = 0
+    ) -> None:
+        """Initialize controller with behaviour."""
+        self.behaviour = behaviour or ControllerBehaviour()
+        self.stats = ControllerStats()
+        self.active_zone: int | None = None
+        self.active_program: int | None = None
+        self.zone_ends_at = 0.0
+        self._random = random.Random(seed)  # noqa: S311
+        self._in_flight = 0
+        self._rebooting_until = 0.0
+        self._hang = False
+        self._changed = asyncio.Event()
+        self.programs: list[dict[str, object]] = [
+            {
+                "id": 1,
+                "start_times": ["06:00"],
+                "days": [0, 2, 4],
+                "zones": [{"zone": 1, "duration": 10}, {"zone": 2, "duration": 5}],
+            }
+        ]
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/api/start/zone/{zone}", self._start_zone)
+        app.router.add_get("/api/stop/zone/{zone}", self._stop_zone)
+        app.router.add_get("/api/stop/all", self._stop_all)
+        app.router.add_get("/api/start/program/{program}", self._start_program)
+        app.router.add_get("/api/status", self._status)
+        app.router.add_get("/api/capabilities", self._capabilities)
+        app.router.add_get("/api/events", self._events)
+        app.router.add_get("/api/programs", self._programs)
+        self._server = TestServer(app)
+
+    @property
+    def host(self) -> str:
+        """Return host:port the controller listens on."""
+        return f"{self._server.host}:{self._server.port}"
+
+    async def start(self) -> None:
+        """Start listening."""
+        await self._server.start_server()
+
+    async def close(self) -> None:
+        """Stop listening."""
+        await self._server.close()
+
+    def reboot(self, duration: float, *, hang: bool = False) -> None:
+        """
+        Refuse all requests for the next ``duration`` seconds.
+
+        With ``hang`` requests are held without an answer until the reboot
+        ends instead of having their connection closed right away.
+        """
+        self._rebooting_until = time.monotonic() + duration
+        self._hang = hang
+
+    @web.middleware
+    async def _middleware(
+        self, request: web.Request, handler: web.Handler
+    ) -> web.StreamResponse:
+        """Apply connection limit, reboot windows, latency and loss."""
+        self.stats.requests += 1
+        self.stats.paths.append(request.path)
+        if request.transport is not None:
+            self.stats.connections.add(id(request.transport))
+        if request.path == "/api/events":
+            # The event stream is long-lived and exempt from the request limit.
+            return await handler(request)
+
+        if (left := self._rebooting_until - time.monotonic()) > 0:
+            if self._hang:
+                await asyncio.sleep(left)
+            self.stats.dropped += 1
+            self._drop(request)
+        limit = self.behaviour.max_concurrent_requests
+        if limit is not None and self._in_flight >= limit:
+            self.stats.rejected += 1
+            raise web.HTTPServiceUnavailable
+
+        self._in_flight += 1
+        try:
+            delay = self.behaviour.latency + self._random.uniform(
+                0, self.behaviour.jitter
+            )
+            if delay:
+                await asyncio.sleep(delay)
+            if self._random.random() < self.behaviour.loss:
+                self.stats.dropped += 1
+                self._drop(request)
+            return await handler(request)
+        finally:
+            self._in_flight -= 1
+
+    def _drop(self, request: web.Request) -> None:
+        """Close the connection without answering."""
+        if request.transport is not None:
+            request.transport.close()
+        raise asyncio.CancelledError
+
+    async def _start_zone(self, request: web.Request) -> web.Response:
+        """Start zone for ``time`` minutes."""
+        self.active_zone = int(request.match_info["zone"])
+        minutes = int(request.query.get("time", "1"))
+        self.zone_ends_at = time.monotonic() + minutes * 60
+        self._notify()
+        return web.Response(text="OK")
+
+    async def _stop_zone(self, request: web.Request) -> web.Response:
+        """Stop zone."""
+        if self.active_zone == int(request.match_info["zone"]):
+            self.active_zone = None
+            self._notify()
+        return web.Response(text="OK")
+
+    async def _stop_all(self, _request: web.Request) -> web.Response:
+        """Stop everything when the firmware supports it."""
+        if not self.behaviour.stop_all_supported:
+            raise web.HTTPNotFound
+        if self.behaviour.stop_all_latency:
+            await asyncio.sleep(self.behaviour.stop_all_latency)
+        self.active_zone = None
+        self.active_program = None
+        self._notify()
+        return web.Response(text="OK")
+
+    async def _start_program(self, request: web.Request) -> web.Response:
+        """Start program."""
+        self.active_program = int(request.match_info["program"])
+        self._notify()
+        return web.Response(text="OK")
+
+    async def _status(self, _request: web.Request) -> web.Response:
+        """Report current run state."""
+        if not self.behaviour.status_supported:
+            raise web.HTTPNotFound
+        return web.json_response(self._status_payload())
+
+    async def _events(self, request: web.Request) -> web.StreamResponse:
+        """Stream run state as server-sent events whenever it changes."""
+        if not self.behaviour.push_supported:
+            raise web.HTTPNotFound
+        if self.behaviour.push_rejected:
+            # Firmware that cannot take a second connection.
+            raise web.HTTPServiceUnavailable
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        while True:
+            self._changed.clear()
+            payload = json.dumps(self._status_payload())
+            await response.write(f"data: {payload}\n\n".encode())
+            await self._changed.wait()
+
+    def _notify(self) -> None:
+        """Wake event streams after a state change."""
+        self._changed.set()
+
+    def _status_payload(self) -> dict[str, int | None]:
+        """Return status endpoint payload."""
+        if self.active_zone is not None and time.monotonic() >= self.zone_ends_at:
+            self.active_zone = None
+        remaining = (
+            max(0, int(self.zone_ends_at - time.monotonic()))
+            if self.active_zone is not None
+            else 0
+        )
+        return {
+            "zone": self.active_zone,
+            "remaining": remaining,
+            "program": self.active_program,
+        }
+
+    async def _capabilities(self, _request: web.Request) -> web.Response:
+        """Report supported zone and program counts."""
+        if not self.behaviour.capabilities_supported:
+            raise web.HTTPNotFound
+        return web.json_response(
+            {"zones": self.behaviour.zones, "programs": self.behaviour.programs}
+        )
+
+    async def _programs(self, request: web.Request) -> web.Response:
+        """Report program schedules, honouring If-None-Match."""
+        if not self.behaviour.programs_supported:
+            raise web.HTTPNotFound
+        body = json.dumps({"programs": self.programs}).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if request.headers.get("If-None-Match") == etag:
+            raise web.HTTPNotModified(headers={"ETag": etag})
+        return web.Response(
+            body=body, content_type="application/json", headers={"ETag": etag}
+        )
@@ -0,0 +1,375 @@
+"""Latency and throughput benchmarks against the mock Hunter controller."""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+
+import aiohttp
+import pytest
+
+from custom_components.hunter_wifi import push
+from custom_components.hunter_wifi.api import HunterApiError, HunterClient
+from custom_components.hunter_wifi.const import PUSH_REJECTED_LIMIT
+from custom_components.hunter_wifi.discovery import async_scan
+from custom_components.hunter_wifi.push import HunterPushListener
+from custom_components.hunter_wifi.resilience import CircuitState
+from custom_components.hunter_wifi.scheduler import (
+    CommandStatus,
+    HunterCommand,
+    HunterCommandScheduler,
+)
+
+pytestmark = pytest.mark.benchmark
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    """Return p50/p95/p99 of samples in milliseconds."""
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": cuts[49] * 1000,
+        "p95": cuts[94] * 1000,
+        "p99": cuts[98] * 1000,
+    }
+
+
+async def test_press_to_ack_latency(controller_factory, record_property):
+    controller = await controller_factory(latency=0.005, jitter=0.005)
+    client = HunterClient(controller.host)
+    samples = []
+    try:
+        for zone in range(1, 101):
+            started = time.perf_counter()
+            await client.async_start_zone(zone % 8 + 1, 5)
+            samples.append(time.perf_counter() - started)
+    finally:
+        await client.async_close()
+
+    record_property("press_to_ack_ms", _percentiles(samples))
+    # All presses reuse a single keep-alive connection.
+    assert len(controller.stats.connections) == 1
+    assert controller.stats.rejected == 0
+
+
+async def test_concurrent_presses_never_exceed_one_request(controller_factory):
+    controller = await controller_factory(latency=0.01)
+    client = HunterClient(controller.host)
+    scheduler = HunterCommandScheduler(client)
+    worker = asyncio.create_task(scheduler.async_run())
+    try:
+        await asyncio.gather(
+            *(
+                scheduler.async_submit(HunterCommand("start_zone", zone, 5))
+                for zone in range(1, 21)
+            )
+        )
+    finally:
+        worker.cancel()
+        await client.async_close()
+
+    assert controller.stats.rejected == 0
+    assert controller.stats.requests == 20
+
+
+async def test_scheduler_coalesces_double_taps(controller_factory):
+    controller = await controller_factory(latency=0.01)
+    client = HunterClient(controller.host)
+    scheduler = HunterCommandScheduler(client)
+    skipped = []
+    scheduler.add_skip_listener(lambda _command, status: skipped.append(status))
+    worker = asyncio.create_task(scheduler.async_run())
+    start = HunterCommand("start_zone", 1, 5)
+    try:
+        outcomes = await asyncio.gather(
+            *(scheduler.async_submit(start) for _ in range(5))
+        )
+        outcomes.append(await scheduler.async_submit(start))
+    finally:
+        worker.cancel()
+        await client.async_close()
+
+    assert controller.stats.requests == 1
+    statuses = [outcome.status for outcome in outcomes]
+    assert statuses == [CommandStatus.SENT] + [CommandStatus.COALESCED] * 5
+    # Every submission that shared the request is reported.
+    assert skipped == [CommandStatus.COALESCED] * 5
+
+
+@pytest.mark.parametrize("stop_all_supported", [False, True])
+async def test_stop_all_completion_time(
+    controller_factory, record_property, stop_all_supported
+):
+    controller = await controller_factory(
+        latency=0.02, stop_all_supported=stop_all_supported
+    )
+    client = HunterClient(controller.host)
+    try:
+        started = time.perf_counter()
+        result = await client.async_stop_zones(range(1, 9), deadline=5)
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.async_close()
+
+    record_property("stop_all_ms", round(elapsed * 1000, 1))
+    assert result.ok
+    assert result.succeeded == list(range(1, 9))
+    assert result.stop_all_used is stop_all_supported
+    expected_requests = 1 if stop_all_supported else 9
+    assert controller.stats.requests == expected_requests
+
+
+async def test_stop_all_leaves_budget_for_fallback(controller_factory):
+    # A hanging stop-all endpoint must not eat the whole deadline.
+    controller = await controller_factory(
+        stop_all_supported=True, stop_all_latency=10, max_concurrent_requests=None
+    )
+    client = HunterClient(controller.host)
+    try:
+        started = time.perf_counter()
+        result = await client.async_stop_zones(range(1, 9), deadline=4)
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.async_close()
+
+    assert result.ok
+    assert not result.stop_all_used
+    assert result.succeeded == list(range(1, 9))
+    assert elapsed < 2
+
+
+async def test_throughput_across_controllers(controller_factory, record_property):
+    controllers = [await controller_factory(latency=0.002) for _ in range(5)]
+    clients = [HunterClient(controller.host) for controller in controllers]
+    requests_per_controller = 50
+
+    async def _drive(client: HunterClient) -> None:
+        for zone in range(requests_per_controller):
+            await client.async_stop_zone(zone % 8 + 1)
+
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(_drive(client) for client in clients))
+        elapsed = time.perf_counter() - started
+    finally:
+        for client in clients:
+            await client.async_close()
+
+    total = requests_per_controller * len(clients)
+    record_property("requests_per_second", round(total / elapsed))
+    assert sum(controller.stats.requests for controller in controllers) == total
+
+
+async def test_breaker_fails_fast_while_controller_reboots(
+    controller_factory, record_property
+):
+    controller = await controller_factory()
+    client = HunterClient(controller.host)
+    controller.reboot(60)
+    try:
+        for _ in range(3):
+            with pytest.raises(HunterApiError):
+                await client.async_stop_zone(1)
+        assert client.breaker.state is CircuitState.OPEN
+
+        requests_before = controller.stats.requests
+        started = time.perf_counter()
+        with pytest.raises(HunterApiError):
+            await client.async_stop_zone(1)
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.async_close()
+
+    record_property("open_breaker_rejection_ms", round(elapsed * 1000, 3))
+    assert controller.stats.requests == requests_before
+    assert elapsed < 0.05
+
+
+async def test_lossy_link_is_retried(controller_factory, record_property):
+    controller = await controller_factory(loss=0.2)
+    client = HunterClient(controller.host)
+    failures = 0
+    try:
+        for zone in range(1, 51):
+            try:
+                await client.async_stop_zone(zone % 8 + 1)
+            except HunterApiError:
+                failures += 1
+    finally:
+        await client.async_close()
+
+    record_property("failed_after_retries", failures)
+    assert controller.stats.dropped > 0
+    assert failures < 5
+
+
+async def test_lost_start_is_not_retried(controller_factory):
+    controller = await controller_factory(loss=1.0)
+    client = HunterClient(controller.host)
+    try:
+        with pytest.raises(HunterApiError):
+            await client.async_start_program(1)
+        with pytest.raises(HunterApiError):
+            await client.async_start_zone(1, 5)
+    finally:
+        await client.async_close()
+
+    commands = client.metrics.as_dict()["commands"]
+    assert commands["start_program"]["retries"] == 0
+    assert commands["start_zone"]["retries"] == 0
+
+
+async def test_subnet_scan_provisioning_time(controller_factory, record_property):
+    controllers = [
+        await controller_factory(latency=0.01, zones=8 + index * 8)
+        for index in range(5)
+    ]
+    # Closed ports stand in for the silent addresses of a /24 scan.
+    silent = [f"127.0.0.1:{port}" for port in range(1, 251)]
+    hosts = [controller.host for controller in controllers] + silent
+    async with aiohttp.ClientSession() as session:
+        started = time.perf_counter()
+        found = await async_scan(session, hosts, probe_timeout=0.5)
+        elapsed = time.perf_counter() - started
+
+    record_property("scan_ms", round(elapsed * 1000))
+    assert {host: found[host].zones for host in found} == {
+        controller.host: controller.behaviour.zones for controller in controllers
+    }
+    assert all(capabilities.reported for capabilities in found.values())
+
+
+async def test_push_latency(controller_factory, record_property):
+    controller = await controller_factory(latency=0.005, push_supported=True)
+    client = HunterClient(controller.host)
+    statuses = asyncio.Queue()
+    connected = asyncio.Event()
+    listener = HunterPushListener(
+        controller.host,
+        statuses.put_nowait,
+        lambda state: connected.set() if state else connected.clear(),
+    )
+    task = asyncio.create_task(listener.async_run())
+    samples = []
+    try:
+        await asyncio.wait_for(connected.wait(), 5)
+        await statuses.get()
+        for zone in range(1, 21):
+            started = time.perf_counter()
+            await client.async_start_zone(zone % 8 + 1, 5)
+            while (
+                await asyncio.wait_for(statuses.get(), 5)
+            ).active_zone != zone % 8 + 1:
+                pass
+            samples.append(time.perf_counter() - started)
+    finally:
+        task.cancel()
+        await client.async_close()
+
+    record_property("command_to_push_ms", _percentiles(samples))
+    # Commands never waited behind the open event stream.
+    assert controller.stats.rejected == 0
+
+
+async def test_push_unsupported_keeps_polling(controller_factory):
+    controller = await controller_factory()
+    reported = []
+    listener = HunterPushListener(controller.host, reported.append, reported.append)
+    task = asyncio.create_task(listener.async_run())
+    try:
+        await asyncio.sleep(0.2)
+    finally:
+        task.cancel()
+
+    assert controller.stats.paths == ["/api/events"]
+    assert not listener.connected
+    assert reported == []
+
+
+async def test_rejected_push_falls_back_to_polling(controller_factory, monkeypatch):
+    monkeypatch.setattr(push, "PUSH_RECONNECT_BASE", 0.01)
+    controller = await controller_factory(push_supported=True, push_rejected=True)
+    client = HunterClient(controller.host)
+    reported = []
+    listener = HunterPushListener(controller.host, reported.append, reported.append)
+    task = asyncio.create_task(listener.async_run())
+    try:
+        await client.async_start_zone(3, 5)
+        statuses = []
+        for _ in range(10):
+            statuses.append(await client.async_get_status())
+            await asyncio.sleep(0.02)
+    finally:
+        task.cancel()
+        await client.async_close()
+
+    # The listener gave up after the rejections while polls kept answering.
+    assert controller.stats.paths.count("/api/events") == PUSH_REJECTED_LIMIT
+    assert not listener.connected
+    assert reported == []
+    assert all(status.active_zone == 3 for status in statuses)
+
+
+async def test_stop_skips_rate_limited_starts(controller_factory, record_property):
+    controller = await controller_factory(latency=0.005)
+    client = HunterClient(controller.host)
+    scheduler = HunterCommandScheduler(client, rate_limit=5, rate_burst=1)
+    skipped = []
+    scheduler.add_skip_listener(
+        lambda command, status: skipped.append((command.target, status))
+    )
+    worker = asyncio.create_task(scheduler.async_run())
+    try:
+        starts = [
+            asyncio.create_task(
+                scheduler.async_submit(HunterCommand("start_zone", zone, 5))
+            )
+            for zone in range(1, 9)
+        ]
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await scheduler.async_submit(HunterCommand("stop_zone", 8))
+        stop_latency = time.perf_counter() - started
+        outcomes = await asyncio.gather(*starts)
+    finally:
+        worker.cancel()
+        await client.async_close()
+
+    wait = client.metrics.queue_wait_percentiles()
+    record_property("stop_under_load_ms", round(stop_latency * 1000, 1))
+    record_property("queue_wait_ms", wait)
+    # The stop overtook the paced starts and dropped the queued start of zone 8.
+    assert stop_latency < 0.1
+    assert "/api/start/zone/8" not in controller.stats.paths
+    assert outcomes[-1].status is CommandStatus.DROPPED
+    assert skipped == [(8, CommandStatus.DROPPED)]
+    assert client.metrics.max_queue_depth >= 7
+
+
+async def test_program_refresh_is_conditional(controller_factory):
+    controller = await controller_factory(latency=0.005)
+    client = HunterClient(controller.host)
+    try:
+        programs, etag = await client.async_get_programs()
+        unchanged = [await client.async_get_programs(etag) for _ in range(20)]
+        controller.programs[0]["start_times"] = ["07:30"]
+        changed = await client.async_get_programs(etag)
+    finally:
+        await client.async_close()
+
+    assert programs[0].program == 1
+    assert [zone for zone, _ in programs[0].zones] == [1, 2]
+    assert etag is not None
+    assert unchanged == [None] * 20
+    assert changed is not None
+    assert changed[1] != etag
+    assert changed[0][0].start_times[0].hour == 7
+
+
+async def test_programs_unsupported(controller_factory):
+    controller = await controller_factory(programs_supported=False)
+    client = HunterClient(controller.host)
+    try:
+        assert await client.async_get_programs() == ([], None)
+    finally:
+        await client.async_close()
@@ -0,0 +1,114 @@
+"""Controller health checks and the unreachable repair issue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.helpers import issue_registry as ir
+
+from custom_components.hunter_wifi import health as health_module
+from custom_components.hunter_wifi.api import HunterClient
+from custom_components.hunter_wifi.const import DOMAIN, ISSUE_CONTROLLER_UNREACHABLE
+from custom_components.hunter_wifi.health import HunterHealth
+
+ISSUE_ID = f"{ISSUE_CONTROLLER_UNREACHABLE}_health"
+
+
+@pytest.fixture
+async def probed(hass, controller_factory):
+    """Return health of a mock controller reached without other traffic."""
+    controller = await controller_factory(latency=0.2)
+    client = HunterClient(controller.host)
+    yield HunterHealth(hass, "health", "Hunter", client), controller, client
+    await client.async_close()
+
+
+def _issue(hass) -> ir.IssueEntry | None:
+    return ir.async_get(hass).async_get_issue(DOMAIN, ISSUE_ID)
+
+
+async def test_issue_raised_after_threshold_and_cleared(hass, probed, monkeypatch):
+    health, controller, _ = probed
+    monkeypatch.setattr(health_module, "HEALTH_ISSUE_AFTER", timedelta(seconds=0.3))
+    controller.reboot(60)
+
+    await health.async_probe()
+    assert health.reachable is False
+    assert health.failures == 1
+    assert _issue(hass) is None
+
+    await asyncio.sleep(0.3)
+    await health.async_probe()
+    assert health.failures == 2
+    assert _issue(hass) is not None
+
+    controller.reboot(0)
+    await health.async_probe()
+    assert health.reachable is True
+    assert health.failures == 0
+    assert health.rtt is not None
+    assert _issue(hass) is None
+
+
+async def test_probe_behind_busy_connection_is_inconclusive(probed, monkeypatch):
+    health, _, client = probed
+    monkeypatch.setattr(health_module, "HEALTH_PROBE_TIMEOUT", 0.1)
+    command = asyncio.create_task(client.async_stop_zone(1))
+    await asyncio.sleep(0)
+
+    await health.async_probe()
+    await command
+
+    assert health.reachable is None
+    assert health.failures == 0
+
+
+async def test_answer_during_probe_counts_as_liveness(hass, probed, monkeypatch):
+    health, controller, client = probed
+    monkeypatch.setattr(health_module, "HEALTH_ISSUE_AFTER", timedelta(0))
+    monkeypatch.setattr(health_module, "HEALTH_PROBE_TIMEOUT", 0.3)
+    command = asyncio.create_task(client.async_stop_zone(1))
+    await asyncio.sleep(0)
+    probe = asyncio.create_task(health.async_probe())
+
+    await command
+    controller.reboot(60, hang=True)
+    await probe
+
+    assert health.reachable is True
+    assert health.failures == 0
+    assert _issue(hass) is None
+
+
+async def test_probe_behind_timed_out_request_keeps_failure_clock(
+    hass, probed, monkeypatch
+):
+    health, controller, client = probed
+    monkeypatch.setattr(health_module, "HEALTH_ISSUE_AFTER", timedelta(seconds=0.3))
+    monkeypatch.setattr(health_module, "HEALTH_PROBE_TIMEOUT", 0.1)
+    controller.reboot(60, hang=True)
+    await health.async_probe()
+    failing_since = health.failing_since
+
+    async def _async_poll() -> None:
+        async with asyncio.timeout(0.2):
+            await client.async_fetch("/api/status", retries=0)
+
+    poll = asyncio.create_task(_async_poll())
+    await asyncio.sleep(0)
+    await health.async_probe()
+    with pytest.raises(TimeoutError):
+        await poll
+
+    assert health.reachable is False
+    assert health.failures == 1
+    assert health.failing_since == failing_since
+
+    await asyncio.sleep(0.3)
+    await health.async_probe()
+    assert _issue(hass) is not None
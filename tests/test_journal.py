@@ -0,0 +1,99 @@
+"""Command journal replay and reconciliation."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hunter_wifi.api import (
+    HunterApiError,
+    HunterClient,
+    HunterStopZonesError,
+    StopZonesResult,
+)
+from custom_components.hunter_wifi.const import DOMAIN
+from custom_components.hunter_wifi.journal import HunterCommandJournal, JournalEntry
+from custom_components.hunter_wifi.orchestrator import HunterHydraulicOrchestrator
+from custom_components.hunter_wifi.runstate import HunterRunState
+from custom_components.hunter_wifi.scheduler import (
+    HunterCommand,
+    HunterCommandScheduler,
+)
+
+STOP_ALL = HunterCommand("stop_all_zones", zones=(1, 2, 3))
+
+
+@pytest.fixture
+async def journaled(hass, controller_factory):
+    """Return a journal wired to a scheduler and its mock controller."""
+    controller = await controller_factory()
+    client = HunterClient(controller.host)
+    scheduler = HunterCommandScheduler(client)
+    run_state = HunterRunState(hass)
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="journal")
+    entry.add_to_hass(hass)
+    orchestrator = HunterHydraulicOrchestrator(hass)
+    unregister = orchestrator.async_register(entry, run_state, scheduler, 0)
+    journal = HunterCommandJournal(hass, entry, orchestrator, run_state)
+    scheduler.add_listener(journal.async_handle_command)
+    worker = asyncio.create_task(scheduler.async_run())
+    yield journal, controller
+    unregister()
+    worker.cancel()
+    run_state.async_shutdown()
+    await client.async_close()
+
+
+async def test_open_runs_follow_starts_and_stops(journaled):
+    journal, _ = journaled
+    journal.async_handle_command(HunterCommand("start_zone", 1, 10), None)
+    journal.async_handle_command(HunterCommand("start_zone", 2, 10), None)
+    journal.async_handle_command(HunterCommand("stop_zone", 1), None)
+    journal.async_handle_command(
+        HunterCommand("start_zone", 3, 10), HunterApiError("timeout")
+    )
+
+    assert list(journal.open_runs()) == [2]
+
+    journal.async_handle_command(STOP_ALL, None)
+    assert journal.open_runs() == {}
+
+
+async def test_partly_failed_stop_all_keeps_failed_runs_open(journaled):
+    journal, _ = journaled
+    for zone in (1, 2, 3):
+        journal.async_handle_command(HunterCommand("start_zone", zone, 10), None)
+    result = StopZonesResult(succeeded=[1, 3], failed={2: "deadline exceeded"})
+    journal.async_handle_command(STOP_ALL, HunterStopZonesError(result))
+
+    runs = journal.open_runs()
+    assert list(runs) == [2]
+    # The failed zone is due at the time of the stop, not at its run's end.
+    assert runs[2][1] <= dt_util.utcnow()
+    assert journal.entries[-1].failed == (2,)
+
+
+async def test_reconcile_reissues_failed_stop(hass, journaled):
+    journal, controller = journaled
+    journal.async_handle_command(HunterCommand("start_zone", 2, 10), None)
+    result = StopZonesResult(failed={2: "deadline exceeded"})
+    journal.async_handle_command(STOP_ALL, HunterStopZonesError(result))
+
+    journal.async_reconcile(restore=False)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert controller.stats.paths == ["/api/stop/zone/2"]
+    assert journal.open_runs() == {}
+
+
+def test_entry_round_trip():
+    entry = JournalEntry(dt_util.utcnow(), STOP_ALL, "Failed to stop zones", (2,))
+
+    assert JournalEntry.from_dict(entry.as_dict()) == entry
+    assert JournalEntry.from_dict({"at": "garbage"}) is None
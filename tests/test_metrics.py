@@ -0,0 +1,31 @@
+"""Tests for request instrumentation."""
+
+from __future__ import annotations
+
+from custom_components.hunter_wifi.metrics import (
+    HunterMetrics,
+    LatencyRing,
+    RequestSample,
+)
+
+
+def test_ring_keeps_only_latest_values():
+    ring = LatencyRing(4)
+    for value in (10.0, 0.001, 0.002, 0.003, 0.004):
+        ring.add(value)
+
+    assert len(ring) == 4
+    assert ring.percentiles() == {"p50": 2.0, "p95": 4.0, "p99": 4.0}
+
+
+def test_metrics_track_hosts_and_commands():
+    metrics = HunterMetrics(size=8)
+    metrics.record(RequestSample("start_zone", 0.0, 0.010, 200, 0, 2, ok=True))
+    metrics.record(RequestSample("stop_zone", 0.0, 0.030, None, 2, 0, ok=False))
+
+    snapshot = metrics.as_dict()
+    assert snapshot["host"]["p99"] == 30.0
+    assert snapshot["commands"]["stop_zone"]["failures"] == 1
+    assert snapshot["commands"]["stop_zone"]["retries"] == 2
+    assert snapshot["commands"]["start_zone"]["bytes"] == 2
+    assert metrics.last.command == "stop_zone"
@@ -0,0 +1,93 @@
+"""Option changes applied without a full entry reload."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hunter_wifi.const import (
+    CONF_DEVICE_NAME,
+    CONF_HOST,
+    CONF_PROGRAM_COUNT,
+    CONF_PROGRAMS,
+    CONF_ZONE_COUNT,
+    CONF_ZONES,
+    DOMAIN,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+@pytest.fixture
+async def entry(hass, controller_factory):
+    """Return a loaded entry with zones 1 and 2 and program 1."""
+    controller = await controller_factory(zones=8)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Hunter",
+        unique_id=controller.host,
+        data={
+            CONF_DEVICE_NAME: "Hunter",
+            CONF_HOST: controller.host,
+            CONF_ZONES: [1, 2],
+            CONF_PROGRAMS: [1],
+            CONF_ZONE_COUNT: 8,
+            CONF_PROGRAM_COUNT: 3,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _zones(hass, entry) -> set[int]:
+    entities = hass.data[DOMAIN][entry.entry_id]["entities"]
+    return {entity.zone for entity in entities if entity.zone is not None}
+
+
+async def test_zone_change_adds_and_removes_only_changed(hass, entry):
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    registry = er.async_get(hass)
+    removed = [
+        entity.entity_id for entity in entry_data["entities"] if entity.zone == 2
+    ]
+    assert removed
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_ZONES: [1, 3], CONF_PROGRAMS: [1]}
+    )
+    await hass.async_block_till_done()
+
+    # Not reloaded: the runtime data is the same object.
+    assert hass.data[DOMAIN][entry.entry_id] is entry_data
+    assert entry_data[CONF_ZONES] == [1, 3]
+    assert _zones(hass, entry) == {1, 3}
+    assert not any(registry.async_get(entity_id) for entity_id in removed)
+
+
+async def test_unsupported_zones_are_not_added(hass, entry):
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_ZONES: [1, 2, 9], CONF_PROGRAMS: [1]}
+    )
+    await hass.async_block_till_done()
+
+    assert _zones(hass, entry) == {1, 2}
+
+
+async def test_other_option_change_reloads(hass, entry):
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={CONF_ZONES: [1, 2], CONF_PROGRAMS: [1], CONF_DEVICE_NAME: "Garden"},
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id] is not entry_data
+    assert hass.data[DOMAIN][entry.entry_id][CONF_DEVICE_NAME] == "Garden"
@@ -0,0 +1,118 @@
+"""Hydraulic cap across controllers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hunter_wifi.api import HunterClient
+from custom_components.hunter_wifi.const import DOMAIN
+from custom_components.hunter_wifi.orchestrator import HunterHydraulicOrchestrator
+from custom_components.hunter_wifi.runstate import HunterRunState
+from custom_components.hunter_wifi.scheduler import (
+    CommandStatus,
+    HunterCommand,
+    HunterCommandScheduler,
+)
+
+
+@pytest.fixture
+async def orchestrated(hass, controller_factory):
+    """Return an orchestrator capped at one zone, its controller and skips."""
+    controller = await controller_factory()
+    client = HunterClient(controller.host)
+    scheduler = HunterCommandScheduler(client)
+    run_state = HunterRunState(hass)
+    scheduler.add_listener(run_state.async_handle_command)
+    skipped = []
+    scheduler.add_skip_listener(
+        lambda command, status: skipped.append((command.target, status))
+    )
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="cap")
+    entry.add_to_hass(hass)
+    orchestrator = HunterHydraulicOrchestrator(hass)
+    unregister = orchestrator.async_register(entry, run_state, scheduler, 1)
+    worker = asyncio.create_task(scheduler.async_run())
+    yield orchestrator, controller, skipped
+    unregister()
+    worker.cancel()
+    run_state.async_shutdown()
+    await client.async_close()
+
+
+def _starts(controller) -> list[str]:
+    return [path for path in controller.stats.paths if "/start/" in path]
+
+
+async def test_start_over_cap_is_queued(orchestrated):
+    orchestrator, controller, _ = orchestrated
+
+    first = await orchestrator.async_submit("cap", HunterCommand("start_zone", 1, 5))
+    second = await orchestrator.async_submit("cap", HunterCommand("start_zone", 2, 5))
+
+    assert first.status is CommandStatus.SENT
+    assert second.status is CommandStatus.QUEUED
+    assert orchestrator.running == 1
+    assert orchestrator.waiting == 1
+    assert _starts(controller) == ["/api/start/zone/1"]
+
+
+async def test_queued_starts_drain_in_arrival_order(hass, orchestrated):
+    orchestrator, controller, _ = orchestrated
+    for zone in (1, 2, 3):
+        await orchestrator.async_submit("cap", HunterCommand("start_zone", zone, 5))
+
+    await orchestrator.async_submit("cap", HunterCommand("stop_zone", 1))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert _starts(controller)[-1] == "/api/start/zone/2"
+    assert orchestrator.waiting == 1
+
+    await orchestrator.async_submit("cap", HunterCommand("stop_zone", 2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert _starts(controller) == [f"/api/start/zone/{zone}" for zone in (1, 2, 3)]
+    assert orchestrator.waiting == 0
+
+
+async def test_waiting_caller_gets_the_real_start(hass, orchestrated):
+    orchestrator, controller, _ = orchestrated
+    await orchestrator.async_submit("cap", HunterCommand("start_zone", 1, 5))
+    waiter = asyncio.create_task(
+        orchestrator.async_submit("cap", HunterCommand("start_zone", 2, 5), wait=True)
+    )
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await orchestrator.async_submit("cap", HunterCommand("stop_zone", 1))
+    outcome = await waiter
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert outcome.status is CommandStatus.SENT
+    assert _starts(controller)[-1] == "/api/start/zone/2"
+
+
+async def test_stop_discards_queued_start(orchestrated):
+    orchestrator, controller, skipped = orchestrated
+    await orchestrator.async_submit("cap", HunterCommand("start_zone", 1, 5))
+    waiter = asyncio.create_task(
+        orchestrator.async_submit("cap", HunterCommand("start_zone", 2, 5), wait=True)
+    )
+    await orchestrator.async_submit("cap", HunterCommand("start_zone", 3, 5))
+    await asyncio.sleep(0)
+
+    await orchestrator.async_submit("cap", HunterCommand("stop_zone", 2))
+
+    assert (await waiter).status is CommandStatus.DROPPED
+    assert (2, CommandStatus.DROPPED) in skipped
+    assert orchestrator.waiting == 1
+
+    await orchestrator.async_submit(
+        "cap", HunterCommand("stop_all_zones", zones=(1, 2, 3))
+    )
+    assert orchestrator.waiting == 0
+    assert (3, CommandStatus.DROPPED) in skipped
+    assert _starts(controller) == ["/api/start/zone/1"]
@@ -0,0 +1,95 @@
+"""Optimistic run state kept from commands and status reports."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hunter_wifi.api import (
+    HunterApiError,
+    HunterStatus,
+    HunterStopZonesError,
+    StopZonesResult,
+)
+from custom_components.hunter_wifi.runstate import HunterRunState
+from custom_components.hunter_wifi.scheduler import HunterCommand
+
+STOP_ALL = HunterCommand("stop_all_zones", zones=(1, 2, 3))
+
+
+@pytest.fixture
+def tracked(hass):
+    """Return run state and the running zones after each notification."""
+    state = HunterRunState(hass)
+    changes: list[set[int]] = []
+    state.async_add_listener(lambda: changes.append(set(state.runs)))
+    yield state, changes
+    state.async_shutdown()
+
+
+async def test_commands_start_and_stop_runs(tracked):
+    run_state, changes = tracked
+    run_state.async_handle_command(HunterCommand("start_zone", 1, 10), None)
+    run_state.async_handle_command(HunterCommand("start_zone", 2, 10), None)
+    run_state.async_handle_command(HunterCommand("stop_zone", 1), None)
+
+    assert list(run_state.runs) == [2]
+    assert run_state.get(2).remaining(dt_util.utcnow()) > timedelta(minutes=9)
+    assert changes == [{1}, {1, 2}, {2}]
+
+    run_state.async_handle_command(STOP_ALL, None)
+    assert run_state.runs == {}
+
+
+async def test_failed_command_changes_nothing(tracked):
+    run_state, changes = tracked
+    run_state.async_handle_command(
+        HunterCommand("start_zone", 1, 10), HunterApiError("timeout")
+    )
+
+    assert run_state.runs == {}
+    assert changes == []
+
+
+async def test_partly_failed_stop_keeps_failed_runs(tracked):
+    run_state, _ = tracked
+    for zone in (1, 2, 3):
+        run_state.async_handle_command(HunterCommand("start_zone", zone, 10), None)
+    result = StopZonesResult(succeeded=[1, 3], failed={2: "deadline exceeded"})
+
+    run_state.async_handle_command(STOP_ALL, HunterStopZonesError(result))
+
+    assert list(run_state.runs) == [2]
+
+
+async def test_run_expires_at_its_end(hass, tracked):
+    run_state, changes = tracked
+    run_state.async_handle_command(HunterCommand("start_zone", 1, 1), None)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2))
+    await hass.async_block_till_done()
+
+    assert run_state.runs == {}
+    assert changes == [{1}, set()]
+
+
+async def test_reconcile_follows_the_controller(tracked):
+    run_state, changes = tracked
+    run_state.async_handle_command(HunterCommand("start_zone", 1, 10), None)
+
+    run_state.async_reconcile(HunterStatus(active_zone=3, remaining=120))
+
+    assert list(run_state.runs) == [3]
+    remaining = run_state.get(3).remaining(dt_util.utcnow())
+    assert timedelta(seconds=115) < remaining <= timedelta(seconds=120)
+
+    notified = len(changes)
+    # A report within a few seconds of the model is not a change.
+    run_state.async_reconcile(HunterStatus(active_zone=3, remaining=119))
+    assert len(changes) == notified
@@ -0,0 +1,87 @@
+"""Evapotranspiration duration scaling."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from custom_components.hunter_wifi.const import (
+    MAX_ZONE_DURATION_MINUTES,
+    REFERENCE_ET,
+)
+from custom_components.hunter_wifi.scaling import HunterDurationScaler
+from custom_components.hunter_wifi.zone_settings import (
+    SETTING_CROP_COEFFICIENT,
+    SETTING_DURATION,
+    SETTING_PRECIPITATION_RATE,
+    HunterZoneSettings,
+)
+
+ET_SENSOR = "sensor.evapotranspiration"
+
+
+@pytest.fixture
+async def settings(hass):
+    """Return zone settings with a 10 minute duration for zones 1 and 2."""
+    settings = HunterZoneSettings(hass, "scaling")
+    await settings.async_load()
+    for zone in (1, 2):
+        settings.async_set(zone, SETTING_DURATION, 10)
+    return settings
+
+
+async def _scaler(hass, settings, et: str | None) -> HunterDurationScaler:
+    if et is not None:
+        hass.states.async_set(ET_SENSOR, et)
+    scaler = HunterDurationScaler(hass, settings, ET_SENSOR)
+    scaler.async_start()
+    return scaler
+
+
+@pytest.mark.parametrize("et", [None, "unavailable", "unknown", "-1", "nan"])
+async def test_missing_et_keeps_fixed_duration(hass, settings, et):
+    scaler = await _scaler(hass, settings, et)
+
+    assert scaler.et is None
+    assert scaler.durations([1, 2, 3]) == [10, 10, 5]
+
+
+async def test_reference_et_keeps_configured_duration(hass, settings):
+    scaler = await _scaler(hass, settings, str(REFERENCE_ET))
+
+    assert scaler.durations([1, 3]) == [10, 5]
+
+
+async def test_duration_scales_with_et_and_zone_settings(hass, settings):
+    settings.async_set(2, SETTING_CROP_COEFFICIENT, 0.5)
+    settings.async_set(2, SETTING_PRECIPITATION_RATE, 12.5)
+    scaler = await _scaler(hass, settings, str(REFERENCE_ET / 2))
+
+    # Half the reference ET halves zone 1; zone 2's coefficient and rate cancel.
+    assert scaler.durations([1, 2]) == [5, 5]
+
+
+@pytest.mark.parametrize("et", ["0", "0.4"])
+async def test_demand_under_minimum_skips_zone(hass, settings, et):
+    scaler = await _scaler(hass, settings, et)
+
+    assert scaler.duration(1) == 0
+
+
+async def test_duration_is_capped(hass, settings):
+    scaler = await _scaler(hass, settings, str(REFERENCE_ET * 100))
+
+    assert scaler.duration(1) == MAX_ZONE_DURATION_MINUTES
+
+
+async def test_changes_invalidate_memoized_durations(hass, settings):
+    scaler = await _scaler(hass, settings, str(REFERENCE_ET))
+    assert scaler.duration(1) == 10
+
+    settings.async_set(1, SETTING_DURATION, 20)
+    assert scaler.duration(1) == 20
+
+    hass.states.async_set(ET_SENSOR, "0")
+    await hass.async_block_till_done()
+    assert scaler.durations([1, 2]) == [0, 0]
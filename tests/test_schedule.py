@@ -0,0 +1,84 @@
+"""Tests for the program next-run index."""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime, timedelta
+from datetime import time as dt_time
+
+from custom_components.hunter_wifi.api import HunterProgram
+from custom_components.hunter_wifi.schedule import HunterScheduleIndex, next_start
+
+# A Monday.
+MONDAY = datetime(2026, 1, 5, 12, 0, tzinfo=UTC)
+
+
+def _program(program, start_times, days=(), zones=((1, 10),)):
+    return HunterProgram(
+        program,
+        tuple(dt_time.fromisoformat(value) for value in start_times),
+        frozenset(days),
+        tuple(zones),
+    )
+
+
+def test_program_round_trip():
+    program = _program(2, ["05:30", "18:00"], days=(1, 3), zones=((4, 7), (5, 3)))
+
+    assert HunterProgram.from_dict(program.as_dict()) == program
+    assert program.duration == timedelta(minutes=10)
+
+
+def test_next_start_skips_days_and_is_strict():
+    program = _program(1, ["06:00"], days=(2,))
+
+    assert next_start(program, program.start_times[0], MONDAY) == datetime(
+        2026, 1, 7, 6, 0, tzinfo=UTC
+    )
+    wednesday = datetime(2026, 1, 7, 6, 0, tzinfo=UTC)
+    assert next_start(program, program.start_times[0], wednesday) == datetime(
+        2026, 1, 14, 6, 0, tzinfo=UTC
+    )
+
+
+def test_next_run_advances_across_programs_and_controllers():
+    index = HunterScheduleIndex()
+    index.set_programs("a", [_program(1, ["06:00", "13:00"])], MONDAY)
+    index.set_programs("b", [_program(3, ["12:30"], days=(0,))], MONDAY)
+
+    assert index.next_run("a", MONDAY).start == MONDAY.replace(hour=13)
+    assert index.next_run(None, MONDAY).entry_id == "b"
+
+    later = MONDAY.replace(hour=14)
+    assert index.next_run("a", later).start == datetime(2026, 1, 6, 6, 0, tzinfo=UTC)
+    assert index.next_run("b", later).start == datetime(2026, 1, 12, 12, 30, tzinfo=UTC)
+
+    index.remove("a")
+    assert index.next_run("a", later) is None
+    assert index.next_run(None, later).entry_id == "b"
+
+
+def test_runs_include_the_running_cycle():
+    index = HunterScheduleIndex()
+    index.set_programs("a", [_program(1, ["11:55"], zones=((1, 10),))], MONDAY)
+
+    runs = index.runs("a", MONDAY, MONDAY + timedelta(days=2))
+
+    assert [run.start.day for run in runs] == [5, 6, 7]
+    assert runs[0].end == MONDAY.replace(hour=12, minute=5)
+
+
+def test_next_run_query_cost(record_property):
+    index = HunterScheduleIndex()
+    programs = [_program(n, [f"{n % 24:02d}:{n % 60:02d}"]) for n in range(1, 1001)]
+    index.set_programs("a", programs, MONDAY)
+
+    now = MONDAY
+    started = time.perf_counter()
+    for _ in range(10_000):
+        now += timedelta(minutes=1)
+        index.next_run("a", now)
+    elapsed = time.perf_counter() - started
+
+    record_property("next_run_us_per_query", round(elapsed / 10_000 * 1e6, 1))
+    assert index.next_run("a", now).start > now
@@ -0,0 +1,125 @@
+"""Bulk start and stop services across controllers."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hunter_wifi.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_DURATION,
+    ATTR_ITEMS,
+    ATTR_ZONE,
+    CONF_DEVICE_NAME,
+    CONF_HOST,
+    CONF_MAX_RUNNING_ZONES,
+    CONF_PROGRAM_COUNT,
+    CONF_PROGRAMS,
+    CONF_ZONE_COUNT,
+    CONF_ZONES,
+    DOMAIN,
+    SERVICE_START_ZONES,
+    SERVICE_STOP_ZONES,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+@pytest.fixture
+async def loaded(hass, controller_factory):
+    """Return two loaded entries, the first capped at one running zone."""
+    entries = []
+    controllers = []
+    for index, cap in enumerate((1, 0)):
+        controller = await controller_factory(zones=8)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Hunter {index}",
+            unique_id=controller.host,
+            data={
+                CONF_DEVICE_NAME: f"Hunter {index}",
+                CONF_HOST: controller.host,
+                CONF_ZONES: [1, 2],
+                CONF_PROGRAMS: [],
+                CONF_ZONE_COUNT: 8,
+                CONF_PROGRAM_COUNT: 3,
+            },
+            options={CONF_MAX_RUNNING_ZONES: cap},
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+        controllers.append(controller)
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    yield entries, controllers
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def _async_call(hass, service: str, items: list[dict]) -> list[dict]:
+    response = await hass.services.async_call(
+        DOMAIN, service, {ATTR_ITEMS: items}, blocking=True, return_response=True
+    )
+    return response["results"]
+
+
+async def test_start_zones_reports_each_item(hass, loaded):
+    (capped, free), (capped_controller, free_controller) = loaded
+
+    results = await _async_call(
+        hass,
+        SERVICE_START_ZONES,
+        [
+            {ATTR_CONFIG_ENTRY_ID: capped.entry_id, ATTR_ZONE: 1, ATTR_DURATION: 5},
+            {ATTR_CONFIG_ENTRY_ID: capped.entry_id, ATTR_ZONE: 2, ATTR_DURATION: 5},
+            {ATTR_CONFIG_ENTRY_ID: free.entry_id, ATTR_ZONE: 2, ATTR_DURATION: 5},
+        ],
+    )
+
+    assert [result["status"] for result in results] == [
+        "started",
+        "queued",
+        "started",
+    ]
+    assert all(result["success"] for result in results)
+    assert [result[ATTR_ZONE] for result in results] == [1, 2, 2]
+    assert "/api/start/zone/1" in capped_controller.stats.paths
+    assert "/api/start/zone/2" not in capped_controller.stats.paths
+    assert "/api/start/zone/2" in free_controller.stats.paths
+
+
+async def test_stop_without_zone_stops_all(hass, loaded):
+    (capped, _), (capped_controller, _) = loaded
+
+    results = await _async_call(
+        hass, SERVICE_STOP_ZONES, [{ATTR_CONFIG_ENTRY_ID: capped.entry_id}]
+    )
+
+    assert results[0]["action"] == "stop_all_zones"
+    assert results[0]["status"] == "stopped"
+    assert "/api/stop/all" in capped_controller.stats.paths
+
+
+async def test_invalid_items_send_nothing(hass, loaded):
+    (capped, _), (capped_controller, _) = loaded
+    sent = len(capped_controller.stats.paths)
+
+    with pytest.raises(ServiceValidationError):
+        await _async_call(
+            hass,
+            SERVICE_START_ZONES,
+            [
+                {ATTR_CONFIG_ENTRY_ID: capped.entry_id, ATTR_ZONE: 1},
+                {ATTR_CONFIG_ENTRY_ID: capped.entry_id, ATTR_ZONE: 7},
+            ],
+        )
+    with pytest.raises(ServiceValidationError):
+        await _async_call(hass, SERVICE_STOP_ZONES, [{ATTR_CONFIG_ENTRY_ID: "missing"}])
+
+    assert not [
+        path for path in capped_controller.stats.paths[sent:] if "/start/" in path
+    ]
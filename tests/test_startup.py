@@ -0,0 +1,125 @@
+"""Config entry setup time as entries and zones grow."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.config_entries import ConfigEntryState
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hunter_wifi.const import (
+    CONF_DEVICE_NAME,
+    CONF_HOST,
+    CONF_PROGRAM_COUNT,
+    CONF_PROGRAMS,
+    CONF_ZONE_COUNT,
+    CONF_ZONES,
+    DOMAIN,
+)
+
+# Far longer than setup itself, so setup time shows whether it waited for it.
+CONTROLLER_LATENCY = 2
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.usefixtures("enable_custom_integrations"),
+]
+
+
+@pytest.mark.parametrize("zone_count", [0, 8, 48])
+@pytest.mark.parametrize("entry_count", [1, 4, 16])
+async def test_setup_entry_time(
+    hass, controller_factory, record_property, entry_count, zone_count
+):
+    entries = []
+    for index in range(entry_count):
+        controller = await controller_factory(latency=CONTROLLER_LATENCY, zones=48)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Hunter {index}",
+            unique_id=controller.host,
+            data={
+                CONF_DEVICE_NAME: f"Hunter {index}",
+                CONF_HOST: controller.host,
+                CONF_ZONES: list(range(1, zone_count + 1)),
+                CONF_PROGRAMS: [1, 2],
+                CONF_ZONE_COUNT: 48,
+                CONF_PROGRAM_COUNT: 3,
+            },
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    # Setting up the integration sets up all of its entries.
+    started = time.perf_counter()
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    elapsed = time.perf_counter() - started
+    await hass.async_block_till_done()
+
+    record_property("setup_ms", round(elapsed * 1000, 1))
+    record_property("setup_ms_per_entry", round(elapsed * 1000 / entry_count, 2))
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+    # Setup does not wait for the controller.
+    assert elapsed < CONTROLLER_LATENCY
+    # Per-zone platforms are not loaded without zones.
+    assert bool(hass.states.async_entity_ids("number")) == bool(zone_count)
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+def _legacy_entry(host: str, zones: list[int]) -> MockConfigEntry:
+    """Return an entry created before capabilities were cached."""
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Hunter",
+        unique_id=host,
+        data={
+            CONF_DEVICE_NAME: "Hunter",
+            CONF_HOST: host,
+            CONF_ZONES: zones,
+            CONF_PROGRAMS: [1],
+        },
+    )
+
+
+async def test_legacy_entry_setup_does_not_wait_for_detection(hass, controller_factory):
+    controller = await controller_factory(latency=CONTROLLER_LATENCY, zones=16)
+    entry = _legacy_entry(controller.host, list(range(1, 13)))
+    entry.add_to_hass(hass)
+
+    started = time.perf_counter()
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < CONTROLLER_LATENCY
+    # Unknown capabilities never cut the selection back to the defaults.
+    assert hass.data[DOMAIN][entry.entry_id][CONF_ZONES] == list(range(1, 13))
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_detected_capabilities_trim_selection(hass, controller_factory):
+    controller = await controller_factory(zones=8)
+    entry = _legacy_entry(controller.host, list(range(1, 13)))
+    entry.add_to_hass(hass)
+
+    detected = asyncio.Event()
+
+    async def _async_updated(_hass, _entry) -> None:
+        detected.set()
+
+    entry.add_update_listener(_async_updated)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    async with asyncio.timeout(5):
+        await detected.wait()
+    await hass.async_block_till_done()
+
+    assert entry.data[CONF_ZONE_COUNT] == 8
+    assert hass.data[DOMAIN][entry.entry_id][CONF_ZONES] == list(range(1, 9))
+    assert await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,83 @@
+"""Water usage accounting from the run state."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.hunter_wifi.const import DEFAULT_FLOW_RATE, DOMAIN
+from custom_components.hunter_wifi.runstate import HunterRunState
+from custom_components.hunter_wifi.scheduler import HunterCommand
+from custom_components.hunter_wifi.water import HunterWaterMeter
+from custom_components.hunter_wifi.zone_settings import (
+    SETTING_FLOW_RATE,
+    HunterZoneSettings,
+)
+
+STORAGE_KEY = f"{DOMAIN}.water.water"
+
+
+@pytest.fixture
+async def metered(hass):
+    """Return a started water meter of four zones and its run state."""
+    run_state = HunterRunState(hass)
+    settings = HunterZoneSettings(hass, "water")
+    await settings.async_load()
+    meter = HunterWaterMeter(hass, "water", run_state, settings, 4)
+    await meter.async_load()
+    remove = meter.async_start()
+    yield meter, run_state, settings
+    remove()
+    run_state.async_shutdown()
+
+
+async def test_finished_run_is_counted_at_flow_rate(metered):
+    meter, run_state, settings = metered
+    settings.async_set(2, SETTING_FLOW_RATE, 6.0)
+    now = dt_util.utcnow()
+
+    run_state.async_restore(2, now - timedelta(minutes=10), now + timedelta(hours=1))
+    run_state.async_handle_command(HunterCommand("stop_zone", 2), None)
+
+    assert meter.zone_total(2) == pytest.approx(60, rel=0.01)
+    assert meter.total == meter.zone_total(2)
+    assert meter.day_total(now) == meter.total
+
+
+async def test_zone_beyond_initial_count_is_counted(metered):
+    meter, run_state, _ = metered
+    now = dt_util.utcnow()
+
+    run_state.async_restore(9, now - timedelta(minutes=1), now + timedelta(hours=1))
+    run_state.async_handle_command(HunterCommand("stop_zone", 9), None)
+
+    assert meter.zone_total(9) == pytest.approx(DEFAULT_FLOW_RATE, rel=0.01)
+    assert meter.zone_total(5) == 0.0
+
+
+async def test_stored_zones_are_kept(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "zones": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "total": 21.0,
+            "first_day": None,
+            "days": [],
+            "accounted": {},
+            "open": {},
+        },
+    }
+    run_state = HunterRunState(hass)
+    settings = HunterZoneSettings(hass, "water")
+    meter = HunterWaterMeter(hass, "water", run_state, settings, 4)
+
+    await meter.async_load()
+
+    assert meter.zone_total(6) == 6.0
+    assert meter.total == 21.0
@@ -0,0 +1,72 @@
+"""Persistent per-zone settings."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hunter_wifi.const import (
+    DEFAULT_ZONE_DURATION_MINUTES,
+    DOMAIN,
+    ZONE_SETTINGS_SAVE_DELAY,
+)
+from custom_components.hunter_wifi.zone_settings import (
+    SETTING_DURATION,
+    SETTING_FLOW_RATE,
+    HunterZoneSettings,
+)
+
+STORAGE_KEY = f"{DOMAIN}.settings.zones"
+
+
+async def test_defaults_without_stored_values(hass):
+    settings = HunterZoneSettings(hass, "settings")
+    await settings.async_load()
+
+    assert settings.duration(1) == DEFAULT_ZONE_DURATION_MINUTES
+    assert settings.get(1, SETTING_FLOW_RATE, 12.5) == 12.5
+    assert not settings.has(1, SETTING_FLOW_RATE)
+
+
+async def test_stored_table_is_loaded(hass, hass_storage):
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"2": {SETTING_DURATION: 25, SETTING_FLOW_RATE: 8.0}},
+    }
+    settings = HunterZoneSettings(hass, "settings")
+    await settings.async_load()
+
+    assert settings.duration(2) == 25
+    assert settings.has(2, SETTING_FLOW_RATE)
+    assert settings.duration(1) == DEFAULT_ZONE_DURATION_MINUTES
+
+
+async def test_changes_notify_and_save_once(hass, hass_storage):
+    settings = HunterZoneSettings(hass, "settings")
+    await settings.async_load()
+    changed: list[int] = []
+    settings.async_add_listener(changed.append)
+
+    settings.async_set(3, SETTING_DURATION, 15)
+    settings.async_set(3, SETTING_DURATION, 15)
+    settings.async_set(4, SETTING_FLOW_RATE, 6.0)
+
+    assert changed == [3, 4]
+    assert STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=ZONE_SETTINGS_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "3": {SETTING_DURATION: 15},
+        "4": {SETTING_FLOW_RATE: 6.0},
+    }